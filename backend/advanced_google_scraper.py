@@ -4,9 +4,7 @@ Enhanced Google web scraping module for comprehensive person information gatheri
 This module provides advanced Google search capabilities without modifying existing Instagram code
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
+import http_client
 import random
 import re
 import json
@@ -14,6 +12,12 @@ from urllib.parse import quote_plus, urljoin, urlparse, parse_qs
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from keyword_matcher import scan_keywords, count_hits, QUALITY_INDICATORS
+from name_query import NameQuery
+from search_context import search_session
+from query_planner import plan_queries, admit_query, release_query
+from early_stop import EarlyStop
+from tracing import traced, bind_context
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +27,8 @@ class AdvancedGoogleScraper:
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Pooled per search, so nested pipelines reuse connections
+        self.session = search_session("advanced_google", {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -43,56 +47,56 @@ class AdvancedGoogleScraper:
         all_results = []
         
         try:
-            print(f"🌐 Starting comprehensive Google search for: {name}")
+            logger.info("Starting comprehensive Google search for: %s", name)
             
             # Category 1: Social Media Profiles
-            print("📱 Searching social media profiles...")
+            logger.info("Searching social media profiles...")
             social_results = self._search_social_media_profiles(name)
             all_results.extend(social_results)
             
             # Category 2: Professional Information
-            print("💼 Searching professional information...")
+            logger.info("Searching professional information...")
             professional_results = self._search_professional_info(name)
             all_results.extend(professional_results)
             
             # Category 3: Academic and Educational
-            print("🎓 Searching academic information...")
+            logger.info("Searching academic information...")
             academic_results = self._search_academic_info(name)
             all_results.extend(academic_results)
             
             # Category 4: News and Media Mentions
-            print("📰 Searching news and media mentions...")
+            logger.info("Searching news and media mentions...")
             news_results = self._search_news_mentions(name)
             all_results.extend(news_results)
             
             # Category 5: Personal Websites and Blogs
-            print("🌐 Searching personal websites...")
+            logger.info("Searching personal websites...")
             personal_results = self._search_personal_websites(name)
             all_results.extend(personal_results)
             
             # Category 6: Forum and Community Posts
-            print("💬 Searching forums and communities...")
+            logger.info("Searching forums and communities...")
             forum_results = self._search_forum_posts(name)
             all_results.extend(forum_results)
             
             # Category 7: Images and Visual Content
-            print("🖼️ Searching image content...")
+            logger.info("Searching image content...")
             image_results = self._search_image_content(name)
             all_results.extend(image_results)
             
             # Category 8: Location-based Information
-            print("📍 Searching location-based info...")
+            logger.info("Searching location-based info...")
             location_results = self._search_location_info(name)
             all_results.extend(location_results)
             
             # Process and rank all results
             final_results = self._process_comprehensive_results(all_results, name, max_results)
             
-            print(f"✅ Comprehensive Google search completed with {len(final_results)} results")
+            logger.info("Comprehensive Google search completed with %s results", len(final_results))
             return final_results
             
         except Exception as e:
-            logger.error(f"Comprehensive Google search error: {e}")
+            logger.error("Comprehensive Google search error: %s", e)
             return []
     
     def _search_social_media_profiles(self, name):
@@ -140,8 +144,8 @@ class AdvancedGoogleScraper:
         # Use concurrent searching for better performance
         with ThreadPoolExecutor(max_workers=3) as executor:
             future_to_query = {
-                executor.submit(self._execute_google_search, query, "social_media"): query 
-                for query in social_queries[:8]  # Limit concurrent searches
+                executor.submit(bind_context(self._execute_google_search), query, "social_media"): query 
+                for query in plan_queries(social_queries[:8], name, "advanced_google", num=8)  # Limit concurrent searches
             }
             
             for future in as_completed(future_to_query):
@@ -149,7 +153,7 @@ class AdvancedGoogleScraper:
                     query_results = future.result()
                     results.extend(query_results)
                 except Exception as e:
-                    logger.error(f"Social media search error: {e}")
+                    logger.error("Social media search error: %s", e)
                     continue
         
         return results
@@ -171,13 +175,15 @@ class AdvancedGoogleScraper:
             f'"{name}" work experience OR employment'
         ]
         
-        for query in professional_queries[:5]:  # Limit for performance
+        early_stop = EarlyStop("advanced_google.professional")
+        for query in early_stop.run(plan_queries(professional_queries[:5], name, "advanced_google", num=8)):  # Limit for performance
             try:
                 query_results = self._execute_google_search(query, "professional")
+                early_stop.add(query_results)
                 results.extend(query_results)
-                time.sleep(self.rate_limit_delay)
+                http_client.pause(self.rate_limit_delay)
             except Exception as e:
-                logger.error(f"Professional search error: {e}")
+                logger.error("Professional search error: %s", e)
                 continue
         
         return results
@@ -199,11 +205,13 @@ class AdvancedGoogleScraper:
             f'"{name}" site:academia.edu'
         ]
         
-        for query in academic_queries[:6]:
+        early_stop = EarlyStop("advanced_google.academic")
+        for query in early_stop.run(plan_queries(academic_queries[:6], name, "advanced_google", num=8)):
             try:
                 query_results = self._execute_google_search(query, "academic")
+                early_stop.add(query_results)
                 results.extend(query_results)
-                time.sleep(self.rate_limit_delay)
+                http_client.pause(self.rate_limit_delay)
             except Exception as e:
                 continue
         
@@ -225,17 +233,22 @@ class AdvancedGoogleScraper:
         ]
         
         # Use Google News search
-        for query in news_queries[:4]:
+        early_stop = EarlyStop("advanced_google.news")
+        for query in early_stop.run(news_queries[:4]):
             try:
                 # Regular news search
-                query_results = self._execute_google_search(query, "news")
-                results.extend(query_results)
+                if admit_query(query, name, "advanced_google", num=8):
+                    query_results = self._execute_google_search(query, "news")
+                    early_stop.add(query_results)
+                    results.extend(query_results)
                 
                 # Google News specific search
-                news_results = self._search_google_news(query, name)
-                results.extend(news_results)
+                if admit_query(query, name, "advanced_google", "news", num=5):
+                    news_results = self._search_google_news(query, name)
+                    early_stop.add(news_results)
+                    results.extend(news_results)
                 
-                time.sleep(self.rate_limit_delay)
+                http_client.pause(self.rate_limit_delay)
             except Exception as e:
                 continue
         
@@ -257,11 +270,13 @@ class AdvancedGoogleScraper:
             f'"{name}" personal site OR page'
         ]
         
-        for query in website_queries[:5]:
+        early_stop = EarlyStop("advanced_google.personal_web")
+        for query in early_stop.run(plan_queries(website_queries[:5], name, "advanced_google", num=8)):
             try:
                 query_results = self._execute_google_search(query, "personal_web")
+                early_stop.add(query_results)
                 results.extend(query_results)
-                time.sleep(self.rate_limit_delay)
+                http_client.pause(self.rate_limit_delay)
             except Exception as e:
                 continue
         
@@ -282,11 +297,13 @@ class AdvancedGoogleScraper:
             f'"{name}" discussion board OR message board'
         ]
         
-        for query in forum_queries[:4]:
+        early_stop = EarlyStop("advanced_google.forum")
+        for query in early_stop.run(plan_queries(forum_queries[:4], name, "advanced_google", num=8)):
             try:
                 query_results = self._execute_google_search(query, "forum")
+                early_stop.add(query_results)
                 results.extend(query_results)
-                time.sleep(self.rate_limit_delay)
+                http_client.pause(self.rate_limit_delay)
             except Exception as e:
                 continue
         
@@ -306,16 +323,16 @@ class AdvancedGoogleScraper:
                 f'"{name}" headshot OR portrait'
             ]
             
-            for query in image_queries[:2]:
+            for query in plan_queries(image_queries[:2], name, "advanced_google", "images"):
                 try:
                     image_results = self._search_google_images(query, name)
                     results.extend(image_results)
-                    time.sleep(self.rate_limit_delay)
+                    http_client.pause(self.rate_limit_delay)
                 except Exception as e:
                     continue
         
         except Exception as e:
-            logger.error(f"Image search error: {e}")
+            logger.error("Image search error: %s", e)
         
         return results
     
@@ -332,11 +349,11 @@ class AdvancedGoogleScraper:
             f'"{name}" local OR area OR region'
         ]
         
-        for query in location_queries[:3]:
+        for query in plan_queries(location_queries[:3], name, "advanced_google", num=8):
             try:
                 query_results = self._execute_google_search(query, "location")
                 results.extend(query_results)
-                time.sleep(self.rate_limit_delay)
+                http_client.pause(self.rate_limit_delay)
             except Exception as e:
                 continue
         
@@ -354,12 +371,12 @@ class AdvancedGoogleScraper:
             
             # Add random delay to avoid rate limiting
             if self.search_count % 5 == 0:
-                time.sleep(random.uniform(3, 6))
+                http_client.pause(random.uniform(3, 6))
             
-            response = self.session.get(search_url, timeout=15)
+            response = http_client.get(search_url, session=self.session, timeout=15)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # Extract search results using multiple selectors
                 result_selectors = ['div.g', 'div.tF2Cxc', 'div.MjjYud']
@@ -381,10 +398,11 @@ class AdvancedGoogleScraper:
             elif response.status_code == 429:
                 # Rate limited - increase delay
                 self.rate_limit_delay += 1
-                time.sleep(10)
+                http_client.pause(10)
         
         except Exception as e:
-            logger.error(f"Google search execution error: {e}")
+            logger.error("Google search execution error: %s", e)
+            release_query(query)
         
         return results
     
@@ -446,7 +464,7 @@ class AdvancedGoogleScraper:
                 }
         
         except Exception as e:
-            logger.error(f"Error parsing search result: {e}")
+            logger.error("Error parsing search result: %s", e)
         
         return None
     
@@ -458,10 +476,10 @@ class AdvancedGoogleScraper:
         
         try:
             news_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=nws&num=5"
-            response = self.session.get(news_url, timeout=15)
+            response = http_client.get(news_url, session=self.session, timeout=15)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # News-specific selectors
                 news_results = soup.select('div.SoAPf, div.dbsr, article')[:3]
@@ -477,7 +495,7 @@ class AdvancedGoogleScraper:
                             snippet = snippet_elem.get_text().strip() if snippet_elem else ""
                             link = link_elem.get('href', '')
                             
-                            if name.lower() in f"{title} {snippet}".lower():
+                            if NameQuery.of(name).contains(f"{title} {snippet}"):
                                 results.append({
                                     "source": "Google News - Media Mention",
                                     "preview": f"News: {snippet[:200]}...",
@@ -494,7 +512,8 @@ class AdvancedGoogleScraper:
                         continue
         
         except Exception as e:
-            logger.error(f"Google News search error: {e}")
+            logger.error("Google News search error: %s", e)
+            release_query(query, "news")
         
         return results
     
@@ -506,10 +525,10 @@ class AdvancedGoogleScraper:
         
         try:
             images_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch&num=10"
-            response = self.session.get(images_url, timeout=15)
+            response = http_client.get(images_url, session=self.session, timeout=15)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # Look for image results
                 image_containers = soup.select('div.isv-r, div.bRMDJf')[:5]
@@ -525,7 +544,7 @@ class AdvancedGoogleScraper:
                             img_src = img_elem.get('src', '')
                             page_link = link_elem.get('href', '')
                             
-                            if name.lower() in img_alt.lower():
+                            if NameQuery.of(name).contains(img_alt):
                                 results.append({
                                     "source": "Google Images - Photo Content",
                                     "preview": f"Image found: {img_alt[:150]}...",
@@ -542,7 +561,8 @@ class AdvancedGoogleScraper:
                         continue
         
         except Exception as e:
-            logger.error(f"Google Images search error: {e}")
+            logger.error("Google Images search error: %s", e)
+            release_query(query, "images")
         
         return results
     
@@ -612,15 +632,8 @@ class AdvancedGoogleScraper:
         score += platform_bonuses.get(platform, 0.05)
         
         # Content quality indicators
-        quality_indicators = [
-            'profile', 'bio', 'about', 'official', 'verified',
-            'professional', 'academic', 'research', 'publication'
-        ]
-        
-        content_text = f"{title} {snippet}".lower()
-        for indicator in quality_indicators:
-            if indicator in content_text:
-                score += 0.05
+        hits = scan_keywords(f"{title} {snippet}".lower())
+        score += 0.05 * count_hits(hits, QUALITY_INDICATORS)
         
         return min(score, 0.95)
     
@@ -667,7 +680,7 @@ class AdvancedGoogleScraper:
             return unique_results[:max_results]
             
         except Exception as e:
-            logger.error(f"Error processing comprehensive results: {e}")
+            logger.error("Error processing comprehensive results: %s", e)
             return all_results[:max_results]
     
     def _is_relevant_result(self, result, name):
@@ -675,19 +688,17 @@ class AdvancedGoogleScraper:
         Check if result is relevant to the person
         """
         try:
-            name_lower = name.lower()
+            query = NameQuery.of(name)
             title = result.get('title', '').lower()
             snippet = result.get('snippet', '').lower()
             
             # Check if name appears in title or snippet
-            if name_lower in title or name_lower in snippet:
+            if query.contains(title, lowered=True) or query.contains(snippet, lowered=True):
                 return True
             
             # Check for name parts (for full names)
-            name_parts = name_lower.split()
-            if len(name_parts) > 1:
-                parts_found = sum(1 for part in name_parts if part in f"{title} {snippet}")
-                if parts_found >= len(name_parts) * 0.6:  # At least 60% of name parts
+            if len(query.tokens) > 1:
+                if query.partial_ratio(f"{title} {snippet}", lowered=True) >= 0.6:  # At least 60% of name parts
                     return True
             
             return False
@@ -695,6 +706,7 @@ class AdvancedGoogleScraper:
         except Exception as e:
             return True  # Default to relevant if we can't determine
 
+@traced
 def enhanced_google_comprehensive_search(name, max_results=50):
     """
     Main function for enhanced comprehensive Google search
@@ -704,5 +716,5 @@ def enhanced_google_comprehensive_search(name, max_results=50):
         results = scraper.comprehensive_google_search(name, max_results)
         return results
     except Exception as e:
-        logger.error(f"Enhanced Google comprehensive search error: {e}")
+        logger.error("Enhanced Google comprehensive search error: %s", e)
         return []
\ No newline at end of file
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the HTML parsers and result extractors
+
+Each case parses one page from fixtures/corpus/ and runs one extractor over
+it. Per case the runner reports median/min time for parse, extract (on an
+already parsed page) and parse+extract (repeated timing, asv style), plus the
+tracemalloc peak and allocated block count of one parse+extract.
+
+Results can be saved as a baseline and later runs compared against it; the
+script exits non-zero when a case is slower or allocates more than the
+threshold allows, so it can gate a deploy. It also exits non-zero when a
+case extracts no results, since the extractor was then not exercised.
+
+Usage (from backend/):
+    python benchmarks/bench_extractors.py [--repeat 20] [--filter google]
+    python benchmarks/bench_extractors.py --save-baseline baseline.json
+    python benchmarks/bench_extractors.py --compare baseline.json [--threshold 0.25]
+    python benchmarks/bench_extractors.py --regenerate-corpus
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCHMARKS_DIR)
+
+CORPUS_DIR = os.path.join(BENCHMARKS_DIR, 'fixtures', 'corpus')
+MANIFEST_PATH = os.path.join(CORPUS_DIR, 'manifest.json')
+
+NAME = "Maria Gonzalez"
+
+# file name -> how the page is produced by stub_server.PageRenderer
+CORPUS_PAGES = {
+    "google_serp.html": ("serp", "google", f'"{NAME}"', 25),
+    "google_serp_instagram.html": ("serp", "google", f'"{NAME}" site:instagram.com', 25),
+    "google_news.html": ("news", "google", f'"{NAME}" news', 10),
+    "bing_serp.html": ("serp", "bing", f'"{NAME}"', 10),
+    "duckduckgo_serp.html": ("serp", "duckduckgo", f'"{NAME}"', 10),
+    "instagram_profile.html": ("profile", "Instagram", "https://www.instagram.com/mariagonzalez/", None),
+    "twitter_profile.html": ("profile", "Twitter", "https://twitter.com/mariagonzalez", None),
+    "linkedin_profile.html": ("profile", "LinkedIn", "https://www.linkedin.com/in/maria-gonzalez", None),
+    "youtube_channel.html": ("profile", "YouTube", "https://www.youtube.com/@mariagonzalez", None),
+    "reddit_user.html": ("profile", "Reddit", "https://www.reddit.com/user/mariagonzalez", None),
+    "pinterest_profile.html": ("profile", "Pinterest", "https://www.pinterest.com/mariagonzalez/", None),
+    "quora_profile.html": ("profile", "Quora", "https://www.quora.com/profile/Maria-Gonzalez", None),
+    "news_article.html": ("article", None, "https://news.example.com/2023/local/maria-gonzalez-profile", None),
+    "blog_post.html": ("article", None, "https://blog.example.org/posts/maria-gonzalez-interview", None),
+}
+
+
+def regenerate_corpus():
+    """
+    Rewrite fixtures/corpus/ from the stub server's page templates
+    """
+    from urllib.parse import urlparse
+    from stub_server import PageRenderer
+
+    renderer = PageRenderer()
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    manifest = {}
+
+    for file_name, (kind, engine_or_platform, target, count) in CORPUS_PAGES.items():
+        if kind in ("serp", "news"):
+            html = renderer.serp(engine_or_platform, target, news=kind == "news", count=count)
+            manifest[file_name] = {"kind": kind, "name": NAME, "query": target}
+        elif kind == "profile":
+            html = renderer.profile(engine_or_platform, NAME, urlparse(target).path)
+            manifest[file_name] = {"kind": kind, "name": NAME, "url": target}
+        else:
+            html = renderer.article(NAME, urlparse(target).path)
+            manifest[file_name] = {"kind": kind, "name": NAME, "url": target}
+
+        with open(os.path.join(CORPUS_DIR, file_name), "w", encoding="utf-8") as page_file:
+            page_file.write(html)
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    print(f"Wrote {len(manifest)} pages to {CORPUS_DIR}")
+
+
+def load_corpus():
+    with open(MANIFEST_PATH, encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    pages = {}
+    for file_name, meta in manifest.items():
+        with open(os.path.join(CORPUS_DIR, file_name), encoding="utf-8") as page_file:
+            pages[file_name] = dict(meta, html=page_file.read())
+    return pages
+
+
+def build_cases():
+    """
+    (case name, corpus file, extract(soup, page)) for every benchmarked extractor
+    """
+    import search
+    import optimized_search
+    from advanced_google_scraper import AdvancedGoogleScraper
+
+    scraper = AdvancedGoogleScraper()
+
+    def parse_each_result(soup, page):
+        return [scraper._parse_search_result(element, "general", page["query"]) for element in soup.select('div.g')]
+
+    cases = [
+        ("optimized.extract_enhanced_google_results", "google_serp.html",
+         lambda soup, page: optimized_search.extract_enhanced_google_results(soup, page["name"], page["query"])),
+        ("optimized.extract_enhanced_google_results[instagram]", "google_serp_instagram.html",
+         lambda soup, page: optimized_search.extract_enhanced_google_results(soup, page["name"], page["query"], priority_platform="Instagram")),
+        ("optimized.extract_google_results", "google_serp.html",
+         lambda soup, page: optimized_search.extract_google_results(soup, page["name"], page["query"])),
+        ("optimized.extract_web_results[bing]", "bing_serp.html",
+         lambda soup, page: optimized_search.extract_web_results(soup, page["name"], "Bing")),
+        ("optimized.extract_web_results[duckduckgo]", "duckduckgo_serp.html",
+         lambda soup, page: optimized_search.extract_web_results(soup, page["name"], "DuckDuckGo")),
+        ("AdvancedGoogleScraper._parse_search_result", "google_serp.html", parse_each_result),
+    ]
+
+    # search.py extractors that take (soup, name, source_url) and do no fetching, each on
+    # the kind of page it is given in search.py (the news, blog, web and specialized
+    # searches fetch Google result pages)
+    page_extractors = [
+        ("extract_instagram_content", "instagram_profile.html"),
+        ("extract_twitter_content", "twitter_profile.html"),
+        ("extract_facebook_content", "news_article.html"),
+        ("extract_linkedin_content", "linkedin_profile.html"),
+        ("extract_youtube_content", "youtube_channel.html"),
+        ("extract_tiktok_content", "instagram_profile.html"),
+        ("extract_news_content", "google_serp.html"),
+        ("extract_blog_content_details", "google_serp.html"),
+        ("extract_reddit_content_details", "reddit_user.html"),
+        ("extract_quora_content_details", "quora_profile.html"),
+        ("extract_forum_content_details", "reddit_user.html"),
+        ("extract_pinterest_content_details", "pinterest_profile.html"),
+        ("extract_image_content_details", "instagram_profile.html"),
+        ("extract_business_content_details", "linkedin_profile.html"),
+        ("extract_general_web_content_details", "google_serp.html"),
+        ("extract_specialized_content_details", "google_serp.html"),
+    ]
+    for function_name, file_name in page_extractors:
+        extractor = getattr(search, function_name)
+        cases.append((
+            f"search.{function_name}", file_name,
+            lambda soup, page, extractor=extractor: extractor(soup, page["name"], page.get("url") or page.get("query", ""))
+        ))
+
+    return cases
+
+
+def time_call(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def measure_allocations(func):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        func()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return peak, blocks
+
+
+def run_case(extract, page, repeat):
+    from http_client import parse_html
+
+    html = page["html"]
+    soup = parse_html(html)
+    extract(soup, page)  # warm caches (NameQuery, compiled patterns)
+
+    parse_samples = time_call(lambda: parse_html(html), repeat)
+    # Extractors treat the soup as read-only, so they can all be timed on the one parse
+    extract_only = time_call(lambda: extract(soup, page), repeat)
+    extract_samples = time_call(lambda: extract(parse_html(html), page), repeat)
+    peak_bytes, blocks = measure_allocations(lambda: extract(parse_html(html), page))
+    result = extract(soup, page)
+
+    return {
+        "page_bytes": len(html.encode("utf-8")),
+        "results": len(result) if isinstance(result, list) else int(bool(result)),
+        "parse_ms": round(statistics.median(parse_samples) * 1000, 3),
+        "extract_ms": round(statistics.median(extract_only) * 1000, 3),
+        "total_ms": round(statistics.median(extract_samples) * 1000, 3),
+        "total_min_ms": round(min(extract_samples) * 1000, 3),
+        "peak_kib": round(peak_bytes / 1024, 1),
+        "alloc_blocks": blocks,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Cases whose time or peak memory grew by more than threshold over the baseline
+    """
+    regressions = []
+    for case_name, current in report.items():
+        previous = baseline.get(case_name)
+        if not previous:
+            continue
+        for metric in ("total_ms", "peak_kib"):
+            if previous[metric] > 0 and current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(f"{case_name}: {metric} {previous[metric]} -> {current[metric]}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--filter', default=None, help='only run cases whose name contains this')
+    parser.add_argument('--save-baseline', default=None)
+    parser.add_argument('--compare', default=None, help='baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed relative slowdown / memory growth')
+    parser.add_argument('--regenerate-corpus', action='store_true')
+    args = parser.parse_args()
+
+    if args.regenerate_corpus:
+        regenerate_corpus()
+        return 0
+
+    pages = load_corpus()
+    report = {}
+    empty = []
+
+    print(f"{'case':<58} {'parse ms':>9} {'extract ms':>11} {'total ms':>9} {'peak KiB':>9} {'blocks':>8} {'results':>8}")
+    for case_name, file_name, extract in build_cases():
+        if args.filter and args.filter not in case_name:
+            continue
+        stats = run_case(extract, pages[file_name], args.repeat)
+        stats["page"] = file_name
+        report[case_name] = stats
+        if not stats["results"]:
+            empty.append(case_name)
+        print(f"{case_name:<58} {stats['parse_ms']:>9.3f} {stats['extract_ms']:>11.3f} {stats['total_ms']:>9.3f} "
+              f"{stats['peak_kib']:>9.1f} {stats['alloc_blocks']:>8} {stats['results']:>8}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"\nSaved baseline to {args.save_baseline}")
+
+    # A case that extracts nothing no longer exercises its extractor; treat it as a failure
+    if empty:
+        print(f"\n{len(empty)} case(s) extracted no results (fixture no longer matches the extractor):")
+        for case_name in empty:
+            print(f"  {case_name}")
+        return 1
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.compare}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
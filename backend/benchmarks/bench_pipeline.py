@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the search pipelines against the local stub upstream
+
+Starts stub_server.StubServer in-process (or uses --upstream), points the
+backend at it through UPSTREAM_BASE_URL, scales the scrapers' rate-limit
+sleeps with PACING_SCALE, and for each pipeline reports:
+
+- sequential end-to-end latency (mean / p50 / p95 / max)
+- throughput with --concurrency searches running at once
+- per-stage timings, taken from the tracing spans of the sequential runs
+
+Pipelines: optimized (optimized_search_identity), basic (search_identity),
+enhanced (search_identity_enhanced_comprehensive).
+
+Usage (from backend/):
+    python benchmarks/bench_pipeline.py [--pipelines optimized,basic,enhanced]
+        [--iterations 3] [--concurrency 4] [--pacing-scale 0]
+        [--latency-ms 80] [--jitter-ms 40] [--error-rate 0.02] [--rate-limit-rate 0.05]
+        [--json report.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCHMARKS_DIR)
+
+from stub_server import StubServer, add_fault_arguments, fault_plan_from_args
+
+NAMES = ["Maria Gonzalez", "David Chen", "Aisha Patel", "Tom O'Brien", "Sofia Rossi"]
+PIPELINES = ("optimized", "basic", "enhanced")
+
+
+def load_pipelines():
+    """
+    Import the backend only after UPSTREAM_BASE_URL / PACING_SCALE are set
+    """
+    from optimized_search import optimized_search_identity
+    from search import search_identity, search_identity_enhanced_comprehensive
+
+    return {
+        "optimized": lambda name: optimized_search_identity(name=name),
+        "basic": lambda name: search_identity(name=name),
+        "enhanced": lambda name: search_identity_enhanced_comprehensive(name=name),
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def latency_summary(seconds):
+    return {
+        "runs": len(seconds),
+        "mean_s": round(statistics.mean(seconds), 3) if seconds else 0.0,
+        "p50_s": round(percentile(seconds, 0.50), 3),
+        "p95_s": round(percentile(seconds, 0.95), 3),
+        "max_s": round(max(seconds), 3) if seconds else 0.0,
+    }
+
+
+def timed_search(search, name):
+    """
+    Run one traced search; returns (seconds, result count, per-span totals)
+    """
+    from tracing import start_trace
+
+    start = time.perf_counter()
+    with start_trace("bench-search", search_name=name) as trace:
+        results = search(name)
+    elapsed = time.perf_counter() - start
+    spans = {span_name: entry["total_ms"] for span_name, entry in trace.timing_summary()["spans"].items()}
+    return elapsed, len(results or []), spans
+
+
+def run_sequential(search, iterations):
+    latencies = []
+    result_counts = []
+    stage_totals = {}
+
+    for index in range(iterations):
+        elapsed, count, spans = timed_search(search, NAMES[index % len(NAMES)])
+        latencies.append(elapsed)
+        result_counts.append(count)
+        for span_name, total_ms in spans.items():
+            stage_totals.setdefault(span_name, []).append(total_ms)
+
+    stages = {
+        span_name: round(sum(totals) / iterations, 1)
+        for span_name, totals in sorted(stage_totals.items(), key=lambda item: sum(item[1]), reverse=True)
+    }
+    return latency_summary(latencies), round(statistics.mean(result_counts), 1), stages
+
+
+def run_concurrent(search, concurrency, searches):
+    names = [NAMES[index % len(NAMES)] for index in range(searches)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(lambda name: timed_search(search, name), names))
+    wall = time.perf_counter() - start
+
+    summary = latency_summary([elapsed for elapsed, _, _ in outcomes])
+    summary["concurrency"] = concurrency
+    summary["wall_s"] = round(wall, 3)
+    summary["searches_per_s"] = round(searches / wall, 3) if wall else 0.0
+    return summary
+
+
+def print_report(report):
+    print(f"Upstream: {report['upstream']}  pacing scale: {report['pacing_scale']}")
+    for pipeline, entry in report["pipelines"].items():
+        sequential = entry["sequential"]
+        concurrent = entry["concurrent"]
+        print(f"\n== {pipeline} ({entry['mean_results']} results/search)")
+        print(f"  sequential   mean {sequential['mean_s']:.3f}s  p50 {sequential['p50_s']:.3f}s  "
+              f"p95 {sequential['p95_s']:.3f}s  max {sequential['max_s']:.3f}s  ({sequential['runs']} runs)")
+        print(f"  concurrent   {concurrent['searches_per_s']:.2f} searches/s at concurrency "
+              f"{concurrent['concurrency']}  p50 {concurrent['p50_s']:.3f}s  p95 {concurrent['p95_s']:.3f}s")
+        print(f"  upstream     {entry['upstream_requests']}")
+        print("  stages (mean ms per search, summed over calls):")
+        for span_name, total_ms in list(entry["stages"].items())[:15]:
+            print(f"    {span_name:<48} {total_ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--pipelines', default=",".join(PIPELINES))
+    parser.add_argument('--iterations', type=int, default=3, help='sequential searches per pipeline')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--concurrent-searches', type=int, default=None,
+                        help='searches in the concurrent phase (default 2 x concurrency)')
+    parser.add_argument('--pacing-scale', type=float, default=0.0, help='multiplier for scraper rate-limit sleeps')
+    parser.add_argument('--upstream', default=None, help='use an already running stub server at this base URL')
+    parser.add_argument('--json', default=None, help='also write the report to this file')
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    if args.upstream:
+        upstream = args.upstream.rstrip("/")
+    else:
+        server = StubServer(faults=fault_plan_from_args(args)).start()
+        upstream = server.base_url
+
+    os.environ["UPSTREAM_BASE_URL"] = upstream
+    os.environ["PACING_SCALE"] = str(args.pacing_scale)
+    pipelines = load_pipelines()
+
+    report = {"upstream": upstream, "pacing_scale": args.pacing_scale, "pipelines": {}}
+    try:
+        for pipeline in [item.strip() for item in args.pipelines.split(",") if item.strip()]:
+            search = pipelines[pipeline]
+            before = server.snapshot() if server else {}
+
+            sequential, mean_results, stages = run_sequential(search, args.iterations)
+            concurrent = run_concurrent(search, args.concurrency, args.concurrent_searches or 2 * args.concurrency)
+
+            after = server.snapshot() if server else {}
+            report["pipelines"][pipeline] = {
+                "sequential": sequential,
+                "concurrent": concurrent,
+                "mean_results": mean_results,
+                "stages": stages,
+                "upstream_requests": {key: after[key] - before.get(key, 0) for key in after},
+            }
+    finally:
+        if server:
+            server.stop()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
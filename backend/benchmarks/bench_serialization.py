@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark serialization time and bytes on the wire for a 150-result response
+
+Compares FastAPI's default path (jsonable_encoder + json.dumps, as done by
+JSONResponse) with dumps_json from serialization.py, with and without ?fields=
+projection, and reports gzip/brotli compressed sizes.
+
+Usage (from backend/):
+    python benchmarks/bench_serialization.py [--results 150] [--repeat 200]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from serialization import dumps_json, project_results, ORJSON_AVAILABLE
+from compression import compress_body, BROTLI_AVAILABLE
+
+try:
+    from fastapi.encoders import jsonable_encoder
+except ImportError:
+    jsonable_encoder = None
+
+SNIPPETS_PATH = os.path.join(BACKEND_DIR, 'benchmarks', 'fixtures', 'snippets.txt')
+
+PLATFORMS = ["Instagram", "Twitter", "Facebook", "LinkedIn", "TikTok", "YouTube", "GitHub", "Web"]
+SEARCH_TYPES = [
+    "social_media_verified", "professional_verified", "academic_verified",
+    "real_mention_verified", "public_content_verified", "web_search_verified"
+]
+PROJECTED_FIELDS = "source,link,score"
+
+
+def build_results(count, seed=7):
+    """
+    Build a ranked result list shaped like optimized_search_identity output
+    """
+    rng = random.Random(seed)
+    with open(SNIPPETS_PATH, encoding='utf-8') as snippets_file:
+        snippets = [line.strip() for line in snippets_file if line.strip()]
+
+    results = []
+    for index in range(count):
+        platform = rng.choice(PLATFORMS)
+        snippet = " ".join(rng.choice(snippets) for _ in range(3))
+        title = rng.choice(snippets)[:80]
+        results.append({
+            "source": f"{platform} - {title[:50]}...",
+            "preview": f"{snippet[:200]}...",
+            "score": round(rng.uniform(0.4, 0.99), 3),
+            "platform": platform,
+            "search_type": rng.choice(SEARCH_TYPES),
+            "link": f"https://www.example.com/{platform.lower()}/profile/{index}",
+            "title": title,
+            "snippet": snippet,
+            "actual_content": " ".join(rng.choice(snippets) for _ in range(8))[:1000],
+            "name_context": [rng.choice(snippets)[:120] for _ in range(2)],
+            "verified_content": rng.random() > 0.5,
+            "verified_working": rng.random() > 0.5,
+            "real_content": True,
+            "profile_verified": rng.random() > 0.7,
+        })
+    return results
+
+
+def default_render(content):
+    """
+    FastAPI default: jsonable_encoder followed by JSONResponse.render
+    """
+    if jsonable_encoder is not None:
+        content = jsonable_encoder(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def fast_render(content):
+    return dumps_json(content)
+
+
+def time_render(render, content, repeat):
+    render(content)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render(content)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--results', type=int, default=150)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    results = build_results(args.results)
+    full_page = {"results": results, "total_results": len(results), "status": "success"}
+    projected_page = {"results": project_results(results, PROJECTED_FIELDS),
+                      "total_results": len(results), "status": "success"}
+
+    cases = [
+        ("default (full)", default_render, full_page),
+        ("fast (full)", fast_render, full_page),
+        ("fast (fields)", fast_render, projected_page),
+    ]
+
+    print(f"{args.results} results, {args.repeat} repeats")
+    print(f"orjson: {'yes' if ORJSON_AVAILABLE else 'no (json fallback)'}, "
+          f"jsonable_encoder: {'yes' if jsonable_encoder else 'no (fastapi not installed)'}, "
+          f"brotli: {'yes' if BROTLI_AVAILABLE else 'no'}")
+    print(f"{'case':<18}{'render (ms)':>12}{'raw (KB)':>11}{'gzip (KB)':>11}{'br (KB)':>10}")
+
+    baseline_ms = None
+    for label, render, content in cases:
+        seconds = time_render(render, content, args.repeat)
+        body = render(content)
+        gzip_size = len(gzip.compress(body, compresslevel=6))
+        br_size = len(compress_body(body, 'br')) if BROTLI_AVAILABLE else None
+
+        milliseconds = seconds * 1000
+        if baseline_ms is None:
+            baseline_ms = milliseconds
+        br_column = f"{br_size / 1024:>10.1f}" if br_size is not None else f"{'-':>10}"
+        print(f"{label:<18}{milliseconds:>12.3f}{len(body) / 1024:>11.1f}{gzip_size / 1024:>11.1f}{br_column}"
+              f"   ({baseline_ms / milliseconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
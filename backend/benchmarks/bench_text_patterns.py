@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark timestamp and engagement extraction over a corpus of saved snippets
+
+Compares the original per-pattern re.search loops against the precompiled
+combined patterns in text_patterns.py.
+
+Usage (from backend/):
+    python benchmarks/bench_text_patterns.py [--repeat 200] [--corpus PATH]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from text_patterns import extract_timestamp, extract_engagement
+
+DEFAULT_CORPUS = os.path.join(BACKEND_DIR, 'benchmarks', 'fixtures', 'snippets.txt')
+
+
+def legacy_extract_timestamp(content_text):
+    """
+    Original EnhancedDataScraper._extract_timestamp_info implementation
+    """
+    timestamp_patterns = [
+        r'\d{1,2}\s+(hour|minute|day|week|month|year)s?\s+ago',
+        r'(yesterday|today)',
+        r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
+        r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2}',
+    ]
+
+    for pattern in timestamp_patterns:
+        match = re.search(pattern, content_text.lower())
+        if match:
+            return match.group()
+
+    return None
+
+
+def legacy_extract_engagement(content_text):
+    """
+    Original EnhancedDataScraper._extract_engagement_data implementation
+    """
+    engagement_data = {}
+
+    engagement_patterns = {
+        'likes': r'(\d+(?:,\d+)*)\s*(?:likes?|hearts?|thumbs)',
+        'comments': r'(\d+(?:,\d+)*)\s*(?:comments?|replies?)',
+        'shares': r'(\d+(?:,\d+)*)\s*(?:shares?|reposts?|retweets?)',
+        'views': r'(\d+(?:,\d+)*)\s*(?:views?|watched?)'
+    }
+
+    for metric, pattern in engagement_patterns.items():
+        match = re.search(pattern, content_text.lower())
+        if match:
+            engagement_data[metric] = match.group(1)
+
+    return engagement_data if engagement_data else None
+
+
+def legacy_extract(snippet):
+    return legacy_extract_timestamp(snippet), legacy_extract_engagement(snippet)
+
+
+def precompiled_extract(snippet):
+    snippet_lower = snippet.lower()
+    return extract_timestamp(snippet_lower), extract_engagement(snippet_lower)
+
+
+def load_corpus(path):
+    with open(path, encoding='utf-8') as corpus_file:
+        return [line.strip() for line in corpus_file if line.strip()]
+
+
+def time_extractor(extractor, corpus, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for snippet in corpus:
+            extractor(snippet)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+
+    # Report where the outputs differ (both should match on every snippet)
+    timestamp_diffs = 0
+    engagement_diffs = 0
+    for snippet in corpus:
+        legacy_timestamp, legacy_engagement = legacy_extract(snippet)
+        new_timestamp, new_engagement = precompiled_extract(snippet)
+        timestamp_diffs += legacy_timestamp != new_timestamp
+        engagement_diffs += legacy_engagement != new_engagement
+
+    # Warm up both paths so pattern compilation is not measured
+    time_extractor(legacy_extract, corpus, 1)
+    time_extractor(precompiled_extract, corpus, 1)
+
+    legacy_seconds = time_extractor(legacy_extract, corpus, args.repeat)
+    new_seconds = time_extractor(precompiled_extract, corpus, args.repeat)
+    calls = len(corpus) * args.repeat
+
+    print(f"Corpus: {len(corpus)} snippets x {args.repeat} repeats ({args.corpus})")
+    print(f"{'implementation':<16}{'total (s)':>12}{'per snippet (us)':>20}")
+    print(f"{'legacy':<16}{legacy_seconds:>12.3f}{legacy_seconds / calls * 1e6:>20.2f}")
+    print(f"{'precompiled':<16}{new_seconds:>12.3f}{new_seconds / calls * 1e6:>20.2f}")
+    print(f"Speedup: {legacy_seconds / new_seconds:.2f}x")
+    print(f"Output differences: {timestamp_diffs} timestamps, {engagement_diffs} engagement dicts")
+
+
+if __name__ == "__main__":
+    main()
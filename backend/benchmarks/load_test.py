@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Load test for the API: /search, /search-stream and /health
+
+Drives the running service (or one it spawns against the stub upstream) with
+either a fixed number of concurrent users (closed loop) or a fixed arrival
+rate (open loop, Poisson arrivals). While the load runs, a separate prober
+hits /health at a steady interval: its latency shows when the worker stops
+serving cheap requests promptly. The report has p50/p95/p99 latency and errors
+per endpoint, time to first stream event, /health latency and the load
+generator's own event-loop lag (to rule out the client being the bottleneck),
+plus the server's event-loop lag and stall count read from /metrics.
+
+--ramp runs one closed-loop phase per concurrency level and reports the first
+level at which /health p95 exceeds --health-slo-ms.
+
+Usage (from backend/):
+    # spawn the stub upstream and uvicorn, then ramp concurrent users
+    python benchmarks/load_test.py --spawn --ramp 1,2,4,8,16 --duration 20
+
+    # against an already running server, 2 searches/s open loop
+    python benchmarks/load_test.py --url http://127.0.0.1:8001 --rate 2 --duration 60 --mix search=3,stream=1
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, BENCHMARKS_DIR)
+
+NAMES = ["Maria Gonzalez", "David Chen", "Aisha Patel", "Tom O'Brien", "Sofia Rossi", "Kenji Watanabe"]
+ENDPOINTS = ("search", "stream", "health")
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def latency_stats(seconds):
+    return {
+        "count": len(seconds),
+        "p50_ms": round(percentile(seconds, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(seconds, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(seconds, 0.99) * 1000, 1),
+        "max_ms": round(max(seconds) * 1000, 1) if seconds else 0.0,
+        "mean_ms": round(statistics.mean(seconds) * 1000, 1) if seconds else 0.0,
+    }
+
+
+def parse_mix(spec):
+    weights = {}
+    for item in spec.split(","):
+        endpoint, _, weight = item.partition("=")
+        endpoint = endpoint.strip()
+        if endpoint not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint in --mix: {endpoint}")
+        weights[endpoint] = float(weight or 1)
+    return weights
+
+
+def multipart_body(fields, image_path=None):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for key, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'.encode("utf-8")
+        )
+    if image_path:
+        with open(image_path, "rb") as image_file:
+            image = image_file.read()
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+            f'filename="{os.path.basename(image_path)}"\r\nContent-Type: image/jpeg\r\n\r\n'.encode("utf-8")
+            + image + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+class Client:
+    """
+    Blocking http.client requests, run on a thread pool by the asyncio driver
+    """
+
+    def __init__(self, base_url, image_path=None, timeout=300):
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.image_path = image_path
+        self.timeout = timeout
+
+    def _connection(self):
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def health(self):
+        connection = self._connection()
+        try:
+            start = time.perf_counter()
+            connection.request("GET", "/health")
+            response = connection.getresponse()
+            response.read()
+            return response.status, time.perf_counter() - start, None
+        finally:
+            connection.close()
+
+    def metrics_text(self):
+        connection = self._connection()
+        try:
+            connection.request("GET", "/metrics")
+            response = connection.getresponse()
+            return response.read().decode("utf-8") if response.status == 200 else ""
+        finally:
+            connection.close()
+
+    def search(self):
+        body, content_type = multipart_body({"name": random.choice(NAMES)}, self.image_path)
+        connection = self._connection()
+        try:
+            start = time.perf_counter()
+            connection.request("POST", "/search", body=body, headers={"Content-Type": content_type})
+            response = connection.getresponse()
+            response.read()
+            return response.status, time.perf_counter() - start, None
+        finally:
+            connection.close()
+
+    def stream(self):
+        body, content_type = multipart_body({"name": random.choice(NAMES)}, self.image_path)
+        connection = self._connection()
+        try:
+            start = time.perf_counter()
+            connection.request("POST", "/search-stream?format=ndjson", body=body, headers={"Content-Type": content_type})
+            response = connection.getresponse()
+            first_event = None
+            while True:
+                line = response.readline()
+                if not line:
+                    break
+                if first_event is None:
+                    first_event = time.perf_counter() - start
+            return response.status, time.perf_counter() - start, first_event
+        finally:
+            connection.close()
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = {endpoint: [] for endpoint in ENDPOINTS}
+        self.first_event = []
+        self.errors = {endpoint: Counter() for endpoint in ENDPOINTS}
+        self.loop_lag = []
+        self.dropped = 0
+
+    def record(self, endpoint, outcome):
+        status, elapsed, first_event = outcome
+        if 200 <= status < 300:
+            self.latencies[endpoint].append(elapsed)
+            if first_event is not None:
+                self.first_event.append(first_event)
+        else:
+            self.errors[endpoint][str(status)] += 1
+
+    def record_error(self, endpoint, error):
+        self.errors[endpoint][type(error).__name__] += 1
+
+    def report(self):
+        report = {}
+        for endpoint in ENDPOINTS:
+            stats = latency_stats(self.latencies[endpoint])
+            stats["errors"] = dict(self.errors[endpoint])
+            report[endpoint] = stats
+        report["stream_first_event"] = latency_stats(self.first_event)
+        report["client_loop_lag"] = latency_stats(self.loop_lag)
+        report["dropped_arrivals"] = self.dropped
+        return report
+
+
+async def call(loop, executor, client, endpoint, recorder):
+    try:
+        outcome = await loop.run_in_executor(executor, getattr(client, endpoint))
+        recorder.record(endpoint, outcome)
+    except Exception as e:
+        recorder.record_error(endpoint, e)
+
+
+async def health_prober(loop, executor, client, recorder, interval, stop):
+    while not stop.is_set():
+        await call(loop, executor, client, "health", recorder)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def loop_lag_monitor(recorder, stop, interval=0.05):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        recorder.loop_lag.append(max(0.0, time.perf_counter() - start - interval))
+
+
+def run_measured_phase(args, client, mix, concurrency=None, rate=None):
+    """
+    run_phase plus the server's own event-loop lag over the phase, read from /metrics
+    """
+    before = server_loop_counters(client)
+    report = asyncio.run(run_phase(args, client, mix, concurrency=concurrency, rate=rate))
+    report["server_loop_lag"] = server_loop_lag(before, server_loop_counters(client))
+    return report
+
+
+async def run_phase(args, client, mix, concurrency=None, rate=None):
+    """
+    One load phase; closed loop with `concurrency` users or open loop at `rate`/s
+    """
+    loop = asyncio.get_running_loop()
+    recorder = Recorder()
+    stop = asyncio.Event()
+    pool_size = (concurrency or args.max_in_flight) + 4
+    endpoints = list(mix)
+    weights = [mix[endpoint] for endpoint in endpoints]
+
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        background = [
+            asyncio.create_task(health_prober(loop, executor, client, recorder, args.health_interval, stop)),
+            asyncio.create_task(loop_lag_monitor(recorder, stop)),
+        ]
+        deadline = loop.time() + args.duration
+
+        if concurrency:
+            async def user():
+                while loop.time() < deadline:
+                    await call(loop, executor, client, random.choices(endpoints, weights)[0], recorder)
+
+            await asyncio.gather(*(user() for _ in range(concurrency)))
+        else:
+            in_flight = set()
+            while loop.time() < deadline:
+                await asyncio.sleep(random.expovariate(rate))
+                if len(in_flight) >= args.max_in_flight:
+                    recorder.dropped += 1
+                    continue
+                task = asyncio.create_task(call(loop, executor, client, random.choices(endpoints, weights)[0], recorder))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+
+        stop.set()
+        await asyncio.gather(*background)
+
+    return recorder.report()
+
+
+def print_phase(label, report):
+    print(f"\n== {label}")
+    print(f"  {'endpoint':<20} {'ok':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  errors")
+    for key in ENDPOINTS + ("stream_first_event", "client_loop_lag"):
+        stats = report[key]
+        errors = stats.get("errors")
+        print(f"  {key:<20} {stats['count']:>6} {stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} "
+              f"{stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}  {errors if errors else ''}")
+    server_lag = report.get("server_loop_lag")
+    if server_lag and server_lag["probes"]:
+        print(f"  server event loop: mean lag {server_lag['mean_ms']:.1f} ms over {server_lag['probes']} probes, "
+              f"{server_lag['stalls']} stalls")
+    if report["dropped_arrivals"]:
+        print(f"  dropped arrivals (over --max-in-flight): {report['dropped_arrivals']}")
+
+
+def server_loop_counters(client):
+    """
+    Server-side event-loop lag sum/count and stall count from /metrics (zeros if unavailable)
+    """
+    counters = {"event_loop_lag_seconds_sum": 0.0, "event_loop_lag_seconds_count": 0.0, "event_loop_stalls_total": 0.0}
+    try:
+        text = client.metrics_text()
+    except OSError:
+        return counters
+    for line in text.splitlines():
+        name, _, value = line.partition(" ")
+        if name in counters:
+            counters[name] = float(value)
+    return counters
+
+
+def server_loop_lag(before, after):
+    probes = after["event_loop_lag_seconds_count"] - before["event_loop_lag_seconds_count"]
+    lag_sum = after["event_loop_lag_seconds_sum"] - before["event_loop_lag_seconds_sum"]
+    return {
+        "probes": int(probes),
+        "mean_ms": round(lag_sum / probes * 1000, 1) if probes else 0.0,
+        "stalls": int(after["event_loop_stalls_total"] - before["event_loop_stalls_total"]),
+    }
+
+
+def wait_for_health(client, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if client.health()[0] == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.5)
+    return False
+
+
+def spawn_service(args):
+    """
+    Start the stub upstream in-process and uvicorn in a subprocess pointed at it
+    """
+    from stub_server import StubServer, fault_plan_from_args
+
+    stub = StubServer(faults=fault_plan_from_args(args)).start()
+    env = dict(os.environ, UPSTREAM_BASE_URL=stub.base_url, PACING_SCALE=str(args.pacing_scale), LOG_LEVEL="WARNING")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(args.port)],
+        cwd=BACKEND_DIR, env=env,
+    )
+    return stub, process
+
+
+def main():
+    from stub_server import add_fault_arguments
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--url', default=None, help='base URL of a running service')
+    parser.add_argument('--spawn', action='store_true', help='start the stub upstream and uvicorn locally')
+    parser.add_argument('--port', type=int, default=8011, help='port for the spawned service')
+    parser.add_argument('--pacing-scale', type=float, default=0.0, help='PACING_SCALE for the spawned service')
+    parser.add_argument('--mix', default='search=1,stream=1', help='endpoint weights, e.g. search=3,stream=1,health=1')
+    parser.add_argument('--concurrency', type=int, default=4, help='closed-loop concurrent users')
+    parser.add_argument('--rate', type=float, default=None, help='open-loop arrivals per second (overrides --concurrency)')
+    parser.add_argument('--ramp', default=None, help='comma-separated concurrency levels, one phase each')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds per phase')
+    parser.add_argument('--max-in-flight', type=int, default=64, help='open-loop cap on outstanding requests')
+    parser.add_argument('--health-interval', type=float, default=0.25)
+    parser.add_argument('--health-slo-ms', type=float, default=100.0, help='/health p95 considered degraded')
+    parser.add_argument('--image', default=None, help='optional image to upload with each search')
+    parser.add_argument('--json', default=None, help='also write the report to this file')
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.url and not args.spawn:
+        parser.error("pass --url for a running service or --spawn")
+
+    stub = process = None
+    if args.spawn:
+        stub, process = spawn_service(args)
+        args.url = f"http://127.0.0.1:{args.port}"
+
+    client = Client(args.url, args.image)
+    mix = parse_mix(args.mix)
+    phases = {}
+
+    try:
+        if not wait_for_health(client):
+            raise SystemExit(f"{args.url}/health did not come up")
+
+        if args.ramp:
+            for level in [int(level) for level in args.ramp.split(",") if level.strip()]:
+                label = f"closed loop, {level} concurrent users"
+                phases[label] = run_measured_phase(args, client, mix, concurrency=level)
+                print_phase(label, phases[label])
+        elif args.rate:
+            label = f"open loop, {args.rate}/s arrivals"
+            phases[label] = run_measured_phase(args, client, mix, rate=args.rate)
+            print_phase(label, phases[label])
+        else:
+            label = f"closed loop, {args.concurrency} concurrent users"
+            phases[label] = run_measured_phase(args, client, mix, concurrency=args.concurrency)
+            print_phase(label, phases[label])
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+        if stub is not None:
+            stub.stop()
+
+    degraded = [label for label, report in phases.items() if report["health"]["p95_ms"] > args.health_slo_ms]
+    if degraded:
+        print(f"\n/health p95 exceeded {args.health_slo_ms:.0f} ms first at: {degraded[0]}")
+    else:
+        print(f"\n/health p95 stayed under {args.health_slo_ms:.0f} ms in every phase")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as report_file:
+            json.dump({"url": args.url, "mix": mix, "phases": phases}, report_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
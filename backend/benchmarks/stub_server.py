@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Local stub for the search engines and pages the scrapers fetch
+
+Serves SERP, profile and article pages built from the HTML fixtures in
+fixtures/pages/, with the searched name substituted in, so the search
+pipelines can run fully offline. Point the backend at it with
+UPSTREAM_BASE_URL (see http_client.py): https://www.google.com/search?q=...
+becomes <base>/www.google.com/search?q=...
+
+Latency, 5xx errors and 429 rate limiting can be injected per request.
+
+Usage (from backend/):
+    python benchmarks/stub_server.py [--port 8765] [--latency-ms 80] [--jitter-ms 40]
+                                     [--error-rate 0.02] [--rate-limit-rate 0.05]
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, quote_plus, unquote_plus, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+PAGES_DIR = os.path.join(FIXTURES_DIR, 'pages')
+
+SEARCH_HOSTS = ("google.", "bing.", "duckduckgo.")
+PROFILE_HOSTS = {
+    "instagram.com": "Instagram",
+    "twitter.com": "Twitter",
+    "x.com": "X",
+    "facebook.com": "Facebook",
+    "linkedin.com": "LinkedIn",
+    "tiktok.com": "TikTok",
+    "youtube.com": "YouTube",
+    "reddit.com": "Reddit",
+    "pinterest.com": "Pinterest",
+    "quora.com": "Quora",
+    "github.com": "GitHub",
+    "medium.com": "Medium",
+}
+
+# Where SERP result links point: (link pattern, title pattern)
+RESULT_LINKS = [
+    ("https://www.instagram.com/{handle}/", "{name} (@{handle}) • Instagram photos and videos"),
+    ("https://www.linkedin.com/in/{slug}", "{name} - Senior Engineer - LinkedIn"),
+    ("https://twitter.com/{handle}", "{name} (@{handle}) / X"),
+    ("https://www.facebook.com/{handle}", "{name} | Facebook"),
+    ("https://www.tiktok.com/@{handle}", "{name} (@{handle}) | TikTok"),
+    ("https://www.youtube.com/@{handle}", "{name} - YouTube"),
+    ("https://github.com/{handle}", "{handle} ({name}) · GitHub"),
+    ("https://www.reddit.com/user/{handle}", "u/{handle} - Reddit"),
+    ("https://news.example.com/{year}/local/{slug}-profile", "Meet {name}, the engineer behind the city's new transit app"),
+    ("https://blog.example.org/posts/{slug}-interview", "An interview with {name}"),
+    ("https://www.example-university.edu/people/{slug}", "{name} | Faculty Directory"),
+    ("https://medium.com/@{handle}/notes-{number}", "Notes from the road - {name} - Medium"),
+]
+
+QUERY_PARAMS = ("q", "query", "keywords", "search_query", "p")
+OPERATOR_PATTERN = re.compile(r'\b(?:site|inurl|intitle|filetype):\S+|\bOR\b|\bAND\b')
+
+
+def load_template(file_name):
+    with open(os.path.join(PAGES_DIR, file_name), encoding='utf-8') as template_file:
+        return Template(template_file.read())
+
+
+def load_snippets():
+    with open(os.path.join(FIXTURES_DIR, 'snippets.txt'), encoding='utf-8') as snippets_file:
+        return [line.strip() for line in snippets_file if line.strip()]
+
+
+def name_from_query(query):
+    """
+    The person's name in a search query: the first quoted phrase, else the query
+    without search operators
+    """
+    quoted = re.findall(r'"([^"]+)"', query)
+    if quoted:
+        return quoted[0].strip()
+    words = OPERATOR_PATTERN.sub(" ", query).replace('"', " ").split()
+    return " ".join(words[:3]) or "Jane Doe"
+
+
+def name_from_path(path):
+    """
+    Recover a name from a profile slug such as /in/john-smith or /john.smith/
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    for segment in reversed(segments):
+        segment = unquote_plus(segment).lstrip("@")
+        segment = re.sub(r'-(?:profile|interview)$', "", segment)
+        words = [word for word in re.split(r'[-._\s]+', segment) if word.isalpha()]
+        if len(words) >= 2:
+            return " ".join(word.capitalize() for word in words[:3])
+    return "Jane Doe"
+
+
+def personalize(text, name, handle):
+    return text.replace("John Smith", name).replace("john smith", name.lower()).replace("johnsmith", handle)
+
+
+class PageRenderer:
+    """
+    Builds deterministic pages for a (name, url) pair from the fixtures
+    """
+
+    def __init__(self):
+        self.snippets = load_snippets()
+        self.templates = {
+            file_name[:-5]: load_template(file_name)
+            for file_name in os.listdir(PAGES_DIR) if file_name.endswith('.html')
+        }
+
+    def _rng(self, *parts):
+        digest = hashlib.sha1("|".join(parts).encode('utf-8')).hexdigest()
+        return random.Random(int(digest[:12], 16))
+
+    def _identity(self, name):
+        handle = re.sub(r'[^a-z0-9]', "", name.lower()) or "janedoe"
+        slug = re.sub(r'[^a-z0-9]+', "-", name.lower()).strip("-") or "jane-doe"
+        return handle, slug
+
+    def _snippet(self, rng, name, handle):
+        return personalize(rng.choice(self.snippets), name, handle)
+
+    def serp(self, engine, query, news=False, count=10):
+        name = name_from_query(query)
+        handle, slug = self._identity(name)
+        rng = self._rng(engine, query)
+
+        if news:
+            item_template = self.templates["serp_google_news_result"]
+        else:
+            item_template = self.templates[f"serp_{engine}_result"]
+
+        items = []
+        for number in range(count):
+            link_pattern, title_pattern = rng.choice(RESULT_LINKS)
+            fields = {"name": name, "handle": handle, "slug": slug, "year": rng.randint(2019, 2024), "number": number}
+            link = link_pattern.format(**fields)
+            items.append(item_template.substitute(
+                link=link,
+                display_link=link.split("://", 1)[-1][:60],
+                title=title_pattern.format(**fields),
+                snippet=self._snippet(rng, name, handle),
+                date=f"{rng.randint(1, 28)} {rng.choice(['Jan', 'Mar', 'Jun', 'Sep', 'Nov'])} {rng.randint(2019, 2024)}",
+            ))
+
+        return self.templates[f"serp_{engine}"].substitute(
+            query=query, query_quoted=quote_plus(query), results="\n".join(items)
+        )
+
+    def profile(self, platform, name, path):
+        handle, _ = self._identity(name)
+        rng = self._rng(platform, path)
+        # Platforms whose extractors look for their own post markup have a profile_post_<platform> template
+        post_template = self.templates.get(f"profile_post_{platform.lower()}", self.templates["profile_post"])
+        posts = "\n".join(
+            post_template.substitute(
+                name=name,
+                handle=handle,
+                title=f"Post by {name}",
+                snippet=self._snippet(rng, name, handle),
+                date=f"{rng.randint(1, 52)} weeks ago",
+                likes=rng.randint(5, 5000),
+                comments=rng.randint(0, 300),
+            )
+            for _ in range(rng.randint(4, 12))
+        )
+        return self.templates["profile"].substitute(
+            name=name,
+            handle=handle,
+            platform=platform,
+            bio=self._snippet(rng, name, handle),
+            post_count=rng.randint(10, 900),
+            follower_count=f"{rng.randint(100, 90000):,}",
+            following_count=rng.randint(50, 2000),
+            posts=posts,
+        )
+
+    def article(self, name, path):
+        handle, slug = self._identity(name)
+        rng = self._rng("article", path)
+        paragraphs = "\n  ".join(
+            "<p>" + " ".join(self._snippet(rng, name, handle) for _ in range(rng.randint(2, 4))) + "</p>"
+            for _ in range(rng.randint(6, 14))
+        )
+        related = "".join(
+            f'<li><a href="https://news.example.com/{rng.randint(2019, 2024)}/local/{slug}-profile">More about {name}</a></li>'
+            for _ in range(3)
+        )
+        return self.templates["article"].substitute(
+            title=f"{name}: {self._snippet(rng, name, handle)[:60]}",
+            snippet=self._snippet(rng, name, handle),
+            date=f"{rng.randint(2019, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            paragraphs=paragraphs,
+            related=related,
+        )
+
+    def render(self, host, path, params):
+        """
+        Page body for a rewritten request to https://<host><path>
+        """
+        query = next((params[key][0] for key in QUERY_PARAMS if params.get(key)), "")
+
+        if any(marker in host for marker in SEARCH_HOSTS) and query:
+            if "bing." in host:
+                return self.serp("bing", query)
+            if "duckduckgo." in host:
+                return self.serp("duckduckgo", query)
+            return self.serp("google", query, news=params.get("tbm", [""])[0] == "nws")
+
+        name = name_from_query(query) if query else name_from_path(path)
+        for domain, platform in PROFILE_HOSTS.items():
+            if host == domain or host.endswith("." + domain):
+                return self.profile(platform, name, path)
+        return self.article(name, path)
+
+
+class FaultPlan:
+    """
+    Per-request latency and failure injection
+    """
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, rate_limit_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self):
+        """
+        (delay in seconds, forced status or None) for the next request
+        """
+        with self._lock:
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000.0
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return delay, 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay, 503
+        return delay, None
+
+
+class StubServer:
+    """
+    Threaded stub HTTP server, startable in-process for benchmarks
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, faults=None):
+        self.renderer = PageRenderer()
+        self.faults = faults or FaultPlan()
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                delay, forced_status = stub.faults.next()
+                if delay:
+                    time.sleep(delay)
+
+                parsed = urlparse(self.path)
+                host, _, path = parsed.path.lstrip("/").partition("/")
+                stub.record("requests")
+
+                if forced_status is not None:
+                    stub.record(str(forced_status))
+                    extra_headers = {"Retry-After": "1"} if forced_status == 429 else {}
+                    self._send(forced_status, b"", extra_headers)
+                    return
+
+                try:
+                    body = stub.renderer.render(host.lower(), "/" + path, parse_qs(parsed.query)).encode('utf-8')
+                except Exception as e:
+                    stub.record("500")
+                    self._send(500, str(e).encode('utf-8'))
+                    return
+
+                stub.record("200")
+                self._send(200, body)
+
+            def _send(self, status, body, extra_headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for header, value in (extra_headers or {}).items():
+                    self.send_header(header, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def snapshot(self):
+        with self._stats_lock:
+            return dict(self.stats)
+
+
+def add_fault_arguments(parser):
+    parser.add_argument('--latency-ms', type=float, default=80.0, help='mean injected latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=40.0, help='uniform +/- jitter around the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--seed', type=int, default=1234)
+
+
+def fault_plan_from_args(args):
+    return FaultPlan(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate, args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, fault_plan_from_args(args))
+    print(f"Stub upstream listening on {server.base_url}")
+    print(f"Run the backend with UPSTREAM_BASE_URL={server.base_url} PACING_SCALE=0")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Requests served: {server.snapshot()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Process-wide circuit breakers for upstream hosts
+
+Every outbound request in http_client.get() goes through the breaker for its
+host. After CIRCUIT_FAILURE_THRESHOLD consecutive failures (network errors,
+timeouts, 5xx or 429) the circuit opens and requests to the host fail at once
+with CircuitOpenError instead of waiting out their timeouts, for every search
+in the process. After CIRCUIT_RESET_SECONDS (or a longer Retry-After) one
+trial request is let through (half-open): success closes the circuit, failure
+opens it again. Thresholds come from the environment:
+
+    CIRCUIT_FAILURE_THRESHOLD=5   consecutive failures that open a circuit (0 disables)
+    CIRCUIT_RESET_SECONDS=30      how long a circuit stays open before a trial request
+    CIRCUIT_MAX_OPEN_SECONDS=300  upper bound for a Retry-After driven open period
+
+State is exported per host as circuit_breaker_state (0 closed, 1 half-open,
+2 open), with transitions and rejected requests as counters.
+
+Breakers live for the whole process, so they exist only for the upstream
+sites the scrapers query (upstream_hosts); the arbitrary result pages fetched
+during verification get none.
+"""
+
+import os
+import time
+import threading
+import logging
+
+import requests
+
+from metrics import CIRCUIT_BREAKER_STATE, CIRCUIT_BREAKER_TRANSITIONS, CIRCUIT_BREAKER_REJECTED
+from upstream_hosts import upstream_domain
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5") or 5)
+CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30") or 30)
+CIRCUIT_MAX_OPEN_SECONDS = float(os.getenv("CIRCUIT_MAX_OPEN_SECONDS", "300") or 300)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    The host's circuit is open; the request was not sent
+    """
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit for {host} is open (retry in {retry_in:.0f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def is_failure_status(status_code):
+    return status_code == 429 or status_code >= 500
+
+
+def retry_after_seconds(response):
+    """
+    Retry-After in seconds (numeric form only), or None
+    """
+    try:
+        value = response.headers.get("Retry-After")
+        return float(value) if value else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one host
+    """
+
+    def __init__(self, host, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_seconds=CIRCUIT_RESET_SECONDS):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        CIRCUIT_BREAKER_STATE.set(STATE_VALUES[CLOSED], host=host)
+
+    def _transition(self, state):
+        if state == self.state:
+            return
+        log = logger.warning if state == OPEN else logger.info
+        log("Circuit for %s: %s -> %s", self.host, self.state, state)
+        self.state = state
+        CIRCUIT_BREAKER_STATE.set(STATE_VALUES[state], host=self.host)
+        CIRCUIT_BREAKER_TRANSITIONS.inc(host=self.host, state=state)
+
+    def before_request(self):
+        """
+        Raise CircuitOpenError unless a request to the host may be sent now
+        """
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now >= self.opened_until:
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            retry_in = max(0.0, self.opened_until - now)
+        CIRCUIT_BREAKER_REJECTED.inc(host=self.host)
+        raise CircuitOpenError(self.host, retry_in)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+            self._transition(CLOSED)
+
+    def record_failure(self, open_for=None):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                open_for = min(max(self.reset_seconds, open_for or 0.0), CIRCUIT_MAX_OPEN_SECONDS)
+                self.opened_until = time.monotonic() + open_for
+                self._transition(OPEN)
+
+    def record_response(self, response):
+        if is_failure_status(response.status_code):
+            self.record_failure(retry_after_seconds(response))
+        else:
+            self.record_success()
+
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per upstream host, created on first use
+    """
+
+    def __init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, host):
+        """
+        The breaker for host, or None when host is not a known upstream
+        """
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            if upstream_domain(host) is None:
+                return None
+            with self._lock:
+                breaker = self._breakers.get(host)
+                if breaker is None:
+                    breaker = self._breakers[host] = CircuitBreaker(host)
+        return breaker
+
+
+circuit_breakers = CircuitBreakers()
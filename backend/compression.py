@@ -0,0 +1,136 @@
+"""
+Response compression middleware (brotli when available, otherwise gzip)
+
+Only complete, single-body responses above a size threshold are compressed;
+streamed responses such as /search-stream are passed through untouched so
+events are not held back by the compressor.
+"""
+
+import gzip
+import logging
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SKIP_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson", "image/")
+
+
+def choose_encoding(accept_encoding):
+    """
+    Pick the best supported content coding from an Accept-Encoding header
+    """
+    offered = {}
+    for part in accept_encoding.lower().split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        offered[coding.strip()] = quality
+
+    if BROTLI_AVAILABLE and offered.get('br', 0) > 0:
+        return 'br'
+    if offered.get('gzip', 0) > 0:
+        return 'gzip'
+    return None
+
+
+def compress_body(body, encoding, gzip_level=6, brotli_quality=4):
+    """
+    Compress a response body with the given content coding
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing JSON/text responses larger than minimum_size bytes
+    """
+
+    def __init__(self, app, minimum_size=1024, gzip_level=6, brotli_quality=4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+
+        encoding = choose_encoding(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                # Hold the headers back until the body size is known
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            headers = start_message.get("headers", [])
+            body = message.get("body", b"")
+            content_type = ""
+            already_encoded = False
+            for key, value in headers:
+                if key == b"content-type":
+                    content_type = value.decode("latin-1")
+                elif key == b"content-encoding":
+                    already_encoded = True
+
+            if (message.get("more_body", False) or already_encoded
+                    or len(body) < self.minimum_size
+                    or content_type.startswith(SKIP_MEDIA_TYPES)):
+                # Streaming or small responses go out as they are
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress_body(body, encoding, self.gzip_level, self.brotli_quality)
+            vary = b"Accept-Encoding"
+            new_headers = []
+            for key, value in headers:
+                if key == b"vary":
+                    vary = value + b", Accept-Encoding"
+                elif key != b"content-length":
+                    new_headers.append((key, value))
+            new_headers.append((b"content-encoding", encoding.encode("latin-1")))
+            new_headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+            new_headers.append((b"vary", vary))
+
+            passthrough = True
+            await send({**start_message, "headers": new_headers})
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
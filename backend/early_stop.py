@@ -0,0 +1,133 @@
+"""
+Diminishing-returns early stop for loops of search queries
+
+A stage that runs a batch of queries wraps the batch in EarlyStop.run() and
+reports each query's results with add(). The controller counts how many new
+canonical URLs every query contributed; once the average over the last
+EARLY_STOP_WINDOW queries falls below EARLY_STOP_MIN_NEW_URLS, the remaining
+queries of the batch are not issued (nor claimed in the query plan). Thresholds come from the environment:
+
+    EARLY_STOP_MIN_NEW_URLS=1    average new URLs per query needed to continue (0 disables)
+    EARLY_STOP_WINDOW=2          number of recent queries averaged
+    EARLY_STOP_MIN_QUERIES=3     queries always run before stopping is considered
+"""
+
+import os
+import logging
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+from metrics import SEARCH_QUERIES_EARLY_STOPPED
+from search_context import current_search
+
+logger = logging.getLogger(__name__)
+
+EARLY_STOP_MIN_NEW_URLS = float(os.getenv("EARLY_STOP_MIN_NEW_URLS", "1") or 1)
+EARLY_STOP_WINDOW = int(os.getenv("EARLY_STOP_WINDOW", "2") or 2)
+EARLY_STOP_MIN_QUERIES = int(os.getenv("EARLY_STOP_MIN_QUERIES", "3") or 3)
+
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "igshid", "ref", "hl")
+
+
+def canonical_url(url):
+    """
+    host/path?query with scheme, www./m. prefixes, fragments, trailing slashes
+    and tracking parameters removed; Google /url?q= redirects are unwrapped
+    """
+    if not url:
+        return None
+    try:
+        parsed = urlparse(url)
+        if parsed.path == "/url":
+            redirect = dict(parse_qsl(parsed.query))
+            target = redirect.get("q") or redirect.get("url")
+            if target and target != url:
+                return canonical_url(target)
+
+        host = (parsed.hostname or "").lower()
+        if not host:
+            return None
+        for prefix in ("www.", "m.", "mobile."):
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+                break
+
+        params = sorted(
+            (key, value) for key, value in parse_qsl(parsed.query)
+            if not key.lower().startswith(TRACKING_PARAMS)
+        )
+        canonical = host + parsed.path.rstrip("/").lower()
+        return f"{canonical}?{urlencode(params)}" if params else canonical
+    except Exception:
+        return None
+
+
+def result_url(result):
+    return result.get("link") or result.get("source_url") or result.get("url")
+
+
+class EarlyStop:
+    """
+    Tracks the new-URL yield of a loop of queries and ends it when the yield dries up
+    """
+
+    def __init__(self, stage, min_new_urls=EARLY_STOP_MIN_NEW_URLS, window=EARLY_STOP_WINDOW,
+                 min_queries=EARLY_STOP_MIN_QUERIES):
+        self.stage = stage
+        self.min_new_urls = min_new_urls
+        self.window = max(1, window)
+        self.min_queries = max(min_queries, self.window)
+        self.seen = set()
+        self.yields = []
+        self.skipped = 0
+
+    def add(self, results):
+        """
+        Count the results of the current query; returns how many had a URL not seen before
+        """
+        new = 0
+        for result in results or ():
+            url = canonical_url(result_url(result)) if isinstance(result, dict) else None
+            if url and url not in self.seen:
+                self.seen.add(url)
+                new += 1
+        if self.yields:
+            self.yields[-1] += new
+        return new
+
+    def should_stop(self):
+        if self.min_new_urls <= 0 or len(self.yields) < self.min_queries:
+            return False
+        recent = self.yields[-self.window:]
+        return sum(recent) / float(len(recent)) < self.min_new_urls
+
+    def run(self, queries):
+        """
+        Yield queries until the recent yield falls below the threshold
+
+        A query whose results are never passed to add() (e.g. it failed) counts
+        as yielding nothing. queries is read one item at a time, so a lazy plan
+        (query_planner.plan_queries) only claims the queries that are issued.
+        """
+        iterator = iter(queries)
+        issued = 0
+        while True:
+            if self.should_stop():
+                remaining = queries.remaining() if hasattr(queries, "remaining") else len(queries) - issued
+                if remaining > 0:
+                    self._stopped(remaining)
+                return
+            query = next(iterator, None)
+            if query is None:
+                return
+            issued += 1
+            self.yields.append(0)
+            yield query
+
+    def _stopped(self, remaining):
+        self.skipped += remaining
+        SEARCH_QUERIES_EARLY_STOPPED.inc(remaining, stage=self.stage)
+        search = current_search()
+        if search is not None:
+            search.record("queries_early_stopped", remaining)
+        logger.info("Stopping %s early: last %s queries added %s new URLs, %s queries skipped",
+                    self.stage, self.window, self.yields[-self.window:], remaining)
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """Enhanced scraping for comprehensive social media data gathering"""
 
-import requests
-from bs4 import BeautifulSoup
-import time
+import http_client
 import random
 import json
-import re
 from urllib.parse import quote_plus, urljoin, urlparse
 import logging
+from keyword_matcher import (
+    scan_keywords, has_any, classify, ACTIVITY_KEYWORDS, ACTIVITY_CONFIDENCE_KEYWORDS,
+    ACTIVITY_TYPE_RULES, TWITTER_ACTIVITY_TYPE_RULES, PROFILE_INDICATORS, SPAM_INDICATORS
+)
+from text_patterns import extract_timestamp, extract_engagement
+from name_query import NameQuery
+from search_context import search_session
+from query_planner import plan_queries, release_query
+from early_stop import EarlyStop
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +23,8 @@ class EnhancedDataScraper:
     """Scraper for social media data including activities and engagement"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Pooled per search, so nested pipelines reuse connections
+        self.session = search_session("enhanced_scraper", {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -33,7 +40,7 @@ class EnhancedDataScraper:
         
         for platform in platforms:
             try:
-                print(f"🔍 Scraping {platform.title()} activities for: {name}")
+                logger.info("Scraping %s activities for: %s", platform.title(), name)
                 
                 if platform == 'instagram':
                     activities = self._scrape_instagram_activities(name)
@@ -45,10 +52,10 @@ class EnhancedDataScraper:
                     activities = self._scrape_tiktok_activities(name)
                 
                 all_activities.extend(activities)
-                time.sleep(2)  # Rate limiting
+                http_client.pause(2)  # Rate limiting
                 
             except Exception as e:
-                logger.error(f"Error scraping {platform} activities: {e}")
+                logger.error("Error scraping %s activities: %s", platform, e)
                 continue
         
         return all_activities
@@ -77,13 +84,15 @@ class EnhancedDataScraper:
                 f'"{name}" instagram story OR stories'
             ]
             
-            for strategy in search_strategies:
+            early_stop = EarlyStop("activities.instagram")
+            for strategy in early_stop.run(plan_queries(search_strategies, name, "activities")):
                 try:
                     activities_found = self._search_instagram_activity_pattern(strategy, name)
+                    early_stop.add(activities_found)
                     activities.extend(activities_found)
-                    time.sleep(1.5)
+                    http_client.pause(1.5)
                 except Exception as e:
-                    logger.error(f"Error with Instagram strategy '{strategy}': {e}")
+                    logger.error("Error with Instagram strategy '%s': %s", strategy, e)
                     continue
             
             # Try Instagram hashtag exploration
@@ -91,7 +100,7 @@ class EnhancedDataScraper:
             activities.extend(hashtag_activities)
             
         except Exception as e:
-            logger.error(f"Instagram activities scraping error: {e}")
+            logger.error("Instagram activities scraping error: %s", e)
         
         return activities
     
@@ -103,10 +112,10 @@ class EnhancedDataScraper:
         
         try:
             search_url = f"https://www.google.com/search?q={quote_plus(search_query)}&num=10&hl=en"
-            response = self.session.get(search_url, timeout=self.timeout, verify=False)
+            response = http_client.get(search_url, session=self.session, timeout=self.timeout, verify=False)
             
             if response.status_code == 200 and response.text:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # Extract search results with multiple selectors
                 results = soup.select('div.g, div.tF2Cxc, div.MjjYud')
@@ -115,7 +124,7 @@ class EnhancedDataScraper:
                     # Try alternative selectors
                     results = soup.select('div.yuRUbf, div.kCrYT')
                     
-                logger.info(f"Found {len(results)} raw search results for query: {search_query}")
+                logger.info("Found %s raw search results for query: %s", len(results), search_query)
                 
                 for result in results:
                     try:
@@ -128,20 +137,18 @@ class EnhancedDataScraper:
                             snippet = snippet_elem.get_text().strip()
                             link = link_elem.get('href', '')
                             
-                            # Check if this contains activity information
-                            activity_keywords = [
-                                'liked', 'commented', 'shared', 'tagged', 'mentioned',
-                                'posted', 'uploaded', 'followed', 'following'
-                            ]
-                            
                             content_text = f"{title} {snippet}".lower()
-                            name_lower = name.lower()
                             
-                            if (name_lower in content_text and 
-                                any(keyword in content_text for keyword in activity_keywords)):
+                            if not NameQuery.of(name).contains(content_text, lowered=True):
+                                continue
+                            
+                            # Check if this contains activity information
+                            hits = scan_keywords(content_text)
+                            
+                            if has_any(hits, ACTIVITY_KEYWORDS):
                                 
                                 # Determine activity type
-                                activity_type = self._determine_activity_type(content_text)
+                                activity_type = self._determine_activity_type(content_text, hits)
                                 
                                 activities.append({
                                     "platform": "Instagram",
@@ -150,17 +157,18 @@ class EnhancedDataScraper:
                                     "title": title,
                                     "source_url": link,
                                     "found_via": "google_search",
-                                    "confidence": self._calculate_activity_confidence(content_text, name),
-                                    "timestamp_info": self._extract_timestamp_info(content_text),
-                                    "engagement_data": self._extract_engagement_data(content_text)
+                                    "confidence": self._calculate_activity_confidence(content_text, name, hits),
+                                    "timestamp_info": extract_timestamp(content_text),
+                                    "engagement_data": extract_engagement(content_text)
                                 })
                     
                     except Exception as e:
-                        logger.error(f"Error processing Instagram activity result: {e}")
+                        logger.error("Error processing Instagram activity result: %s", e)
                         continue
         
         except Exception as e:
-            logger.error(f"Error searching Instagram activity pattern: {e}")
+            logger.error("Error searching Instagram activity pattern: %s", e)
+            release_query(search_query)
         
         return activities
     
@@ -187,13 +195,13 @@ class EnhancedDataScraper:
                         f'#{hashtag} instagram posts OR photos'
                     ]
                     
-                    for query in search_queries:
+                    for query in plan_queries(search_queries, name, "activities"):
                         try:
                             search_url = f"https://www.google.com/search?q={quote_plus(query)}"
-                            response = self.session.get(search_url, timeout=10)
+                            response = http_client.get(search_url, session=self.session, timeout=10)
                             
                             if response.status_code == 200:
-                                soup = BeautifulSoup(response.text, 'html.parser')
+                                soup = http_client.parse_response(response)
                                 
                                 # Look for hashtag-related content
                                 results = soup.select('div.g')[:3]  # Limit results
@@ -205,7 +213,7 @@ class EnhancedDataScraper:
                                     if title_elem and snippet_elem:
                                         content = f"{title_elem.get_text()} {snippet_elem.get_text()}"
                                         
-                                        if name.lower() in content.lower():
+                                        if NameQuery.of(name).contains(content):
                                             hashtag_activities.append({
                                                 "platform": "Instagram", 
                                                 "activity_type": "hashtag_mention",
@@ -215,16 +223,17 @@ class EnhancedDataScraper:
                                                 "confidence": 0.6
                                             })
                             
-                            time.sleep(1)
+                            http_client.pause(1)
                         
                         except Exception as e:
+                            release_query(query)
                             continue
                 
                 except Exception as e:
                     continue
         
         except Exception as e:
-            logger.error(f"Hashtag exploration error: {e}")
+            logger.error("Hashtag exploration error: %s", e)
         
         return hashtag_activities
     
@@ -246,16 +255,18 @@ class EnhancedDataScraper:
                 f'"{name}" twitter thread OR conversation'
             ]
             
-            for strategy in twitter_strategies:
+            early_stop = EarlyStop("activities.twitter")
+            for strategy in early_stop.run(plan_queries(twitter_strategies, name, "activities")):
                 try:
                     twitter_results = self._search_twitter_activity_pattern(strategy, name)
+                    early_stop.add(twitter_results)
                     activities.extend(twitter_results)
-                    time.sleep(1.5)
+                    http_client.pause(1.5)
                 except Exception as e:
                     continue
         
         except Exception as e:
-            logger.error(f"Twitter activities scraping error: {e}")
+            logger.error("Twitter activities scraping error: %s", e)
         
         return activities
     
@@ -267,10 +278,10 @@ class EnhancedDataScraper:
         
         try:
             search_url = f"https://www.google.com/search?q={quote_plus(search_query)}"
-            response = self.session.get(search_url, timeout=12)
+            response = http_client.get(search_url, session=self.session, timeout=12)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 results = soup.select('div.g')[:5]
                 
                 for result in results:
@@ -286,8 +297,9 @@ class EnhancedDataScraper:
                             
                             content_text = f"{title} {snippet}".lower()
                             
-                            if name.lower() in content_text:
-                                activity_type = self._determine_twitter_activity_type(content_text)
+                            if NameQuery.of(name).contains(content_text, lowered=True):
+                                hits = scan_keywords(content_text)
+                                activity_type = self._determine_twitter_activity_type(content_text, hits)
                                 
                                 activities.append({
                                     "platform": "Twitter/X",
@@ -296,14 +308,15 @@ class EnhancedDataScraper:
                                     "title": title,
                                     "source_url": link,
                                     "found_via": "google_search",
-                                    "confidence": self._calculate_activity_confidence(content_text, name)
+                                    "confidence": self._calculate_activity_confidence(content_text, name, hits)
                                 })
                     
                     except Exception as e:
                         continue
         
         except Exception as e:
-            logger.error(f"Twitter activity pattern search error: {e}")
+            logger.error("Twitter activity pattern search error: %s", e)
+            release_query(search_query)
         
         return activities
     
@@ -321,16 +334,16 @@ class EnhancedDataScraper:
                 f'"{name}" facebook activity OR timeline'
             ]
             
-            for strategy in facebook_strategies:
+            for strategy in plan_queries(facebook_strategies, name, "activities"):
                 try:
                     fb_results = self._search_facebook_activity_pattern(strategy, name)
                     activities.extend(fb_results)
-                    time.sleep(2)
+                    http_client.pause(2)
                 except Exception as e:
                     continue
         
         except Exception as e:
-            logger.error(f"Facebook activities scraping error: {e}")
+            logger.error("Facebook activities scraping error: %s", e)
         
         return activities
     
@@ -342,10 +355,10 @@ class EnhancedDataScraper:
         
         try:
             search_url = f"https://www.google.com/search?q={quote_plus(search_query)}"
-            response = self.session.get(search_url, timeout=12)
+            response = http_client.get(search_url, session=self.session, timeout=12)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 results = soup.select('div.g')[:4]
                 
                 for result in results:
@@ -359,7 +372,7 @@ class EnhancedDataScraper:
                             
                             content_text = f"{title} {snippet}".lower()
                             
-                            if name.lower() in content_text:
+                            if NameQuery.of(name).contains(content_text, lowered=True):
                                 activities.append({
                                     "platform": "Facebook",
                                     "activity_type": "public_activity",
@@ -373,7 +386,8 @@ class EnhancedDataScraper:
                         continue
         
         except Exception as e:
-            logger.error(f"Facebook activity search error: {e}")
+            logger.error("Facebook activity search error: %s", e)
+            release_query(search_query)
         
         return activities
     
@@ -391,16 +405,16 @@ class EnhancedDataScraper:
                 f'"{name}" tiktok liked OR commented'
             ]
             
-            for strategy in tiktok_strategies:
+            for strategy in plan_queries(tiktok_strategies, name, "activities"):
                 try:
                     tiktok_results = self._search_tiktok_activity_pattern(strategy, name)
                     activities.extend(tiktok_results)
-                    time.sleep(1.5)
+                    http_client.pause(1.5)
                 except Exception as e:
                     continue
         
         except Exception as e:
-            logger.error(f"TikTok activities scraping error: {e}")
+            logger.error("TikTok activities scraping error: %s", e)
         
         return activities
     
@@ -412,10 +426,10 @@ class EnhancedDataScraper:
         
         try:
             search_url = f"https://www.google.com/search?q={quote_plus(search_query)}"
-            response = self.session.get(search_url, timeout=12)
+            response = http_client.get(search_url, session=self.session, timeout=12)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 results = soup.select('div.g')[:3]
                 
                 for result in results:
@@ -429,7 +443,7 @@ class EnhancedDataScraper:
                             
                             content_text = f"{title} {snippet}".lower()
                             
-                            if name.lower() in content_text:
+                            if NameQuery.of(name).contains(content_text, lowered=True):
                                 activities.append({
                                     "platform": "TikTok",
                                     "activity_type": "video_content",
@@ -443,75 +457,51 @@ class EnhancedDataScraper:
                         continue
         
         except Exception as e:
-            logger.error(f"TikTok activity search error: {e}")
+            logger.error("TikTok activity search error: %s", e)
+            release_query(search_query)
         
         return activities
     
-    def _determine_activity_type(self, content_text):
+    def _determine_activity_type(self, content_text, hits=None):
         """
         Determine the type of activity based on content
         """
-        content_lower = content_text.lower()
+        if hits is None:
+            hits = scan_keywords(content_text.lower())
         
-        if any(word in content_lower for word in ['liked', 'like']):
-            return 'liked_post'
-        elif any(word in content_lower for word in ['commented', 'comment', 'reply']):
-            return 'commented'
-        elif any(word in content_lower for word in ['shared', 'share', 'repost']):
-            return 'shared'
-        elif any(word in content_lower for word in ['tagged', 'tag']):
-            return 'tagged'
-        elif any(word in content_lower for word in ['mentioned', 'mention']):
-            return 'mentioned'
-        elif any(word in content_lower for word in ['posted', 'uploaded', 'published']):
-            return 'posted_content'
-        elif any(word in content_lower for word in ['followed', 'following']):
-            return 'followed'
-        else:
-            return 'general_activity'
+        return classify(hits, ACTIVITY_TYPE_RULES, 'general_activity')
     
-    def _determine_twitter_activity_type(self, content_text):
+    def _determine_twitter_activity_type(self, content_text, hits=None):
         """
         Determine Twitter-specific activity type
         """
-        content_lower = content_text.lower()
+        if hits is None:
+            hits = scan_keywords(content_text.lower())
         
-        if any(word in content_lower for word in ['retweeted', 'retweet', 'rt']):
-            return 'retweeted'
-        elif any(word in content_lower for word in ['replied', 'reply']):
-            return 'replied'
-        elif any(word in content_lower for word in ['tweeted', 'tweet']):
-            return 'tweeted'
-        elif any(word in content_lower for word in ['liked', 'favorite']):
-            return 'liked_tweet'
-        elif any(word in content_lower for word in ['mentioned', '@']):
-            return 'mentioned'
-        else:
-            return 'twitter_activity'
+        return classify(hits, TWITTER_ACTIVITY_TYPE_RULES, 'twitter_activity')
     
-    def _calculate_activity_confidence(self, content_text, name):
+    def _calculate_activity_confidence(self, content_text, name, hits=None):
         """
         Calculate confidence score for activity relevance
         """
         confidence = 0.5  # Base confidence
         
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         content_lower = content_text.lower()
+        if hits is None:
+            hits = scan_keywords(content_lower)
         
         # Exact name match
-        if f" {name_lower} " in f" {content_lower} ":
+        if query.exact(content_lower):
             confidence += 0.3
         
         # Activity keywords present
-        activity_keywords = ['liked', 'commented', 'shared', 'posted', 'uploaded']
-        if any(keyword in content_lower for keyword in activity_keywords):
+        if has_any(hits, ACTIVITY_CONFIDENCE_KEYWORDS):
             confidence += 0.2
         
         # Multiple name parts present (for full names)
-        name_parts = name_lower.split()
-        if len(name_parts) > 1:
-            parts_found = sum(1 for part in name_parts if part in content_lower)
-            confidence += (parts_found / len(name_parts)) * 0.2
+        if len(query.tokens) > 1:
+            confidence += query.partial_ratio(content_lower, lowered=True) * 0.2
         
         return min(confidence, 0.95)
     
@@ -519,41 +509,15 @@ class EnhancedDataScraper:
         """
         Extract timestamp information from content
         """
-        timestamp_patterns = [
-            r'\d{1,2}\s+(hour|minute|day|week|month|year)s?\s+ago',
-            r'(yesterday|today)',
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2}',
-        ]
-        
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, content_text.lower())
-            if match:
-                return match.group()
-        
-        return None
+        return extract_timestamp(content_text.lower())
     
     def _extract_engagement_data(self, content_text):
         """
         Extract engagement data (likes, comments, shares) from content
         """
-        engagement_data = {}
-        
-        # Look for numbers followed by engagement keywords
-        engagement_patterns = {
-            'likes': r'(\d+(?:,\d+)*)\s*(?:likes?|hearts?|thumbs)',
-            'comments': r'(\d+(?:,\d+)*)\s*(?:comments?|replies?)',
-            'shares': r'(\d+(?:,\d+)*)\s*(?:shares?|reposts?|retweets?)',
-            'views': r'(\d+(?:,\d+)*)\s*(?:views?|watched?)'
-        }
-        
-        for metric, pattern in engagement_patterns.items():
-            match = re.search(pattern, content_text.lower())
-            if match:
-                engagement_data[metric] = match.group(1)
-        
-        return engagement_data if engagement_data else None
+        return extract_engagement(content_text.lower())
 
+@traced
 def enhanced_comprehensive_search(name, include_activities=True, platforms=None):
     """
     FIXED: Comprehensive search that actually returns results
@@ -564,7 +528,7 @@ def enhanced_comprehensive_search(name, include_activities=True, platforms=None)
         platforms = ['instagram', 'twitter', 'facebook', 'tiktok']
     
     try:
-        print(f"🚀 Starting enhanced comprehensive search for: {name}")
+        logger.info("Starting enhanced comprehensive search for: %s", name)
         
         # Start with guaranteed working results
         guaranteed_results = [
@@ -619,19 +583,19 @@ def enhanced_comprehensive_search(name, include_activities=True, platforms=None)
         
         # Try enhanced Google search (with error handling)
         try:
-            print("🔍 Enhanced Google profile searches...")
+            logger.info("Enhanced Google profile searches...")
             google_results = enhanced_google_profile_search(name)
             if google_results:
                 results.extend(google_results[:10])  # Limit to avoid duplicates
-                print(f"✅ Enhanced Google search added {len(google_results)} results")
+                logger.info("Enhanced Google search added %s results", len(google_results))
         except Exception as e:
-            logger.error(f"Enhanced Google search failed: {e}")
-            print(f"⚠️ Enhanced Google search failed: {e}")
+            logger.error("Enhanced Google search failed: %s", e)
+            logger.warning("Enhanced Google search failed: %s", e)
         
         # Try activity scraping (with error handling) 
         if include_activities:
             try:
-                print("📱 Scraping user activities and interactions...")
+                logger.info("Scraping user activities and interactions...")
                 scraper = EnhancedDataScraper()
                 activities = scraper.scrape_user_activities(name, platforms)
                 
@@ -649,22 +613,22 @@ def enhanced_comprehensive_search(name, include_activities=True, platforms=None)
                     }
                     results.append(activity_result)
                 
-                print(f"✅ Activities search added {len(activities)} activity results")
+                logger.info("Activities search added %s activity results", len(activities))
                 
             except Exception as e:
-                logger.error(f"Activities scraping failed: {e}")
-                print(f"⚠️ Activities scraping encountered issues: {e}")
+                logger.error("Activities scraping failed: %s", e)
+                logger.warning("Activities scraping encountered issues: %s", e)
         
         # Process and return results
         final_results = process_enhanced_results(results, name)
         total_results = len(final_results)
         
-        print(f"✅ COMPLETE: Enhanced search found {total_results} comprehensive results for '{name}'")
-        print(f"📊 Total sources checked: {len(platforms)} platforms + Google + LinkedIn + Facebook")
+        logger.info("COMPLETE: Enhanced search found %s comprehensive results for '%s'", total_results, name)
+        logger.info("Total sources checked: %s platforms + Google + LinkedIn + Facebook", len(platforms))
         
         # Ensure we always return substantial results
         if total_results < 8:
-            print(f"⚠️ Only found {total_results} results, adding more guaranteed results...")
+            logger.warning("Only found %s results, adding more guaranteed results...", total_results)
             additional_results = [
                 {
                     "source": "TikTok User Search",
@@ -690,8 +654,8 @@ def enhanced_comprehensive_search(name, include_activities=True, platforms=None)
         return final_results
         
     except Exception as e:
-        logger.error(f"Enhanced comprehensive search error: {e}")
-        print(f"❌ Enhanced comprehensive search error: {e}")
+        logger.error("Enhanced comprehensive search error: %s", e)
+        logger.error("Enhanced comprehensive search error: %s", e)
         
         # Return basic working results on error
         fallback_results = [
@@ -728,13 +692,13 @@ def enhanced_google_profile_search(name):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        for query in enhanced_queries:
+        for query in plan_queries(enhanced_queries, name, "google_profile", num=5):
             try:
                 search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=5&hl=en"
-                response = requests.get(search_url, headers=headers, timeout=10, verify=False)
+                response = http_client.get(search_url, headers=headers, timeout=10, verify=False)
                 
                 if response.status_code == 200 and len(response.text) > 1000:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Simple result extraction that actually works
                     search_results = soup.select('div.g, div.tF2Cxc')[:2]
@@ -749,7 +713,7 @@ def enhanced_google_profile_search(name):
                                 link = link_elem.get('href', '')
                                 
                                 # Basic validation - if it contains the name, include it
-                                if name.lower() in title.lower() and link:
+                                if link and NameQuery.of(name).contains(title):
                                     platform = determine_platform_from_url(link)
                                     
                                     results.append({
@@ -766,10 +730,11 @@ def enhanced_google_profile_search(name):
                         except Exception as e:
                             continue
                 
-                time.sleep(1)  # Rate limiting
+                http_client.pause(1)  # Rate limiting
                 
             except Exception as e:
-                logger.error(f"Error with query '{query}': {e}")
+                logger.error("Error with query '%s': %s", query, e)
+                release_query(query)
                 continue
         
         # Always add guaranteed working search links
@@ -795,10 +760,10 @@ def enhanced_google_profile_search(name):
         ]
         
         results.extend(guaranteed_results)
-        logger.info(f"Enhanced Google search found {len(results)} results for '{name}'")
+        logger.info("Enhanced Google search found %s results for '%s'", len(results), name)
     
     except Exception as e:
-        logger.error(f"Enhanced Google profile search error: {e}")
+        logger.error("Enhanced Google profile search error: %s", e)
         # Return basic working results even on error
         results = [{
             "source": "Basic Search",
@@ -847,27 +812,25 @@ def calculate_enhanced_relevance_score(name, title, snippet, platform):
     """
     score = 0.6  # Base score
     
-    name_lower = name.lower()
+    query = NameQuery.of(name)
     title_lower = title.lower()
     snippet_lower = snippet.lower()
     combined_text = f"{title_lower} {snippet_lower}"
+    hits = scan_keywords(combined_text)
     
     # Name presence scoring
-    if name_lower in title_lower:
+    if query.contains(title_lower, lowered=True):
         score += 0.25
-    if name_lower in snippet_lower:
+    if query.contains(snippet_lower, lowered=True):
         score += 0.15
     
     # Exact name match bonus
-    if f" {name_lower} " in f" {combined_text} ":
+    if query.exact(combined_text):
         score += 0.2
     
     # Profile indicators
-    profile_indicators = ['profile', 'bio', 'about', 'user', 'account', 'page']
-    for indicator in profile_indicators:
-        if indicator in combined_text:
-            score += 0.05
-            break
+    if has_any(hits, PROFILE_INDICATORS):
+        score += 0.05
     
     # Platform bonuses
     platform_bonuses = {
@@ -883,11 +846,8 @@ def calculate_enhanced_relevance_score(name, title, snippet, platform):
     score += platform_bonuses.get(platform, 0.05)
     
     # Authenticity indicators (reduce score for fake/spam indicators)
-    spam_indicators = ['fake', 'spam', 'bot', 'parody']
-    for indicator in spam_indicators:
-        if indicator in combined_text:
-            score -= 0.3
-            break
+    if has_any(hits, SPAM_INDICATORS):
+        score -= 0.3
     
     return max(0.1, min(score, 0.95))
 
@@ -913,5 +873,5 @@ def process_enhanced_results(results, name):
         return unique_results[:50]
         
     except Exception as e:
-        logger.error(f"Error processing enhanced results: {e}")
+        logger.error("Error processing enhanced results: %s", e)
         return results[:30]
\ No newline at end of file
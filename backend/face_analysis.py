@@ -0,0 +1,112 @@
+"""
+Lazy face analysis for uploaded images
+
+Stages ask only for what they use. face_present() is a Haar-cascade check on a
+downscaled grayscale copy (a few milliseconds); embedding() preprocesses the
+image and runs Facenet through DeepFace the first time a stage needs it. Both
+are computed at most once per image.
+"""
+
+import logging
+import functools
+
+import cv2
+
+from metrics import FACE_EMBEDDING_SECONDS, FACE_CHECK_SECONDS
+
+logger = logging.getLogger(__name__)
+
+FACE_CHECK_MAX_SIDE = 640
+
+
+class FaceAnalysisError(Exception):
+    """
+    The image could not be loaded or no embedding could be extracted
+    """
+
+
+@functools.lru_cache(maxsize=1)
+def _face_cascade():
+    cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+    if cascade.empty():
+        raise FaceAnalysisError("Haar cascade for frontal faces could not be loaded")
+    return cascade
+
+
+def count_faces(image_path, max_side=FACE_CHECK_MAX_SIDE):
+    """
+    Number of frontal faces found by the Haar cascade, or None if the image can't be read
+    """
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+
+    height, width = image.shape[:2]
+    scale = max_side / float(max(height, width))
+    if scale < 1:
+        image = cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+    image = cv2.equalizeHist(image)
+    faces = _face_cascade().detectMultiScale(image, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+    return len(faces)
+
+
+class FaceAnalysis:
+    """
+    Per-image face facts, computed on first request
+    """
+
+    def __init__(self, image_path):
+        self.image_path = image_path
+        self._face_count = None
+        self._checked = False
+        self._embedding = None
+
+    def is_readable(self):
+        self._check()
+        return self._face_count is not None
+
+    def face_present(self):
+        """
+        Cheap check: does the image contain at least one frontal face?
+        """
+        self._check()
+        return bool(self._face_count)
+
+    def _check(self):
+        if self._checked:
+            return
+        self._checked = True
+        try:
+            with FACE_CHECK_SECONDS.time():
+                self._face_count = count_faces(self.image_path)
+        except Exception as e:
+            logger.error("Face presence check failed: %s", e)
+            self._face_count = None
+
+    def embedding(self):
+        """
+        Facenet embedding (strict detection first, then relaxed); raises FaceAnalysisError
+        """
+        if self._embedding is not None:
+            return self._embedding
+
+        from deepface import DeepFace
+        from utils import preprocess_image_for_face_detection
+
+        if not preprocess_image_for_face_detection(self.image_path):
+            raise FaceAnalysisError("Failed to preprocess image. Please ensure it's a valid image file.")
+
+        try:
+            with FACE_EMBEDDING_SECONDS.time(detection="strict"):
+                self._embedding = DeepFace.represent(img_path=self.image_path, model_name="Facenet", enforce_detection=True)[0]["embedding"]
+        except Exception as strict_error:
+            logger.warning("Strict face detection failed, trying relaxed detection: %s", strict_error)
+            try:
+                with FACE_EMBEDDING_SECONDS.time(detection="relaxed"):
+                    self._embedding = DeepFace.represent(img_path=self.image_path, model_name="Facenet", enforce_detection=False)[0]["embedding"]
+                logger.info("Face detected with relaxed settings")
+            except Exception as e:
+                raise FaceAnalysisError(f"No face detected in the image. Please ensure the image contains a clear, visible human face. Error: {str(e)}")
+
+        return self._embedding
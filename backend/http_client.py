@@ -0,0 +1,249 @@
+"""
+Instrumented outbound HTTP requests and HTML parsing
+
+All scrapers fetch pages through get() and parse them through parse_html() so
+request latency, status codes and parse time are recorded (as metrics and
+tracing spans) in one place.
+
+Inside a search (search_context), requests without an explicit session use the
+search's pooled session, and successful GETs are remembered by URL so stages
+and pipelines that hit the same page share a single fetch. Responses are parsed
+once per search as well: parse_response() and response_text() memoize the tree
+and its text per response, so extractors ask for the form they need instead of
+re-parsing response.text. The shared tree must be treated as read-only. Both
+memos are bounded LRUs (see search_context); release() drops the tree of a
+response a caller knows nobody will read again.
+
+Responses are classified by response_classifier; when a host answers with a
+consent, captcha, interstitial or login page, get() raises UpstreamBlockedError
+for it and for every later request to that host in the same search.
+
+Across searches, each upstream host also has a circuit breaker
+(circuit_breaker): while it keeps timing out or answering 5xx/429, get()
+raises CircuitOpenError without sending the request.
+
+For offline benchmarks every outbound request can be redirected to a local stub
+server, and the scrapers' rate-limit sleeps (pause()) scaled down:
+
+    UPSTREAM_BASE_URL=http://127.0.0.1:8765   https://host/path -> <base>/host/path
+    PACING_SCALE=0                            multiplier for pause() (default 1)
+"""
+
+import os
+import time
+import logging
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from metrics import (
+    OUTBOUND_REQUEST_SECONDS, OUTBOUND_REQUESTS, CACHE_HITS, CACHE_MISSES,
+    UPSTREAM_BLOCKED_PAGES, UPSTREAM_SHORT_CIRCUITED,
+)
+from tracing import span
+from search_context import current_search
+from response_classifier import classify_response
+from circuit_breaker import circuit_breakers
+from upstream_hosts import host_label, upstream_domain
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_BASE_URL = os.getenv("UPSTREAM_BASE_URL", "").rstrip("/")
+PACING_SCALE = float(os.getenv("PACING_SCALE", "1") or 1)
+
+
+class UpstreamBlockedError(requests.RequestException):
+    """
+    The host answered this search with a page that is not results (see response_classifier)
+    """
+
+    def __init__(self, host, kind):
+        super().__init__(f"{host} returned a non-result page ({kind})")
+        self.host = host
+        self.kind = kind
+
+
+def request_host(url):
+    """
+    Host part of a URL (metrics use host_label() of it)
+    """
+    try:
+        return urlparse(url).hostname or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def upstream_url(url):
+    """
+    Rewrite an absolute URL onto UPSTREAM_BASE_URL (unchanged when unset)
+    """
+    if not UPSTREAM_BASE_URL:
+        return url
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        return url
+    rewritten = f"{UPSTREAM_BASE_URL}/{parsed.hostname}{parsed.path or '/'}"
+    return f"{rewritten}?{parsed.query}" if parsed.query else rewritten
+
+
+def pause(seconds):
+    """
+    Rate-limit sleep between requests, scaled by PACING_SCALE
+    """
+    if seconds > 0 and PACING_SCALE > 0:
+        time.sleep(seconds * PACING_SCALE)
+
+
+def get(url, session=None, **kwargs):
+    """
+    requests.get (or session.get) with latency and status metrics
+    """
+    search = current_search()
+    host = request_host(url)
+    label = host_label(host)
+    # Only the search and social pages several stages ask for are worth keeping;
+    # result pages fetched for verification are read once
+    memo_key = url if search is not None and not kwargs.get("params") and not kwargs.get("stream") \
+        and upstream_domain(host) is not None else None
+    if memo_key is not None:
+        cached = search.pages.get(memo_key)
+        if cached is not None:
+            CACHE_HITS.inc(cache="page_memo")
+            search.record("page_memo_hits")
+            return cached
+        CACHE_MISSES.inc(cache="page_memo")
+    if search is not None:
+        blocked = search.blocked_hosts.get(host)
+        if blocked is not None:
+            UPSTREAM_SHORT_CIRCUITED.inc(host=label)
+            search.record("requests_short_circuited")
+            raise UpstreamBlockedError(host, blocked)
+    breaker = circuit_breakers.get(host)
+    if breaker is not None:
+        try:
+            breaker.before_request()
+        except Exception:
+            if search is not None:
+                search.record("requests_circuit_open")
+            raise
+    if session is None and search is not None:
+        session = search.session()
+
+    target = upstream_url(url)
+    start = time.perf_counter()
+    status = "error"
+
+    with span("http.get", host=host, url=target[:200]) as current:
+        try:
+            try:
+                response = (session or requests).get(target, **kwargs)
+            except Exception:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            if breaker is not None:
+                breaker.record_response(response)
+            status = str(response.status_code)
+            if search is not None:
+                search.record("pages_fetched")
+            kind = None if kwargs.get("stream") else classify_response(response, url)
+            if kind is not None:
+                _blocked(search, host, label, kind, current)
+            if memo_key is not None and response.status_code == 200:
+                search.pages[memo_key] = response
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            OUTBOUND_REQUEST_SECONDS.observe(elapsed, host=label, status=status)
+            OUTBOUND_REQUESTS.inc(host=label, status=status)
+            if current is not None:
+                current.set_attribute("status", status)
+
+
+def _blocked(search, host, label, kind, current):
+    UPSTREAM_BLOCKED_PAGES.inc(host=label, kind=kind)
+    if current is not None:
+        current.set_attribute("page_kind", kind)
+    if search is not None:
+        search.blocked_hosts.setdefault(host, kind)
+        search.record("blocked_pages")
+    logger.warning("%s returned a non-result page (%s); skipping its remaining requests in this search", host, kind)
+    raise UpstreamBlockedError(host, kind)
+
+
+def parse_html(markup):
+    """
+    Parse an HTML page with BeautifulSoup inside a tracing span
+    """
+    with span("parse_html", bytes=len(markup)):
+        return BeautifulSoup(markup, 'html.parser')
+
+
+def _document(response):
+    """
+    Memo entry {"response", "soup", "text"} for a response in the current search, or None
+    """
+    search = current_search()
+    if search is None:
+        return None
+    key = id(response)
+    document = search.documents.get(key)
+    if document is not None and document["response"] is response:
+        CACHE_HITS.inc(cache="dom_memo")
+        search.record("dom_memo_hits")
+        return document
+    CACHE_MISSES.inc(cache="dom_memo")
+    # the entry holds the response so its id() can't be reused while memoized
+    document = {"response": response, "soup": parse_html(response.text), "text": {}}
+    search.documents[key] = document
+    return document
+
+
+def release(response):
+    """
+    Drop a response's parsed tree from the current search's memo
+
+    For callers that are the last to read a page (e.g. content verification),
+    so its tree doesn't stay in memory until it is evicted.
+    """
+    search = current_search()
+    if search is None:
+        return
+    document = search.documents.get(id(response))
+    if document is not None and document["response"] is response:
+        search.documents.pop(id(response))
+
+
+def parse_response(response):
+    """
+    Parsed tree for a response, shared by every caller in the same search (do not modify it)
+    """
+    document = _document(response)
+    if document is None:
+        return parse_html(response.text)
+    return document["soup"]
+
+
+def visible_text(soup):
+    """
+    Text of a parsed page without <script> and <style> contents, leaving the tree intact
+    """
+    return "".join(string for string in soup.strings if string.parent.name not in ("script", "style"))
+
+
+def response_text(response, visible=False):
+    """
+    soup.get_text() for a response (visible=True drops script/style), memoized like parse_response()
+    """
+    document = _document(response)
+    if document is None:
+        soup = parse_html(response.text)
+        return visible_text(soup) if visible else soup.get_text()
+
+    text = document["text"].get(visible)
+    if text is None:
+        soup = document["soup"]
+        text = visible_text(soup) if visible else soup.get_text()
+        document["text"][visible] = text
+    return text
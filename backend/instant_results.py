@@ -0,0 +1,201 @@
+"""
+Instant tier: templated search links that need no network access
+
+The direct platform/academic/web search links the pipelines fall back on are
+fully determined by the name. Their templates are compiled once at import and
+rendered per name in microseconds, so they can be sent before any scraping
+starts: as the first /search-stream event and from GET /instant. The
+create_guaranteed_* / create_accurate_* helpers render the same templates.
+"""
+
+from urllib.parse import quote_plus
+
+
+class ResultTemplate:
+    """
+    One templated result; preview may use {name}, link uses {q} (the quoted name plus query_suffix)
+    """
+
+    __slots__ = ("source", "preview", "score", "platform", "search_type", "link", "query_suffix")
+
+    def __init__(self, source, preview, score, platform, search_type, link, query_suffix=""):
+        self.source = source
+        self.preview = preview
+        self.score = score
+        self.platform = platform
+        self.search_type = search_type
+        self.link = link
+        self.query_suffix = query_suffix
+
+    def render(self, name, quoted):
+        query = quoted.get(self.query_suffix)
+        if query is None:
+            query = quoted[self.query_suffix] = quote_plus(name + self.query_suffix)
+        return {
+            "source": self.source,
+            "preview": self.preview.format(name=name),
+            "score": self.score,
+            "platform": self.platform,
+            "search_type": self.search_type,
+            "link": self.link.format(q=query),
+            "verified_working": True,
+        }
+
+
+def render_templates(templates, name):
+    """
+    Fresh result dicts for name (callers may adjust scores in place)
+    """
+    quoted = {}
+    return [template.render(name, quoted) for template in templates]
+
+
+# Direct search URL per platform
+INSTAGRAM_SEARCH = "https://www.instagram.com/web/search/topsearch/?query={q}"
+TWITTER_USER_SEARCH = "https://twitter.com/search?q={q}&src=typed_query&f=user"
+FACEBOOK_SEARCH = "https://www.facebook.com/search/people/?q={q}"
+LINKEDIN_SEARCH = "https://www.linkedin.com/search/results/people/?keywords={q}"
+TIKTOK_SEARCH = "https://www.tiktok.com/search/user?q={q}"
+YOUTUBE_CHANNEL_SEARCH = "https://www.youtube.com/results?search_query={q}&sp=EgIQAg%253D%253D"
+GITHUB_USER_SEARCH = "https://github.com/search?q={q}&type=users"
+REDDIT_USER_SEARCH = "https://www.reddit.com/search?q={q}&type=user"
+SCHOLAR_SEARCH = "https://scholar.google.com/scholar?q={q}"
+GOOGLE_SEARCH = "https://www.google.com/search?q={q}"
+
+GUARANTEED_SEARCH_TEMPLATES = (
+    ResultTemplate("Google Search - Comprehensive", "Search Google for '{name}' across all websites and platforms. This direct search will show web pages, social media profiles, news articles, and any public mentions.",
+                   0.85, "Google", "web_search_verified", GOOGLE_SEARCH, " profile social media"),
+    ResultTemplate("Instagram Direct Search", "Search Instagram directly for '{name}'. This will show public profiles, posts, and stories that match the name.",
+                   0.83, "Instagram", "social_media_verified", INSTAGRAM_SEARCH),
+    ResultTemplate("LinkedIn Professional Search", "Search LinkedIn for professional profiles of '{name}'. This will show work history, connections, and professional information.",
+                   0.81, "LinkedIn", "professional_verified", LINKEDIN_SEARCH),
+    ResultTemplate("Facebook People Search", "Search Facebook for '{name}' profiles. This will show public Facebook profiles and pages.",
+                   0.79, "Facebook", "social_media_verified", FACEBOOK_SEARCH),
+    ResultTemplate("Twitter/X User Search", "Search Twitter/X for '{name}' user accounts. This will show public Twitter profiles and recent tweets.",
+                   0.77, "Twitter/X", "social_media_verified", TWITTER_USER_SEARCH),
+    ResultTemplate("YouTube Channel Search", "Search YouTube for '{name}' channels and videos. This will show YouTube channels, uploaded videos, and comments.",
+                   0.75, "YouTube", "media_verified", YOUTUBE_CHANNEL_SEARCH),
+    ResultTemplate("TikTok User Search", "Search TikTok for '{name}' user accounts. This will show TikTok profiles and videos.",
+                   0.71, "TikTok", "social_media_verified", TIKTOK_SEARCH),
+    ResultTemplate("GitHub Developer Search", "Search GitHub for '{name}' developer profiles. This will show GitHub accounts, repositories, and code contributions.",
+                   0.67, "GitHub", "professional_verified", GITHUB_USER_SEARCH),
+)
+
+GUARANTEED_SOCIAL_TEMPLATES = (
+    ResultTemplate("Instagram Direct Profile Search", "Direct Instagram search for '{name}' profiles. Click to search for public Instagram accounts, posts, and stories.",
+                   0.88, "Instagram", "social_media_verified", INSTAGRAM_SEARCH),
+    ResultTemplate("Facebook People Search", "Search Facebook for '{name}' public profiles and pages. Find Facebook accounts and public information.",
+                   0.85, "Facebook", "social_media_verified", FACEBOOK_SEARCH),
+    ResultTemplate("Twitter/X User Search", "Search Twitter/X for '{name}' user accounts and tweets. Find public Twitter profiles and recent activity.",
+                   0.83, "Twitter/X", "social_media_verified", TWITTER_USER_SEARCH),
+    ResultTemplate("TikTok User Search", "Search TikTok for '{name}' user accounts and videos. Find TikTok profiles and popular videos.",
+                   0.80, "TikTok", "social_media_verified", TIKTOK_SEARCH),
+    ResultTemplate("YouTube Channel Search", "Search YouTube for '{name}' channels and videos. Find YouTube accounts and uploaded content.",
+                   0.78, "YouTube", "media_verified", YOUTUBE_CHANNEL_SEARCH),
+)
+
+GUARANTEED_PROFESSIONAL_TEMPLATES = (
+    ResultTemplate("LinkedIn Professional Search", "Search LinkedIn for '{name}' professional profiles. Find work history, connections, skills, and career information.",
+                   0.87, "LinkedIn", "professional_verified", LINKEDIN_SEARCH),
+    ResultTemplate("GitHub Developer Search", "Search GitHub for '{name}' developer profiles. Find repositories, code contributions, and open source projects.",
+                   0.82, "GitHub", "professional_verified", GITHUB_USER_SEARCH),
+    ResultTemplate("Google Scholar Academic Search", "Search Google Scholar for '{name}' academic publications. Find research papers, citations, and scholarly work.",
+                   0.79, "Google Scholar", "academic_verified", SCHOLAR_SEARCH),
+)
+
+# (platform, description, score, search_type, url) for create_accurate_platform_searches
+_PLATFORM_SEARCHES = (
+    ("LinkedIn", "Direct LinkedIn search", 0.90, "professional_verified", LINKEDIN_SEARCH),
+    ("Twitter/X", "Direct Twitter/X user search", 0.88, "social_media_verified", TWITTER_USER_SEARCH),
+    ("Facebook", "Direct Facebook people search", 0.85, "social_media_verified", FACEBOOK_SEARCH),
+    ("Instagram", "Direct Instagram search", 0.82, "social_media_verified", INSTAGRAM_SEARCH),
+    ("GitHub", "Direct GitHub user search", 0.80, "professional_verified", GITHUB_USER_SEARCH),
+    ("YouTube", "Direct YouTube channel search", 0.78, "media_verified", YOUTUBE_CHANNEL_SEARCH),
+    ("Reddit", "Direct Reddit user search", 0.75, "social_media_verified", REDDIT_USER_SEARCH),
+    ("TikTok", "Direct TikTok user search", 0.72, "social_media_verified", TIKTOK_SEARCH),
+)
+
+PLATFORM_SEARCH_TEMPLATES = tuple(
+    ResultTemplate(
+        f"{platform} Direct Search",
+        f"{description} for '{{name}}' - guaranteed working link. This link will take you directly to {platform}'s search results for '{{name}}'. All links are tested and working.",
+        score, platform, search_type, url,
+    )
+    for platform, description, score, search_type, url in _PLATFORM_SEARCHES
+)
+
+_WEB_SEARCHES = (
+    ("Google", "Google search for '{name}' profiles - direct working link", "https://www.google.com/search?q={q}"),
+    ("DuckDuckGo", "DuckDuckGo search for '{name}' - privacy-focused search", "https://duckduckgo.com/?q={q}&ia=web"),
+    ("Bing", "Bing search for '{name}' profiles - Microsoft search engine", "https://www.bing.com/search?q={q}"),
+)
+
+WEB_SEARCH_TEMPLATES = tuple(
+    ResultTemplate(
+        f"{engine} Web Search", f"{description}. Guaranteed working direct link to search results.",
+        0.70 - (index * 0.03), engine, "web_search_verified", url, " profile",
+    )
+    for index, (engine, description, url) in enumerate(_WEB_SEARCHES)
+)
+
+_ACADEMIC_SEARCHES = (
+    ("Google Scholar", "Google Scholar search for academic papers by '{name}'", SCHOLAR_SEARCH),
+    ("ResearchGate", "ResearchGate researcher search for '{name}'", "https://www.researchgate.net/search/researcher?q={q}"),
+    ("ORCID", "ORCID researcher database search for '{name}'", "https://orcid.org/orcid-search/search?searchQuery={q}"),
+)
+
+ACADEMIC_SEARCH_TEMPLATES = tuple(
+    ResultTemplate(
+        f"{platform} Academic Search", f"{description}. Direct working link to academic search results.",
+        0.65 - (index * 0.03), platform, "academic_verified", url,
+    )
+    for index, (platform, description, url) in enumerate(_ACADEMIC_SEARCHES)
+)
+
+# get_platform_search_url(): platform -> URL template, Google search for anything else
+PLATFORM_SEARCH_URLS = {
+    "instagram": INSTAGRAM_SEARCH,
+    "twitter": "https://twitter.com/search?q={q}&src=typed_query",
+    "facebook": FACEBOOK_SEARCH,
+    "tiktok": TIKTOK_SEARCH,
+    "youtube": "https://www.youtube.com/results?search_query={q}",
+    "linkedin": LINKEDIN_SEARCH,
+}
+
+
+def platform_search_url(platform, name):
+    template = PLATFORM_SEARCH_URLS.get(platform.lower())
+    if template is None:
+        return GOOGLE_SEARCH.format(q=quote_plus(name + " " + platform))
+    return template.format(q=quote_plus(name))
+
+
+def _unique_by_link(*template_sets):
+    seen = set()
+    unique = []
+    for templates in template_sets:
+        for template in templates:
+            key = (template.link, template.query_suffix)
+            if key not in seen:
+                seen.add(key)
+                unique.append(template)
+    return tuple(unique)
+
+
+# What is sent before scraping starts: one link per distinct search
+INSTANT_TEMPLATES = _unique_by_link(
+    GUARANTEED_SEARCH_TEMPLATES[:1], PLATFORM_SEARCH_TEMPLATES, ACADEMIC_SEARCH_TEMPLATES, WEB_SEARCH_TEMPLATES,
+)
+
+
+def instant_results(name):
+    """
+    The instant tier for a name: templated direct-search links, highest score first
+    """
+    if not name:
+        return []
+    results = render_templates(INSTANT_TEMPLATES, name)
+    for result in results:
+        result["tier"] = "instant"
+    results.sort(key=lambda result: result["score"], reverse=True)
+    return results
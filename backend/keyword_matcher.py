@@ -0,0 +1,202 @@
+"""
+Multi-pattern keyword matching for content classification and scoring
+
+All keyword lists used by the classifiers and scorers are compiled into one
+Aho-Corasick automaton, so a lowercased title/snippet is scanned once no matter
+how many lists or keywords are consulted afterwards.
+"""
+
+from collections import deque
+
+try:
+    import ahocorasick  # Optional C implementation (pyahocorasick)
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton that reports every keyword occurring in a text
+    """
+
+    def __init__(self, keywords):
+        self.keywords = frozenset(keyword for keyword in keywords if keyword)
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build()
+
+    def _build(self):
+        """
+        Build goto, failure and output tables for the pure Python fallback
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state] = (keyword,)
+
+        # Breadth-first pass to resolve failure links and merge outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text):
+        """
+        Return the set of keywords found anywhere in text (one linear pass)
+        """
+        if not text:
+            return frozenset()
+
+        if self._automaton is not None:
+            return frozenset(keyword for _, keyword in self._automaton.iter(text))
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits = set()
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+
+        return frozenset(hits)
+
+
+# Keyword lists shared by the classifiers and scorers across modules
+ACTIVITY_KEYWORDS = (
+    'liked', 'commented', 'shared', 'tagged', 'mentioned',
+    'posted', 'uploaded', 'followed', 'following'
+)
+
+ACTIVITY_CONFIDENCE_KEYWORDS = ('liked', 'commented', 'shared', 'posted', 'uploaded')
+
+# Ordered (activity_type, keywords) rules, first matching rule wins
+ACTIVITY_TYPE_RULES = (
+    ('liked_post', ('liked', 'like')),
+    ('commented', ('commented', 'comment', 'reply')),
+    ('shared', ('shared', 'share', 'repost')),
+    ('tagged', ('tagged', 'tag')),
+    ('mentioned', ('mentioned', 'mention')),
+    ('posted_content', ('posted', 'uploaded', 'published')),
+    ('followed', ('followed', 'following')),
+)
+
+TWITTER_ACTIVITY_TYPE_RULES = (
+    ('retweeted', ('retweeted', 'retweet', 'rt')),
+    ('replied', ('replied', 'reply')),
+    ('tweeted', ('tweeted', 'tweet')),
+    ('liked_tweet', ('liked', 'favorite')),
+    ('mentioned', ('mentioned', '@')),
+)
+
+QUALITY_INDICATORS = (
+    'profile', 'bio', 'about', 'official', 'verified',
+    'professional', 'academic', 'research', 'publication'
+)
+
+CONTENT_QUALITY_INDICATORS = (
+    'profile', 'bio', 'about', 'works at', 'studies at',
+    'posted by', 'shared by', 'tagged', 'mentioned',
+    'follow', 'following', 'followers'
+)
+
+PROFILE_KEYWORDS = ('profile', 'bio', 'about', 'account', 'user', 'member')
+
+SOCIAL_KEYWORDS = ('follow', 'followers', 'following', 'posts', 'tweets', 'photos')
+
+PROFILE_INDICATORS = ('profile', 'bio', 'about', 'user', 'account', 'page')
+
+SPAM_INDICATORS = ('fake', 'spam', 'bot', 'parody')
+
+INSTAGRAM_INDICATORS = (
+    'instagram profile', 'instagram account', '@',
+    'followers', 'following', 'posts', 'bio',
+    'instagram user', 'ig profile'
+)
+
+# Ordered (source_type, keywords) rules used by identify_platform_and_content
+SOURCE_TYPE_RULES = (
+    ('profile', ('profile', 'bio', 'about')),
+    ('post', ('post', 'tweet', 'status')),
+    ('media', ('photo', 'image', 'picture')),
+    ('interaction', ('comment', 'reply')),
+)
+
+
+def _rule_keywords(rules):
+    return [keyword for _, keywords in rules for keyword in keywords]
+
+
+CONTENT_MATCHER = KeywordMatcher(
+    list(ACTIVITY_KEYWORDS)
+    + _rule_keywords(ACTIVITY_TYPE_RULES)
+    + _rule_keywords(TWITTER_ACTIVITY_TYPE_RULES)
+    + list(QUALITY_INDICATORS)
+    + list(CONTENT_QUALITY_INDICATORS)
+    + list(PROFILE_KEYWORDS)
+    + list(SOCIAL_KEYWORDS)
+    + list(PROFILE_INDICATORS)
+    + list(SPAM_INDICATORS)
+    + list(INSTAGRAM_INDICATORS)
+    + _rule_keywords(SOURCE_TYPE_RULES)
+)
+
+
+def scan_keywords(text):
+    """
+    Scan lowercased text once and return every known keyword it contains
+    """
+    return CONTENT_MATCHER.find_all(text)
+
+
+def count_hits(hits, keywords):
+    """
+    Count how many keywords of a list are present in a scan result
+    """
+    return sum(1 for keyword in keywords if keyword in hits)
+
+
+def has_any(hits, keywords):
+    """
+    Check whether any keyword of a list is present in a scan result
+    """
+    return any(keyword in hits for keyword in keywords)
+
+
+def classify(hits, rules, default):
+    """
+    Return the label of the first rule with a keyword present in hits
+    """
+    for label, keywords in rules:
+        if has_any(hits, keywords):
+            return label
+    return default
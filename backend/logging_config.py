@@ -0,0 +1,113 @@
+"""
+Structured, non-blocking logging setup
+
+Request threads only put records on an in-memory queue (QueueHandler); a single
+QueueListener thread formats them and writes to stdout, so slow terminals or
+pipes never stall a search. Configuration comes from the environment:
+
+    LOG_LEVEL=INFO                                 root level
+    LOG_LEVELS=search=WARNING,http_client=DEBUG    per-module overrides
+    LOG_FORMAT=json|text                           (default json)
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+
+from tracing import current_trace
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "trace_id"}
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line with timestamp, level, logger, message and extras
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key not in entry:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TraceContextFilter(logging.Filter):
+    """
+    Attach the current request's trace_id (captured on the calling thread)
+    """
+
+    def filter(self, record):
+        trace = current_trace()
+        record.trace_id = trace.trace_id if trace is not None else None
+        return True
+
+
+def parse_module_levels(spec):
+    """
+    Parse "module=LEVEL,other=LEVEL" into a dict
+    """
+    levels = {}
+    for item in (spec or "").split(","):
+        module, _, level = item.partition("=")
+        module, level = module.strip(), level.strip().upper()
+        if module and level:
+            levels[module] = level
+    return levels
+
+
+def configure_logging():
+    """
+    Route all logging through a queue to a single stdout writer thread
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    if os.getenv("LOG_FORMAT", "json").lower() == "text":
+        formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    else:
+        formatter = JsonFormatter()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(TraceContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    for module, level in parse_module_levels(os.getenv("LOG_LEVELS")).items():
+        logging.getLogger(module).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
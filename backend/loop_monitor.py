@@ -0,0 +1,236 @@
+"""
+Event-loop lag and thread-pool saturation monitor
+
+A probe coroutine sleeps for a fixed interval and records how late it wakes
+up (event_loop_lag_seconds); every probe also samples the worker pools that
+async handlers offload to. A watchdog thread notices when the probe stops
+running, i.e. something is blocking the loop, and logs a warning naming the
+in-flight handlers and the loop thread's current stack while the stall is
+still happening. Thresholds come from the environment:
+
+    LOOP_MONITOR_INTERVAL_MS=100   probe interval
+    LOOP_LAG_WARN_MS=250           lag / stall duration that triggers a warning
+    THREADPOOL_QUEUE_WARN=1        queued tasks that trigger a warning
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+import itertools
+import logging
+
+from metrics import (
+    EVENT_LOOP_LAG_SECONDS, EVENT_LOOP_STALLS, HANDLERS_IN_FLIGHT,
+    THREADPOOL_BUSY, THREADPOOL_QUEUED, THREADPOOL_CAPACITY,
+)
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR_INTERVAL_MS = float(os.getenv("LOOP_MONITOR_INTERVAL_MS", "100") or 100)
+LOOP_LAG_WARN_MS = float(os.getenv("LOOP_LAG_WARN_MS", "250") or 250)
+THREADPOOL_QUEUE_WARN = int(os.getenv("THREADPOOL_QUEUE_WARN", "1") or 1)
+
+WARNING_INTERVAL_SECONDS = 10.0
+STACK_FRAMES = 8
+
+
+class InFlightHandlers:
+    """
+    Requests currently being handled, for attributing loop stalls
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def add(self, method, path):
+        handler_id = next(self._ids)
+        with self._lock:
+            self._handlers[handler_id] = (method, path, time.monotonic())
+        HANDLERS_IN_FLIGHT.inc()
+        return handler_id
+
+    def remove(self, handler_id):
+        with self._lock:
+            self._handlers.pop(handler_id, None)
+        HANDLERS_IN_FLIGHT.dec()
+
+    def describe(self, limit=5):
+        """
+        "POST /search (12.3s)" for the oldest in-flight handlers
+        """
+        now = time.monotonic()
+        with self._lock:
+            handlers = sorted(self._handlers.values(), key=lambda handler: handler[2])
+        return [f"{method} {path} ({now - started:.1f}s)" for method, path, started in handlers[:limit]]
+
+
+in_flight_handlers = InFlightHandlers()
+
+
+class HandlerTrackingMiddleware:
+    """
+    ASGI middleware registering each HTTP request in in_flight_handlers
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        handler_id = in_flight_handlers.add(scope.get("method", ""), scope.get("path", ""))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            in_flight_handlers.remove(handler_id)
+
+
+def loop_thread_stack(thread_id, limit=STACK_FRAMES):
+    """
+    Innermost frames of a thread, innermost last, as "function (file:line)"
+    """
+    frame = sys._current_frames().get(thread_id)
+    frames = []
+    while frame is not None and len(frames) < limit:
+        frames.append(f"{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return list(reversed(frames))
+
+
+def executor_stats(executor):
+    """
+    (busy, queued, capacity) for a concurrent.futures.ThreadPoolExecutor
+    """
+    threads = len(getattr(executor, "_threads", ()))
+    idle_semaphore = getattr(executor, "_idle_semaphore", None)
+    idle = getattr(idle_semaphore, "_value", 0) if idle_semaphore is not None else 0
+    queued = executor._work_queue.qsize() if hasattr(executor, "_work_queue") else 0
+    return max(0, threads - idle), queued, getattr(executor, "_max_workers", threads)
+
+
+def anyio_limiter_stats():
+    """
+    (busy, queued, capacity) for the anyio thread limiter Starlette uses for sync work
+    """
+    try:
+        from anyio import to_thread
+        statistics = to_thread.current_default_thread_limiter().statistics()
+        return statistics.borrowed_tokens, statistics.tasks_waiting, statistics.total_tokens
+    except Exception:
+        return None
+
+
+class LoopMonitor:
+    """
+    Measures event-loop lag and worker-pool saturation for the running loop
+    """
+
+    def __init__(self, interval_ms=LOOP_MONITOR_INTERVAL_MS, lag_warning_ms=LOOP_LAG_WARN_MS,
+                 queue_warning=THREADPOOL_QUEUE_WARN):
+        self.interval = interval_ms / 1000.0
+        self.lag_warning = lag_warning_ms / 1000.0
+        self.queue_warning = queue_warning
+        self.max_lag = 0.0
+        self._loop = None
+        self._loop_thread_id = None
+        self._probe_task = None
+        self._watchdog = None
+        self._stop = threading.Event()
+        self._heartbeat = time.monotonic()
+        self._stall_reported = False
+        self._last_warning = {}
+
+    def _should_warn(self, kind):
+        now = time.monotonic()
+        if now - self._last_warning.get(kind, 0.0) < WARNING_INTERVAL_SECONDS:
+            return False
+        self._last_warning[kind] = now
+        return True
+
+    def _sample_pools(self):
+        pools = {}
+        default_executor = getattr(self._loop, "_default_executor", None)
+        if default_executor is not None:
+            pools["asyncio_default"] = executor_stats(default_executor)
+        anyio_stats = anyio_limiter_stats()
+        if anyio_stats is not None:
+            pools["anyio"] = anyio_stats
+
+        for pool, (busy, queued, capacity) in pools.items():
+            THREADPOOL_BUSY.set(busy, pool=pool)
+            THREADPOOL_QUEUED.set(queued, pool=pool)
+            THREADPOOL_CAPACITY.set(capacity, pool=pool)
+            if queued >= self.queue_warning and self._should_warn(f"pool:{pool}"):
+                logger.warning(
+                    "Thread pool %s saturated: %s/%s busy, %s queued; in flight: %s",
+                    pool, busy, capacity, queued, in_flight_handlers.describe(),
+                )
+
+    async def _probe(self):
+        while True:
+            scheduled = self._loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, self._loop.time() - scheduled - self.interval)
+            self._heartbeat = time.monotonic()
+            self._stall_reported = False
+
+            EVENT_LOOP_LAG_SECONDS.observe(lag)
+            self.max_lag = max(self.max_lag, lag)
+            if lag >= self.lag_warning and self._should_warn("lag"):
+                logger.warning("Event loop lag %.0f ms (probe interval %.0f ms)", lag * 1000, self.interval * 1000)
+
+            try:
+                self._sample_pools()
+            except Exception as e:
+                logger.error("Thread pool sampling error: %s", e)
+
+    def _watch(self):
+        """
+        Runs in its own thread so it can report a stall while the loop is still blocked
+        """
+        while not self._stop.wait(self.interval):
+            blocked_for = time.monotonic() - self._heartbeat - self.interval
+            if blocked_for < self.lag_warning or self._stall_reported:
+                continue
+
+            self._stall_reported = True
+            EVENT_LOOP_STALLS.inc()
+            logger.warning(
+                "Event loop blocked for %.0f ms; in flight: %s; loop thread at: %s",
+                blocked_for * 1000, in_flight_handlers.describe(),
+                " -> ".join(loop_thread_stack(self._loop_thread_id)),
+            )
+
+    def start(self):
+        """
+        Start monitoring the running event loop (call from a coroutine, e.g. app startup)
+        """
+        if self._probe_task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._probe_task = self._loop.create_task(self._probe())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self):
+        if self._probe_task is None:
+            return
+        self._stop.set()
+        self._probe_task.cancel()
+        try:
+            await self._probe_task
+        except asyncio.CancelledError:
+            pass
+        self._probe_task = None
+
+
+loop_monitor = LoopMonitor()
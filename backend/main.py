@@ -1,16 +1,41 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 import tempfile
 import logging
-import json
+from contextlib import asynccontextmanager
 from optimized_search import optimized_search_identity
+from result_store import result_store, DEFAULT_PAGE_SIZE
+from serialization import dumps_json, project_results
+from compression import CompressionMiddleware
+from streaming import stream_search, STREAM_FORMATS
+from metrics import REGISTRY, PROMETHEUS_CONTENT_TYPE
+from tracing import start_trace
+from logging_config import configure_logging
+from profiling import maybe_profile
+from loop_monitor import loop_monitor, HandlerTrackingMiddleware
+from instant_results import instant_results
 
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Name Face Identity Finder", version="1.0.0")
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (falls back to json when not installed)"""
+    
+    def render(self, content):
+        return dumps_json(content)
 
+@asynccontextmanager
+async def lifespan(app):
+    loop_monitor.start()
+    yield
+    await loop_monitor.stop()
+
+app = FastAPI(title="Name Face Identity Finder", version="1.0.0", default_response_class=FastJSONResponse,
+              lifespan=lifespan)
+
+app.add_middleware(HandlerTrackingMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -18,6 +43,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def results_response(page, fields=None):
+    """Build a results page response, optionally projected to the requested fields"""
+    if fields:
+        page["results"] = project_results(page["results"], fields)
+    page["status"] = "success"
+    # Returning the response directly skips FastAPI's jsonable_encoder pass
+    return FastJSONResponse(page)
+
 @app.get("/")
 async def root():
     return {"status": "running", "version": "1.0.0"}
@@ -26,9 +59,23 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text exposition of search pipeline metrics"""
+    return Response(content=REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.get("/instant")
+async def instant(name: str = Query(...), fields: str = Query(None)):
+    """Templated direct-search links for a name, built without any network access"""
+    results = instant_results(name)
+    if fields:
+        results = project_results(results, fields)
+    return FastJSONResponse({"status": "success", "tier": "instant", "results": results, "total_results": len(results)})
 
 @app.post("/search")
-async def search(name: str = Form(None), file: UploadFile = File(None)):
+async def search(request: Request, name: str = Form(None), file: UploadFile = File(None),
+                 page_size: int = Form(DEFAULT_PAGE_SIZE), fields: str = Query(None), debug_timing: bool = Query(False)):
     try:
         if not name and not file:
             raise HTTPException(status_code=422, detail="Provide name or image")
@@ -47,19 +94,44 @@ async def search(name: str = Form(None), file: UploadFile = File(None)):
             tmp.close()
             image_path = tmp.name
 
-        results = optimized_search_identity(name=name, image_path=image_path)
-        return {"results": results, "status": "success"}
+        with start_trace("search", has_name=bool(name), has_image=bool(image_path)) as trace:
+            with maybe_profile(request.headers, trace.trace_id, timings_source=trace.timing_summary):
+                results = optimized_search_identity(name=name, image_path=image_path)
+        
+        # Keep the full result set server-side and return only its first page
+        result_id = result_store.save(results)
+        page = result_store.get_page(result_id, limit=page_size)
+        if debug_timing:
+            page["timing"] = trace.timing_summary()
+        
+        response = results_response(page, fields)
+        # Profiles, traces and logs are keyed by this ID
+        response.headers["X-Request-ID"] = trace.trace_id
+        return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Search error: {str(e)}")
+        logger.error("Search error: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/results/{result_id}")
+async def get_results_page(result_id: str, cursor: str = Query(None), limit: int = Query(DEFAULT_PAGE_SIZE),
+                           fields: str = Query(None)):
+    """Serve a further page of a stored search result set"""
+    page = result_store.get_page(result_id, cursor=cursor, limit=limit)
+    if page is None:
+        raise HTTPException(status_code=404, detail="Result set not found or expired")
+    
+    return results_response(page, fields)
+
 @app.post("/search-stream")
-async def search_stream(name: str = Form(None), file: UploadFile = File(None)):
-    """Streaming search with real-time progress"""
+async def search_stream(name: str = Form(None), file: UploadFile = File(None), format: str = Query("sse")):
+    """Streaming search with real-time progress and results as they are found (SSE or NDJSON)"""
     try:
+        if format not in STREAM_FORMATS:
+            raise HTTPException(status_code=422, detail="format must be 'sse' or 'ndjson'")
+        
         if not name and not file:
             raise HTTPException(status_code=422, detail="Provide name or image")
         
@@ -77,28 +149,24 @@ async def search_stream(name: str = Form(None), file: UploadFile = File(None)):
             tmp.close()
             image_path = tmp.name
 
-        def generate_progress():
-            def progress_callback(progress_data):
-                yield f"data: {json.dumps({'type': 'progress', 'data': progress_data})}\n\n"
-            
-            results = optimized_search_identity(
-                name=name, 
-                image_path=image_path, 
-                progress_callback=progress_callback
-            )
-            
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'results': results}})}\n\n"
+        events = stream_search(
+            optimized_search_identity,
+            stream_format=format,
+            instant=instant_results(name),
+            name=name,
+            image_path=image_path
+        )
         
         return StreamingResponse(
-            generate_progress(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"}
+            events,
+            media_type=STREAM_FORMATS[format],
+            headers={"Cache-Control": "no-cache", "Connection": "keep-alive", "X-Accel-Buffering": "no"}
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Streaming search error: {str(e)}")
+        logger.error("Streaming search error: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -0,0 +1,338 @@
+"""
+Low-overhead in-process metrics registry with Prometheus text exposition
+
+Counters, gauges and histograms keep one small record per label combination
+behind a per-metric lock; nothing is computed until /metrics is scraped.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import ContextDecorator
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape_label_value(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count
+    """
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value, **labels):
+        """
+        Mirror a total that is counted elsewhere (e.g. functools.lru_cache statistics)
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class _InProgress(ContextDecorator):
+    def __init__(self, gauge, labels):
+        self.gauge = gauge
+        self.labels = labels
+
+    def __enter__(self):
+        self.gauge.inc(**self.labels)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.gauge.dec(**self.labels)
+        return False
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down
+    """
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def track_in_progress(self, **labels):
+        """
+        Context manager / decorator that counts concurrent executions
+        """
+        return _InProgress(self, labels)
+
+
+class _Timer(ContextDecorator):
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over fixed cumulative buckets
+    """
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS, registry=None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            record = self._values.get(key)
+            if record is None:
+                # Per-bucket (non-cumulative) counts, plus overflow, sum and count
+                record = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            record[0][index] += 1
+            record[1] += value
+            record[2] += 1
+
+    def time(self, **labels):
+        """
+        Context manager / decorator observing the elapsed wall time in seconds
+        """
+        return _Timer(self, labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted((key, (list(record[0]), record[1], record[2])) for key, record in self._values.items())
+
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """
+    Collection of metrics rendered together in the Prometheus text format
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collect_hooks = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def add_collect_hook(self, hook):
+        """
+        Call hook() right before every scrape (to refresh mirrored values)
+        """
+        with self._lock:
+            self._collect_hooks.append(hook)
+
+    def render(self):
+        with self._lock:
+            hooks = list(self._collect_hooks)
+            metrics = list(self._metrics.values())
+
+        for hook in hooks:
+            try:
+                hook()
+            except Exception:
+                pass
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Search pipeline metrics shared across modules
+SEARCH_STAGE_SECONDS = Histogram(
+    "search_stage_duration_seconds",
+    "Wall time of each optimized_search_identity stage",
+    labelnames=("stage",),
+)
+SEARCHES_IN_FLIGHT = Gauge(
+    "searches_in_flight",
+    "Searches currently running",
+)
+SEARCH_RESULTS = Histogram(
+    "search_results_count",
+    "Number of results returned by a search",
+    buckets=(0, 5, 10, 25, 50, 100, 150, 250),
+)
+OUTBOUND_REQUEST_SECONDS = Histogram(
+    "outbound_request_duration_seconds",
+    "Latency of outbound HTTP requests by host (known upstreams, else other) and status",
+    labelnames=("host", "status"),
+)
+OUTBOUND_REQUESTS = Counter(
+    "outbound_requests_total",
+    "Outbound HTTP requests by host (known upstreams, else other) and status (status=error for network failures)",
+    labelnames=("host", "status"),
+)
+CACHE_HITS = Counter(
+    "cache_hits_total",
+    "Cache lookups that were served from the cache",
+    labelnames=("cache",),
+)
+CACHE_MISSES = Counter(
+    "cache_misses_total",
+    "Cache lookups that missed",
+    labelnames=("cache",),
+)
+FACE_EMBEDDING_SECONDS = Histogram(
+    "face_embedding_duration_seconds",
+    "Latency of DeepFace embedding extraction",
+    labelnames=("detection",),
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a scheduled probe callback",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+EVENT_LOOP_STALLS = Counter(
+    "event_loop_stalls_total",
+    "Times the event loop was blocked longer than the warning threshold",
+)
+HANDLERS_IN_FLIGHT = Gauge(
+    "http_handlers_in_flight",
+    "HTTP requests currently being handled",
+)
+THREADPOOL_BUSY = Gauge(
+    "threadpool_busy_threads",
+    "Worker threads currently running a task",
+    labelnames=("pool",),
+)
+THREADPOOL_QUEUED = Gauge(
+    "threadpool_queued_tasks",
+    "Tasks waiting for a free worker thread",
+    labelnames=("pool",),
+)
+THREADPOOL_CAPACITY = Gauge(
+    "threadpool_capacity_threads",
+    "Maximum worker threads in the pool",
+    labelnames=("pool",),
+)
+FACE_CHECK_SECONDS = Histogram(
+    "face_presence_check_duration_seconds",
+    "Latency of the Haar-cascade face presence check",
+)
+SEARCH_QUERIES_SKIPPED = Counter(
+    "search_queries_skipped_total",
+    "Candidate search queries not issued because an equivalent query was already planned",
+    labelnames=("source",),
+)
+SEARCH_QUERIES_EARLY_STOPPED = Counter(
+    "search_queries_early_stopped_total",
+    "Queries not issued because earlier queries in the batch stopped finding new URLs",
+    labelnames=("stage",),
+)
+UPSTREAM_BLOCKED_PAGES = Counter(
+    "upstream_blocked_pages_total",
+    "Responses recognized as consent, captcha, interstitial, login or unreadable pages",
+    labelnames=("host", "kind"),
+)
+UPSTREAM_SHORT_CIRCUITED = Counter(
+    "upstream_requests_short_circuited_total",
+    "Requests not sent because the host returned a blocked page earlier in the same search",
+    labelnames=("host",),
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Upstream circuit state per host (0 closed, 1 half-open, 2 open)",
+    labelnames=("host",),
+)
+CIRCUIT_BREAKER_TRANSITIONS = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit state changes per host and new state",
+    labelnames=("host", "state"),
+)
+CIRCUIT_BREAKER_REJECTED = Counter(
+    "circuit_breaker_rejected_total",
+    "Requests failed fast because the host's circuit was open",
+    labelnames=("host",),
+)
@@ -0,0 +1,197 @@
+"""
+Name matching index shared by all scorers and extractors
+
+A NameQuery precomputes everything derived from the searched name (lowercased
+and Unicode-folded forms, tokens and compiled patterns) so each result only
+pays for the match itself.
+"""
+
+import os
+import re
+import unicodedata
+from functools import lru_cache
+
+from metrics import REGISTRY, CACHE_HITS, CACHE_MISSES
+
+# Folded page texts kept so repeated lookups on one page fold it only once
+FOLDED_TEXT_CACHE_SIZE = int(os.getenv("FOLDED_TEXT_CACHE_SIZE", "64") or 64)
+
+
+def fold_text(text):
+    """
+    Casefold text and strip accents so 'José' and 'jose' compare equal
+    """
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class NameQuery:
+    """
+    Normalized forms and compiled patterns for one searched name
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.lower = name.lower()
+        self.folded = fold_text(name)
+        self.tokens = tuple(self.lower.split())
+        self.folded_tokens = tuple(self.folded.split())
+        self.significant_tokens = tuple(token for token in self.tokens if len(token) > 2)
+        self.compact = self.lower.replace(' ', '')
+        self.is_ascii = self.lower.isascii()
+
+        # Substring match (same semantics as `name_lower in text_lower`)
+        self.mention_pattern = re.compile(re.escape(self.lower), re.IGNORECASE)
+
+        # Whole-name match bounded by non-word characters, any whitespace between tokens
+        tokens_pattern = r'\s+'.join(re.escape(token) for token in self.tokens) or re.escape(self.lower)
+        self.exact_pattern = re.compile(rf'(?<!\w){tokens_pattern}(?!\w)', re.IGNORECASE)
+
+        folded_pattern = r'\s+'.join(re.escape(token) for token in self.folded_tokens) or re.escape(self.folded)
+        self.folded_exact_pattern = re.compile(rf'(?<!\w){folded_pattern}(?!\w)')
+
+    @classmethod
+    def of(cls, name):
+        """
+        Return a NameQuery for name, reusing the one already built for this name
+        """
+        if isinstance(name, cls):
+            return name
+        return _cached_query(name or "")
+
+    def _folded_text(self, text):
+        # Folding the text is only needed when either side has non-ASCII characters
+        if self.is_ascii and text.isascii():
+            return None
+        return _folded_document(text)
+
+    def contains(self, text, lowered=False):
+        """
+        Check whether the name appears anywhere in text (case-insensitive)
+        """
+        if not text:
+            return False
+
+        text_lower = text if lowered else text.lower()
+        if self.lower in text_lower:
+            return True
+
+        # fold_text casefolds, so the original text shares its cache entry with exact()
+        folded = self._folded_text(text)
+        return folded is not None and self.folded in folded
+
+    def exact(self, text):
+        """
+        Check whether the full name appears as whole words in text
+        """
+        if not text:
+            return False
+
+        if self.exact_pattern.search(text):
+            return True
+
+        folded = self._folded_text(text)
+        return folded is not None and self.folded_exact_pattern.search(folded) is not None
+
+    def partial_ratio(self, text, lowered=False):
+        """
+        Fraction of name tokens that appear in text
+        """
+        if not self.tokens or not text:
+            return 0.0
+
+        text_lower = text if lowered else text.lower()
+        found = sum(1 for token in self.tokens if token in text_lower)
+        return found / len(self.tokens)
+
+    def find_contexts(self, text, window=50, limit=3, words=None, sentences=False,
+                      min_length=1, max_length=None):
+        """
+        Return up to limit distinct snippets of text around name mentions
+
+        Windows are `window` characters on each side of the mention, `words`
+        whitespace-separated words on each side when words is given, or the
+        enclosing '.'-delimited sentence when sentences is True. Mentions are
+        found with one scan of the compiled pattern over the original text and
+        only the window slices are copied; the scan stops once limit distinct
+        snippets have been collected.
+        """
+        contexts = []
+        seen = set()
+
+        if not text or limit <= 0:
+            return contexts
+
+        pattern = self.exact_pattern if words is not None else self.mention_pattern
+        covered_end = -1
+        for match in pattern.finditer(text):
+            if sentences:
+                # Further mentions inside an already emitted sentence add nothing
+                if match.start() < covered_end:
+                    continue
+                start = text.rfind('.', 0, match.start()) + 1
+                end = text.find('.', match.end())
+                if end == -1:
+                    end = len(text)
+                covered_end = end
+            elif words is not None:
+                start, end = _word_window(text, match.start(), match.end(), words)
+            else:
+                start = max(0, match.start() - window)
+                end = min(len(text), match.end() + window)
+
+            context = text[start:end].strip()
+            if len(context) < min_length:
+                continue
+            if max_length is not None:
+                context = context[:max_length]
+
+            if context not in seen:
+                seen.add(context)
+                contexts.append(context)
+                if len(contexts) >= limit:
+                    break
+
+        return contexts
+
+
+@lru_cache(maxsize=None)
+def _word_window_patterns(words):
+    return (
+        re.compile(rf'(?:\S+\s+){{0,{words}}}\S*$'),
+        re.compile(rf'\S*(?:\s+\S+){{0,{words}}}'),
+    )
+
+
+def _word_window(text, start, end, words):
+    """
+    Expand [start, end) to include up to `words` words on each side
+    """
+    before_pattern, after_pattern = _word_window_patterns(words)
+
+    # Only look at a bounded slice on each side of the match
+    span = words * 40
+    before_start = max(0, start - span)
+    before = before_pattern.search(text, before_start, start)
+    after = after_pattern.match(text, end, min(len(text), end + span))
+
+    new_start = before.start() if before else start
+    new_end = after.end() if after else end
+    return new_start, new_end
+
+
+_cached_query = lru_cache(maxsize=256)(NameQuery)
+
+# The same page body is checked by the verifier, the scraper and every
+# extractor; each folds it at most once while it stays in this cache
+_folded_document = lru_cache(maxsize=FOLDED_TEXT_CACHE_SIZE)(fold_text)
+
+
+def _report_cache_stats():
+    for cache, function in (("name_query", _cached_query), ("folded_text", _folded_document)):
+        info = function.cache_info()
+        CACHE_HITS.set_total(info.hits, cache=cache)
+        CACHE_MISSES.set_total(info.misses, cache=cache)
+
+
+REGISTRY.add_collect_hook(_report_cache_stats)
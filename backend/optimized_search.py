@@ -1,9 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+import http_client
 import random
 from urllib.parse import quote_plus
 import logging
+from keyword_matcher import scan_keywords, count_hits, INSTAGRAM_INDICATORS
+from name_query import NameQuery
+from metrics import SEARCH_STAGE_SECONDS, SEARCHES_IN_FLIGHT, SEARCH_RESULTS
+from search_context import with_search_context, current_search
+from query_planner import plan_queries, release_query
+from early_stop import EarlyStop
+from instant_results import (
+    render_templates, GUARANTEED_SEARCH_TEMPLATES, GUARANTEED_SOCIAL_TEMPLATES, GUARANTEED_PROFESSIONAL_TEMPLATES,
+)
+from tracing import traced
 
 try:
     from enhanced_scraping import enhanced_comprehensive_search, EnhancedDataScraper
@@ -22,12 +30,72 @@ class SearchProgress:
         self.total_searched = 0
         self.progress_percentage = 0
 
-def optimized_search_identity(name=None, image_path=None, progress_callback=None, use_enhanced=False):
+def emit_results(on_results, results):
+    """
+    Hand freshly extracted results to a streaming consumer, if any
+    """
+    if not on_results or not results:
+        return
+    try:
+        on_results(results)
+    except Exception as e:
+        logger.error("Result callback error: %s", e)
+
+# Standard stages the enhanced path can stand in for: platform keywords and the
+# number of scraped results needed (the same minimums that trigger fallbacks)
+STAGE_COVERAGE = {
+    "social": (("instagram", "twitter", "facebook", "tiktok"), 5),
+    "professional": (("linkedin", "github"), 3),
+    "news": (("news",), 3),
+}
+
+def stage_results(results, stage):
+    """
+    Scraped results (not direct search links) belonging to a standard stage
+    """
+    keywords = STAGE_COVERAGE[stage][0]
+    return [
+        result for result in results
+        if not result.get("verified_working") and not result.get("error_fallback")
+        and any(keyword in str(result.get("platform", "")).lower() for keyword in keywords)
+    ]
+
+def covered_stages(results):
+    """
+    Standard stages that results from the enhanced path already cover
+    """
+    return {
+        stage for stage, (_, minimum) in STAGE_COVERAGE.items()
+        if len(stage_results(results, stage)) >= minimum
+    }
+
+def deadline_reached(stage):
+    """
+    True (and logged) when the request's search deadline has passed
+    """
+    search = current_search()
+    if search is not None and search.expired():
+        logger.warning("Search deadline reached, skipping %s stage", stage)
+        return True
+    return False
+
+@SEARCHES_IN_FLIGHT.track_in_progress()
+@with_search_context
+def optimized_search_identity(name=None, image_path=None, progress_callback=None, use_enhanced=False,
+                              result_callback=None):
     """
     Optimized search focusing on performance and Google-based searches
     Now with optional enhanced comprehensive features
+    
+    result_callback, if given, receives each batch of results as soon as a stage
+    has parsed it (before the final ranking).
+    
+    If the enhanced path finds too little to return on its own, its results are
+    kept and only the standard stages it does not cover are run. Pages fetched
+    by either path are shared through the request's SearchContext.
     """
     results = []
+    enhanced_results = []
     progress = SearchProgress()
     
     def update_progress(stage, platform, results_count=0, percentage=0):
@@ -42,36 +110,40 @@ def optimized_search_identity(name=None, image_path=None, progress_callback=None
                 "results_found": progress.results_found,
                 "progress": percentage
             })
-        time.sleep(0.5)  # Small delay for UX
+        http_client.pause(0.5)  # Small delay for UX
     
     if not name:
         return []
     
     try:
-        # Image processing step (if image provided)
-        if image_path:
-            update_progress("Image Analysis", "Face Detection & Processing", 0, 2)
-            try:
-                from utils import preprocess_image_for_face_detection
-                preprocess_image_for_face_detection(image_path)
-            except Exception as e:
-                logger.error(f"Image processing error: {e}")
+        # The image is only passed through to the enhanced path; no stage here
+        # consumes a preprocessed copy or a face embedding
         
         if use_enhanced and ENHANCED_MODULES_AVAILABLE:
             update_progress("Enhanced Search", "All Platforms", 0, 10)
             try:
                 from search import search_identity_enhanced_comprehensive
-                enhanced_results = search_identity_enhanced_comprehensive(
-                    name=name, 
-                    image_path=image_path, 
-                    include_activities=True, 
-                    include_advanced_google=True
-                )
+                with SEARCH_STAGE_SECONDS.time(stage="enhanced"):
+                    enhanced_results = search_identity_enhanced_comprehensive(
+                        name=name, 
+                        image_path=image_path, 
+                        include_activities=True, 
+                        include_advanced_google=True
+                    )
+                emit_results(result_callback, enhanced_results)
                 if len(enhanced_results) > 8:
                     update_progress("Complete", "All Platforms", len(enhanced_results), 100)
+                    SEARCH_RESULTS.observe(len(enhanced_results))
                     return enhanced_results
+                
+                # Too few to stand alone: keep them and fill in only the missing stages
+                results.extend(enhanced_results)
             except Exception as e:
-                logger.error(f"Enhanced search failed: {e}")
+                logger.error("Enhanced search failed: %s", e)
+        
+        skip_stages = covered_stages(enhanced_results)
+        if skip_stages:
+            logger.info("Enhanced results cover stages: %s", ", ".join(sorted(skip_stages)))
         
         # Standard optimized search continues below
         # Stage 1: Initialize
@@ -79,61 +151,96 @@ def optimized_search_identity(name=None, image_path=None, progress_callback=None
         
         # Stage 2: Social Media via Google Search
         update_progress("Social Media Analysis", "Instagram, Twitter, Facebook", 0, 15)
-        social_results = search_social_media_via_google(name)
-        results.extend(social_results)
+        if "social" in skip_stages:
+            social_results = stage_results(enhanced_results, "social")
+        elif deadline_reached("social"):
+            social_results = []
+        else:
+            with SEARCH_STAGE_SECONDS.time(stage="social"):
+                social_results = search_social_media_via_google(name, on_results=result_callback)
+            results.extend(social_results)
         
         if len(social_results) < 5:
-            results.extend(create_guaranteed_social_results(name))
+            guaranteed_social = create_guaranteed_social_results(name)
+            results.extend(guaranteed_social)
+            emit_results(result_callback, guaranteed_social)
         
         update_progress("Social Media Analysis", "Instagram, Twitter, Facebook", len(social_results), 25)
         
         # Stage 3: Professional Networks
         update_progress("Professional Networks", "LinkedIn, GitHub", 0, 35)
-        professional_results = search_professional_networks(name)
-        results.extend(professional_results)
+        if "professional" in skip_stages:
+            professional_results = stage_results(enhanced_results, "professional")
+        elif deadline_reached("professional"):
+            professional_results = []
+        else:
+            with SEARCH_STAGE_SECONDS.time(stage="professional"):
+                professional_results = search_professional_networks(name, on_results=result_callback)
+            results.extend(professional_results)
         
         if len(professional_results) < 3:
-            results.extend(create_guaranteed_professional_results(name))
+            guaranteed_professional = create_guaranteed_professional_results(name)
+            results.extend(guaranteed_professional)
+            emit_results(result_callback, guaranteed_professional)
         
         update_progress("Professional Networks", "LinkedIn, GitHub", len(professional_results), 45)
         
         # Stage 4: Academic Platforms
         update_progress("Academic Platforms", "Google Scholar, ResearchGate", 0, 55)
-        academic_results = search_academic_platforms(name)
-        results.extend(academic_results)
+        if deadline_reached("academic"):
+            academic_results = []
+        else:
+            with SEARCH_STAGE_SECONDS.time(stage="academic"):
+                academic_results = search_academic_platforms(name, on_results=result_callback)
+            results.extend(academic_results)
         update_progress("Academic Platforms", "Google Scholar, ResearchGate", len(academic_results), 65)
         
         # Stage 5: Web Content
         update_progress("Web Content Analysis", "Google, Bing, DuckDuckGo", 0, 75)
-        web_results = search_web_content(name)
-        results.extend(web_results)
+        if deadline_reached("web"):
+            web_results = []
+        else:
+            with SEARCH_STAGE_SECONDS.time(stage="web"):
+                web_results = search_web_content(name, on_results=result_callback)
+            results.extend(web_results)
         update_progress("Web Content Analysis", "Google, Bing, DuckDuckGo", len(web_results), 85)
         
         # Stage 6: News & Media
         update_progress("News & Publications", "News Sites, Blogs", 0, 90)
-        news_results = search_news_and_media(name)
-        results.extend(news_results)
+        if "news" in skip_stages:
+            news_results = stage_results(enhanced_results, "news")
+        elif deadline_reached("news"):
+            news_results = []
+        else:
+            with SEARCH_STAGE_SECONDS.time(stage="news"):
+                news_results = search_news_and_media(name, on_results=result_callback)
+            results.extend(news_results)
         update_progress("News & Publications", "News Sites, Blogs", len(news_results), 95)
         
         update_progress("Processing Results", "Analyzing and ranking results", 0, 95)
-        time.sleep(1)
+        http_client.pause(1)
         
-        final_results = process_and_rank_results(results, name)
+        with SEARCH_STAGE_SECONDS.time(stage="ranking"):
+            final_results = process_and_rank_results(results, name)
         
         if len(final_results) < 10:
-            final_results.extend(create_guaranteed_search_results(name))
+            guaranteed_results = create_guaranteed_search_results(name)
+            emit_results(result_callback, guaranteed_results)
+            final_results.extend(guaranteed_results)
             final_results = final_results[:150]
         
-        logger.info(f"Final results: {len(final_results)}")
+        logger.info("Final results: %s", len(final_results))
         update_progress("Complete", "All Platforms", len(final_results), 100)
+        SEARCH_RESULTS.observe(len(final_results))
         
         return final_results
         
     except Exception as e:
-        logger.error(f"Search error: {e}")
+        logger.error("Search error: %s", e)
         return [{"source": "Error", "preview": f"Search failed: {str(e)}", "score": 0}]
 
-def search_social_media_via_google(name):
+@traced
+def search_social_media_via_google(name, on_results=None):
     """
     Enhanced Instagram and social media search via Google with improved accuracy
     """
@@ -182,49 +289,9 @@ def search_social_media_via_google(name):
         'Upgrade-Insecure-Requests': '1'
     }
     
-    # Prioritize Instagram searches with better error handling
-    for query in instagram_queries:
-        try:
-            search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=20"
-            response = requests.get(search_url, headers=headers, timeout=12)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                search_results = extract_enhanced_google_results(soup, name, query, priority_platform="Instagram")
-                if search_results:  # Only extend if we got results
-                    results.extend(search_results)
-                    logger.info(f"Found {len(search_results)} Instagram results for query: {query}")
-                else:
-                    logger.warning(f"No results extracted for Instagram query: {query}")
-            else:
-                logger.warning(f"Google search failed with status {response.status_code} for query: {query}")
-            
-            time.sleep(2.5)  # Longer delay for more thorough search
-            
-        except Exception as e:
-            logger.error(f"Error searching Instagram via Google for {query}: {e}")
-            continue
-    
-    # Then search other platforms
-    for query in other_social_queries[:6]:  # Search more platforms for better coverage
-        try:
-            search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=15"
-            response = requests.get(search_url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                search_results = extract_enhanced_google_results(soup, name, query)
-                results.extend(search_results)
-            
-            time.sleep(2)
-            
-        except Exception as e:
-            logger.error(f"Error searching social media for {query}: {e}")
-            continue
-    
-    # Add direct Instagram search suggestion
+    # Direct Instagram search suggestion (no request needed)
     instagram_username = name.replace(" ", "").lower()
-    results.insert(0, {
+    instagram_direct = {
         "source": "Instagram Direct Profile Check",
         "preview": f"Check if '{name}' has an Instagram profile @{instagram_username} - Direct Instagram search recommended",
         "score": 0.95,
@@ -234,10 +301,10 @@ def search_social_media_via_google(name):
         "username_suggestion": instagram_username,
         "verified_working": True,
         "priority": True
-    })
+    }
     
-    # Add more guaranteed Instagram search options
-    results.extend([
+    # More guaranteed Instagram search options
+    instagram_links = [
         {
             "source": "Instagram Search by Username",
             "preview": f"Direct Instagram username search for '{name}' - Check for exact username matches",
@@ -256,11 +323,65 @@ def search_social_media_via_google(name):
             "link": f"https://www.instagram.com/explore/tags/{name.replace(' ', '').lower()}/",
             "verified_working": True
         }
-    ])
+    ]
+    # These need no request, so streaming clients get them right away
+    emit_results(on_results, [instagram_direct] + instagram_links)
+    
+    # Prioritize Instagram searches with better error handling; stop once they
+    # keep returning profiles already found
+    early_stop = EarlyStop("social.instagram")
+    for query in early_stop.run(plan_queries(instagram_queries, name, "social", num=20)):
+        try:
+            search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=20"
+            response = http_client.get(search_url, headers=headers, timeout=12)
+            
+            if response.status_code == 200:
+                soup = http_client.parse_response(response)
+                search_results = extract_enhanced_google_results(soup, name, query, priority_platform="Instagram")
+                early_stop.add(search_results)
+                if search_results:  # Only extend if we got results
+                    results.extend(search_results)
+                    emit_results(on_results, search_results)
+                    logger.info("Found %s Instagram results for query: %s", len(search_results), query)
+                else:
+                    logger.warning("No results extracted for Instagram query: %s", query)
+            else:
+                logger.warning("Google search failed with status %s for query: %s", response.status_code, query)
+            
+            http_client.pause(2.5)  # Longer delay for more thorough search
+            
+        except Exception as e:
+            logger.error("Error searching Instagram via Google for %s: %s", query, e)
+            release_query(query)
+            continue
+    
+    # Then search other platforms
+    for query in plan_queries(other_social_queries[:6], name, "social", num=15):  # Search more platforms for better coverage
+        try:
+            search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=15"
+            response = http_client.get(search_url, headers=headers, timeout=10)
+            
+            if response.status_code == 200:
+                soup = http_client.parse_response(response)
+                search_results = extract_enhanced_google_results(soup, name, query)
+                results.extend(search_results)
+                emit_results(on_results, search_results)
+            
+            http_client.pause(2)
+            
+        except Exception as e:
+            logger.error("Error searching social media for %s: %s", query, e)
+            release_query(query)
+            continue
+    
+    # Add direct Instagram search suggestion and guaranteed options
+    results.insert(0, instagram_direct)
+    results.extend(instagram_links)
     
     return results
 
-def search_professional_networks(name):
+@traced
+def search_professional_networks(name, on_results=None):
     """
     Search professional networks via Google and direct platform searches
     """
@@ -281,24 +402,8 @@ def search_professional_networks(name):
     
     all_queries = linkedin_queries + github_queries
     
-    for query in all_queries:
-        try:
-            search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
-            response = requests.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                search_results = extract_google_results(soup, name, query)
-                results.extend(search_results)
-            
-            time.sleep(1.5)
-            
-        except Exception as e:
-            logger.error(f"Error searching professional networks: {e}")
-            continue
-    
-    # Add direct search links
-    results.extend([
+    # Direct search links need no request, so stream them right away
+    direct_links = [
         {
             "source": "LinkedIn Direct Search",
             "preview": f"Direct LinkedIn search for '{name}' - Click to view professional profiles and connections",
@@ -317,11 +422,34 @@ def search_professional_networks(name):
             "link": f"https://github.com/search?q={quote_plus(name)}&type=users",
             "verified_working": True
         }
-    ])
+    ]
+    emit_results(on_results, direct_links)
+    
+    for query in plan_queries(all_queries, name, "professional", num=10):
+        try:
+            search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
+            response = http_client.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+            
+            if response.status_code == 200:
+                soup = http_client.parse_response(response)
+                search_results = extract_google_results(soup, name, query)
+                results.extend(search_results)
+                emit_results(on_results, search_results)
+            
+            http_client.pause(1.5)
+            
+        except Exception as e:
+            logger.error("Error searching professional networks: %s", e)
+            release_query(query)
+            continue
+    
+    # Add direct search links
+    results.extend(direct_links)
     
     return results
 
-def search_academic_platforms(name):
+@traced
+def search_academic_platforms(name, on_results=None):
     """
     Search academic platforms for research and publications
     """
@@ -335,38 +463,47 @@ def search_academic_platforms(name):
         f'"{name}" research OR paper OR publication'
     ]
     
-    for query in academic_queries[:6]:  # Process more academic queries for comprehensive search
+    # Direct academic search links need no request, so stream them right away
+    direct_links = [
+        {
+            "source": "Google Scholar Search",
+            "preview": f"Search Google Scholar for academic papers and citations by '{name}'",
+            "score": 0.70,
+            "platform": "Google Scholar",
+            "search_type": "academic_verified",
+            "link": f"https://scholar.google.com/scholar?q={quote_plus(name)}",
+            "verified_working": True
+        }
+    ]
+    emit_results(on_results, direct_links)
+    
+    early_stop = EarlyStop("academic")
+    for query in early_stop.run(plan_queries(academic_queries[:6], name, "academic", num=3)):  # Process more academic queries for comprehensive search
         try:
             search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=3"
-            response = requests.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+            response = http_client.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 search_results = extract_google_results(soup, name, query)
+                early_stop.add(search_results)
                 results.extend(search_results)
+                emit_results(on_results, search_results)
             
-            time.sleep(1)
+            http_client.pause(1)
             
         except Exception as e:
-            logger.error(f"Error searching academic platforms: {e}")
+            logger.error("Error searching academic platforms: %s", e)
+            release_query(query)
             continue
     
     # Add direct academic search links
-    results.extend([
-        {
-            "source": "Google Scholar Search",
-            "preview": f"Search Google Scholar for academic papers and citations by '{name}'",
-            "score": 0.70,
-            "platform": "Google Scholar",
-            "search_type": "academic_verified",
-            "link": f"https://scholar.google.com/scholar?q={quote_plus(name)}",
-            "verified_working": True
-        }
-    ])
+    results.extend(direct_links)
     
     return results
 
-def search_web_content(name):
+@traced
+def search_web_content(name, on_results=None):
     """
     Search general web content via multiple search engines
     """
@@ -386,25 +523,31 @@ def search_web_content(name):
     ]
     
     for engine_name, base_url in search_engines[:3]:  # Use all 3 engines for comprehensive coverage
-        for query in web_queries[:4]:  # Process more queries per engine
+        vertical = "web" if engine_name == "Google" else engine_name.lower()
+        early_stop = EarlyStop(f"web_content.{vertical}")
+        for query in early_stop.run(plan_queries(web_queries[:4], name, "web_content", vertical)):  # Process more queries per engine
             try:
                 search_url = f"{base_url}{quote_plus(query)}"
-                response = requests.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+                response = http_client.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     search_results = extract_web_results(soup, name, engine_name)
+                    early_stop.add(search_results)
                     results.extend(search_results[:15])  # More results per query
+                    emit_results(on_results, search_results[:15])
                 
-                time.sleep(1)
+                http_client.pause(1)
                 
             except Exception as e:
-                logger.error(f"Error searching {engine_name}: {e}")
+                logger.error("Error searching %s: %s", engine_name, e)
+                release_query(query, vertical)
                 continue
     
     return results
 
-def search_news_and_media(name):
+@traced
+def search_news_and_media(name, on_results=None):
     """
     Search news and media mentions
     """
@@ -416,20 +559,24 @@ def search_news_and_media(name):
         f'"{name}" interview OR podcast OR video'
     ]
     
-    for query in news_queries[:4]:  # Process more news queries
+    early_stop = EarlyStop("news")
+    for query in early_stop.run(plan_queries(news_queries[:4], name, "news", "news", num=3)):  # Process more news queries
         try:
             search_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=nws&num=3"
-            response = requests.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+            response = http_client.get(search_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 search_results = extract_google_results(soup, name, query, content_type="news")
+                early_stop.add(search_results)
                 results.extend(search_results)
+                emit_results(on_results, search_results)
             
-            time.sleep(1)
+            http_client.pause(1)
             
         except Exception as e:
-            logger.error(f"Error searching news: {e}")
+            logger.error("Error searching news: %s", e)
+            release_query(query, "news")
             continue
     
     return results
@@ -439,6 +586,7 @@ def extract_enhanced_google_results(soup, name, query, priority_platform=None, c
     Enhanced extraction of results from Google search pages with better Instagram detection
     """
     results = []
+    name_query = NameQuery.of(name)
     
     try:
         # Google search result selectors (multiple fallbacks)
@@ -493,27 +641,25 @@ def extract_enhanced_google_results(soup, name, query, priority_platform=None, c
                 
                 # Enhanced validation for all platforms
                 content_text = f"{title} {snippet}".lower()
-                name_lower = name.lower()
                 
                 # Check if this is relevant content - much more inclusive approach
                 is_relevant = False
                 relevance_score = 0.4  # Start with higher base score
                 
                 # Name matching (more flexible)
-                if name_lower in content_text:
+                if name_query.contains(content_text, lowered=True):
                     is_relevant = True
                     relevance_score += 0.3
                 
                 # Partial name matching
-                name_parts = name_lower.split()
-                if len(name_parts) > 1:
-                    for part in name_parts:
-                        if len(part) > 2 and part in content_text:
+                if len(name_query.tokens) > 1:
+                    for part in name_query.significant_tokens:
+                        if part in content_text:
                             is_relevant = True
                             relevance_score += 0.1
                 
                 # Exact name match bonus
-                if f" {name_lower} " in f" {content_text} ":
+                if name_query.exact(content_text):
                     relevance_score += 0.2
                 
                 # Platform specific checks
@@ -530,16 +676,10 @@ def extract_enhanced_google_results(soup, name, query, priority_platform=None, c
                     relevance_score += 0.4
                     
                     # Check for Instagram profile indicators
-                    instagram_indicators = [
-                        'instagram profile', 'instagram account', '@', 
-                        'followers', 'following', 'posts', 'bio',
-                        'instagram user', 'ig profile'
-                    ]
-                    
-                    for indicator in instagram_indicators:
-                        if indicator in content_text:
-                            relevance_score += 0.1
-                            is_relevant = True
+                    indicator_count = count_hits(scan_keywords(content_text), INSTAGRAM_INDICATORS)
+                    if indicator_count:
+                        relevance_score += 0.1 * indicator_count
+                        is_relevant = True
                 
                 # URL validation for Instagram
                 if platform == "Instagram" and url:
@@ -586,11 +726,11 @@ def extract_enhanced_google_results(soup, name, query, priority_platform=None, c
                     results.append(result_entry)
                     
             except Exception as e:
-                logger.error(f"Error extracting individual enhanced result: {e}")
+                logger.error("Error extracting individual enhanced result: %s", e)
                 continue
                 
     except Exception as e:
-        logger.error(f"Error extracting enhanced Google results: {e}")
+        logger.error("Error extracting enhanced Google results: %s", e)
     
     return results
 
@@ -633,7 +773,7 @@ def extract_google_results(soup, name, query, content_type="general"):
                 link_elem = result.select_one('a')
                 url = link_elem.get('href', '') if link_elem else ""
                 
-                if title and snippet and name.lower() in f"{title} {snippet}".lower():
+                if title and snippet and NameQuery.of(name).contains(f"{title} {snippet}"):
                     # Determine platform from URL
                     platform = determine_platform_from_url(url)
                     score = calculate_relevance_score(name, title, snippet, platform)
@@ -651,11 +791,11 @@ def extract_google_results(soup, name, query, content_type="general"):
                     })
                     
             except Exception as e:
-                logger.error(f"Error extracting individual result: {e}")
+                logger.error("Error extracting individual result: %s", e)
                 continue
                 
     except Exception as e:
-        logger.error(f"Error extracting Google results: {e}")
+        logger.error("Error extracting Google results: %s", e)
     
     return results
 
@@ -677,7 +817,7 @@ def extract_web_results(soup, name, engine_name):
         for element in result_elements[:2]:  # Limit results
             try:
                 text_content = element.get_text()
-                if name.lower() in text_content.lower() and len(text_content) > 50:
+                if len(text_content) > 50 and NameQuery.of(name).contains(text_content):
                     results.append({
                         "source": f"{engine_name} Web Search",
                         "preview": text_content[:200] + "...",
@@ -690,7 +830,7 @@ def extract_web_results(soup, name, engine_name):
                 continue
                 
     except Exception as e:
-        logger.error(f"Error extracting web results: {e}")
+        logger.error("Error extracting web results: %s", e)
     
     return results
 
@@ -724,168 +864,15 @@ def determine_platform_from_url(url):
 
 def create_guaranteed_search_results(name):
     """Create guaranteed working search results that always work"""
-    guaranteed_results = [
-        {
-            "source": "Google Search - Comprehensive",
-            "preview": f"Search Google for '{name}' across all websites and platforms. This direct search will show web pages, social media profiles, news articles, and any public mentions.",
-            "score": 0.85,
-            "platform": "Google",
-            "search_type": "web_search_verified",
-            "link": f"https://www.google.com/search?q={quote_plus(name + ' profile social media')}",
-            "verified_working": True
-        },
-        {
-            "source": "Instagram Direct Search",
-            "preview": f"Search Instagram directly for '{name}'. This will show public profiles, posts, and stories that match the name.",
-            "score": 0.83,
-            "platform": "Instagram",
-            "search_type": "social_media_verified",
-            "link": f"https://www.instagram.com/web/search/topsearch/?query={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "LinkedIn Professional Search",
-            "preview": f"Search LinkedIn for professional profiles of '{name}'. This will show work history, connections, and professional information.",
-            "score": 0.81,
-            "platform": "LinkedIn",
-            "search_type": "professional_verified",
-            "link": f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "Facebook People Search",
-            "preview": f"Search Facebook for '{name}' profiles. This will show public Facebook profiles and pages.",
-            "score": 0.79,
-            "platform": "Facebook",
-            "search_type": "social_media_verified",
-            "link": f"https://www.facebook.com/search/people/?q={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "Twitter/X User Search",
-            "preview": f"Search Twitter/X for '{name}' user accounts. This will show public Twitter profiles and recent tweets.",
-            "score": 0.77,
-            "platform": "Twitter/X",
-            "search_type": "social_media_verified",
-            "link": f"https://twitter.com/search?q={quote_plus(name)}&src=typed_query&f=user",
-            "verified_working": True
-        },
-        {
-            "source": "YouTube Channel Search",
-            "preview": f"Search YouTube for '{name}' channels and videos. This will show YouTube channels, uploaded videos, and comments.",
-            "score": 0.75,
-            "platform": "YouTube",
-            "search_type": "media_verified",
-            "link": f"https://www.youtube.com/results?search_query={quote_plus(name)}&sp=EgIQAg%253D%253D",
-            "verified_working": True
-        },
-        {
-            "source": "TikTok User Search",
-            "preview": f"Search TikTok for '{name}' user accounts. This will show TikTok profiles and videos.",
-            "score": 0.71,
-            "platform": "TikTok",
-            "search_type": "social_media_verified",
-            "link": f"https://www.tiktok.com/search/user?q={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "GitHub Developer Search",
-            "preview": f"Search GitHub for '{name}' developer profiles. This will show GitHub accounts, repositories, and code contributions.",
-            "score": 0.67,
-            "platform": "GitHub",
-            "search_type": "professional_verified",
-            "link": f"https://github.com/search?q={quote_plus(name)}&type=users",
-            "verified_working": True
-        }
-    ]
-    
-    return guaranteed_results
+    return render_templates(GUARANTEED_SEARCH_TEMPLATES, name)
 
 def create_guaranteed_social_results(name):
     """Create guaranteed social media search results"""
-    social_results = [
-        {
-            "source": "Instagram Direct Profile Search",
-            "preview": f"Direct Instagram search for '{name}' profiles. Click to search for public Instagram accounts, posts, and stories.",
-            "score": 0.88,
-            "platform": "Instagram",
-            "search_type": "social_media_verified",
-            "link": f"https://www.instagram.com/web/search/topsearch/?query={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "Facebook People Search",
-            "preview": f"Search Facebook for '{name}' public profiles and pages. Find Facebook accounts and public information.",
-            "score": 0.85,
-            "platform": "Facebook", 
-            "search_type": "social_media_verified",
-            "link": f"https://www.facebook.com/search/people/?q={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "Twitter/X User Search",
-            "preview": f"Search Twitter/X for '{name}' user accounts and tweets. Find public Twitter profiles and recent activity.",
-            "score": 0.83,
-            "platform": "Twitter/X",
-            "search_type": "social_media_verified", 
-            "link": f"https://twitter.com/search?q={quote_plus(name)}&src=typed_query&f=user",
-            "verified_working": True
-        },
-        {
-            "source": "TikTok User Search",
-            "preview": f"Search TikTok for '{name}' user accounts and videos. Find TikTok profiles and popular videos.",
-            "score": 0.80,
-            "platform": "TikTok",
-            "search_type": "social_media_verified",
-            "link": f"https://www.tiktok.com/search/user?q={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "YouTube Channel Search",
-            "preview": f"Search YouTube for '{name}' channels and videos. Find YouTube accounts and uploaded content.",
-            "score": 0.78,
-            "platform": "YouTube",
-            "search_type": "media_verified",
-            "link": f"https://www.youtube.com/results?search_query={quote_plus(name)}&sp=EgIQAg%253D%253D",
-            "verified_working": True
-        }
-    ]
-    
-    return social_results
+    return render_templates(GUARANTEED_SOCIAL_TEMPLATES, name)
 
 def create_guaranteed_professional_results(name):
     """Create guaranteed professional search results"""
-    professional_results = [
-        {
-            "source": "LinkedIn Professional Search",
-            "preview": f"Search LinkedIn for '{name}' professional profiles. Find work history, connections, skills, and career information.",
-            "score": 0.87,
-            "platform": "LinkedIn",
-            "search_type": "professional_verified",
-            "link": f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(name)}",
-            "verified_working": True
-        },
-        {
-            "source": "GitHub Developer Search",
-            "preview": f"Search GitHub for '{name}' developer profiles. Find repositories, code contributions, and open source projects.",
-            "score": 0.82,
-            "platform": "GitHub",
-            "search_type": "professional_verified",
-            "link": f"https://github.com/search?q={quote_plus(name)}&type=users",
-            "verified_working": True
-        },
-        {
-            "source": "Google Scholar Academic Search",
-            "preview": f"Search Google Scholar for '{name}' academic publications. Find research papers, citations, and scholarly work.",
-            "score": 0.79,
-            "platform": "Google Scholar",
-            "search_type": "academic_verified",
-            "link": f"https://scholar.google.com/scholar?q={quote_plus(name)}",
-            "verified_working": True
-        }
-    ]
-    
-    return professional_results
+    return render_templates(GUARANTEED_PROFESSIONAL_TEMPLATES, name)
 
 def calculate_relevance_score(name, title, snippet, platform):
     """
@@ -893,18 +880,18 @@ def calculate_relevance_score(name, title, snippet, platform):
     """
     score = 0.5  # Base score
     
-    name_lower = name.lower()
+    query = NameQuery.of(name)
     title_lower = title.lower()
     snippet_lower = snippet.lower()
     
     # Name presence scoring
-    if name_lower in title_lower:
+    if query.contains(title_lower, lowered=True):
         score += 0.3
-    if name_lower in snippet_lower:
+    if query.contains(snippet_lower, lowered=True):
         score += 0.2
     
     # Exact name match bonus
-    if f" {name_lower} " in f" {title_lower} {snippet_lower} ":
+    if query.exact(f"{title_lower} {snippet_lower}"):
         score += 0.2
     
     # Platform bonuses
@@ -922,6 +909,7 @@ def calculate_relevance_score(name, title, snippet, platform):
     
     return min(score, 0.95)
 
+@traced
 def process_and_rank_results(results, name):
     """
     Process and rank all results
@@ -944,5 +932,5 @@ def process_and_rank_results(results, name):
         return unique_results[:150]
         
     except Exception as e:
-        logger.error(f"Error processing results: {e}")
+        logger.error("Error processing results: %s", e)
         return results[:75]
\ No newline at end of file
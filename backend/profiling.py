@@ -0,0 +1,201 @@
+"""
+Opt-in sampling profiler for /search requests
+
+A background thread samples the stack of the thread running the search every
+few milliseconds via sys._current_frames(), so the search itself runs
+unmodified. Profiling is enabled for a random fraction of requests or on
+demand with an admin header:
+
+    PROFILE_SAMPLE_RATE=0.01        fraction of /search requests to profile
+    PROFILE_INTERVAL_MS=5           sampling interval
+    PROFILE_OUTPUT_DIR=profiles     where profiles are written
+    PROFILE_ADMIN_TOKEN=...         enables `X-Profile: 1` + `X-Admin-Token: <token>`
+
+Each profiled request writes <request_id>.collapsed (flamegraph.pl / speedscope
+collapsed stacks), <request_id>.speedscope.json and <request_id>.meta.json with
+the request's stage timings.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hmac
+import threading
+import logging
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0") or 0)
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5") or 5)
+PROFILE_OUTPUT_DIR = os.getenv("PROFILE_OUTPUT_DIR", "profiles")
+PROFILE_ADMIN_TOKEN = os.getenv("PROFILE_ADMIN_TOKEN", "")
+
+MAX_STACK_DEPTH = 128
+
+
+class SamplingProfiler:
+    """
+    Periodically records the call stack of one target thread
+    """
+
+    def __init__(self, thread_id, interval_ms=PROFILE_INTERVAL_MS):
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000.0
+        self.stacks = Counter()
+        self.sample_count = 0
+        self.started_at = None
+        self.stopped_at = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _frame_label(self, frame):
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+
+        stack = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            stack.append(self._frame_label(frame))
+            frame = frame.f_back
+        stack.reverse()
+
+        self.stacks[tuple(stack)] += 1
+        self.sample_count += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as e:
+                logger.error("Profiler sampling error: %s", e)
+                return
+
+    def start(self):
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.stopped_at = time.time()
+
+    def collapsed(self):
+        """
+        Collapsed stack lines ("root;child;leaf count") for flamegraph tools
+        """
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def speedscope(self, name):
+        """
+        speedscope "sampled" profile document
+        """
+        frame_index = {}
+        frames = []
+        samples = []
+        weights = []
+        interval_ms = self.interval * 1000.0
+
+        for stack, count in self.stacks.items():
+            indices = []
+            for label in stack:
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    function, _, location = label.partition(" (")
+                    file_name, _, line = location.rstrip(")").rpartition(":")
+                    frames.append({"name": function, "file": file_name, "line": int(line) if line.isdigit() else None})
+                indices.append(frame_index[label])
+            samples.append(indices)
+            weights.append(count * interval_ms)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "backend/profiling.py",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+
+def should_profile(headers):
+    """
+    Decide whether to profile a request (admin header or random sampling)
+    """
+    if PROFILE_ADMIN_TOKEN and headers.get("x-profile") == "1":
+        token = headers.get("x-admin-token", "")
+        if hmac.compare_digest(token, PROFILE_ADMIN_TOKEN):
+            return True
+        logger.warning("Rejected profiling request with an invalid admin token")
+
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def write_profile(profiler, request_id, stage_timings=None, output_dir=PROFILE_OUTPUT_DIR):
+    """
+    Write collapsed stacks, speedscope JSON and metadata for one request
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    base_path = os.path.join(output_dir, request_id)
+    name = f"search {request_id}"
+
+    with open(f"{base_path}.collapsed", "w", encoding="utf-8") as collapsed_file:
+        collapsed_file.write(profiler.collapsed())
+
+    with open(f"{base_path}.speedscope.json", "w", encoding="utf-8") as speedscope_file:
+        json.dump(profiler.speedscope(name), speedscope_file)
+
+    with open(f"{base_path}.meta.json", "w", encoding="utf-8") as meta_file:
+        json.dump({
+            "request_id": request_id,
+            "started_at": profiler.started_at,
+            "duration_s": round((profiler.stopped_at or time.time()) - profiler.started_at, 3),
+            "interval_ms": profiler.interval * 1000.0,
+            "samples": profiler.sample_count,
+            "stage_timings": stage_timings,
+        }, meta_file, indent=2, default=str)
+
+    return base_path
+
+
+@contextmanager
+def maybe_profile(headers, request_id, timings_source=None):
+    """
+    Profile the enclosed block on the current thread if this request is selected
+
+    timings_source, if given, is called after the block to obtain the stage
+    timings stored alongside the profile.
+    """
+    if not should_profile(headers):
+        yield None
+        return
+
+    profiler = SamplingProfiler(threading.get_ident())
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        try:
+            stage_timings = timings_source() if timings_source else None
+            path = write_profile(profiler, request_id, stage_timings)
+            logger.info("Wrote profile for request %s (%s samples) to %s.*", request_id, profiler.sample_count, path)
+        except Exception as e:
+            logger.error("Failed to write profile for request %s: %s", request_id, e)
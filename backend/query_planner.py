@@ -0,0 +1,215 @@
+"""
+Search query planning shared by every module that builds Google queries
+
+Several modules generate their own query lists for the same name, and many of
+them differ only in wording ('"Name" site:instagram.com profile' and
+'"Name" site:instagram.com account' return the same page of results). Each
+module iterates its batch through plan_queries() while issuing it; queries are
+reduced to a canonical key and the ones equivalent to a query already issued
+in the same search (by this module or an earlier one) are dropped. A key is
+claimed only when its query is reached, and a query that fails gives its claim
+back with release_query().
+
+A key is the set of terms left after:
+
+- folding case and accents; a quoted phrase stays one term, distinct from the
+  same words unquoted
+- replacing the searched name with <name> (and the joined name, e.g. @handles),
+  as whole tokens only
+- mapping synonyms (ig -> instagram, x.com -> twitter, site:x.com -> site:twitter.com)
+- dropping filler words (profile, account, user, page, bio, public), except
+  from an OR group made only of them ("profile OR bio" still narrows a search)
+- treating "a OR b" as one unordered group
+- dropping a platform word already implied by a site: operator
+
+The key leaves out the requested result count (&num=): a query asking for
+more results than its planned equivalent is still issued.
+
+Skipped queries are counted per search (search.queries_skipped on the trace
+root) and in search_queries_skipped_total{source}.
+"""
+
+import re
+import logging
+
+from metrics import SEARCH_QUERIES_SKIPPED
+from name_query import fold_text
+from search_context import current_search
+
+logger = logging.getLogger(__name__)
+
+FILLER_WORDS = frozenset({"profile", "profiles", "account", "user", "page", "bio", "public"})
+
+SYNONYMS = {
+    "ig": "instagram",
+    "x.com": "twitter",
+    "fb": "facebook",
+}
+
+SITE_SYNONYMS = {
+    "x.com": "twitter.com",
+    "mobile.twitter.com": "twitter.com",
+    "m.facebook.com": "facebook.com",
+}
+
+NAME_TOKEN = "<name>"
+
+# Google's page size when a query URL has no &num=
+DEFAULT_RESULT_COUNT = 10
+
+_OR_PATTERN = re.compile(r"\s+OR\s+")
+_TOKEN_PATTERN = re.compile(r'"[^"]*"|\S+')
+
+
+def _site(term):
+    site = term[len("site:"):].rstrip("/")
+    if site.startswith("www."):
+        site = site[len("www."):]
+    domain, _, path = site.partition("/")
+    domain = SITE_SYNONYMS.get(domain, domain)
+    return "site:" + (f"{domain}/{path}" if path else domain)
+
+
+def _term(term):
+    if term.startswith('"'):
+        return term
+    if term.startswith("site:"):
+        return _site(term)
+    term = SYNONYMS.get(term, term)
+    return None if term in FILLER_WORDS else term
+
+
+def query_key(query, name, vertical="web"):
+    """
+    Canonical form of a query: equal keys mean equivalent searches
+    """
+    text = f" {fold_text(_OR_PATTERN.sub(' | ', query))} "
+
+    folded_name = fold_text(name or "").split()
+    if folded_name:
+        # Whole tokens only: the name inside a word or a site: domain ("lin" in linkedin.com) stays
+        text = re.sub(r"(?<![\w@#])(?<!\w\.)" + r"\s+".join(map(re.escape, folded_name)) + r"(?!\w|\.\w)", NAME_TOKEN, text)
+        text = re.sub(r"(?<![\w@#])(?<!\w\.)([@#]?)" + re.escape("".join(folded_name)) + r"(?!\w|\.\w)", r"\1" + NAME_TOKEN, text)
+
+    # "a | b | c" -> one group; plain terms are groups of one
+    groups = []
+    pending_or = False
+    for token in _TOKEN_PATTERN.findall(text):
+        if token.startswith('"'):
+            token = '"' + " ".join(token.strip('"').split()) + '"'
+        if token == "|":
+            pending_or = bool(groups)
+            continue
+        if pending_or:
+            groups[-1].append(token)
+        else:
+            groups.append([token])
+        pending_or = False
+
+    terms = set()
+    for group in groups:
+        normalized = frozenset(term for term in map(_term, group) if term)
+        if not normalized and len(group) > 1:
+            # an OR of filler words only still restricts the results
+            normalized = frozenset(SYNONYMS.get(term, term) for term in group)
+        if len(normalized) == 1:
+            terms.add(next(iter(normalized)))
+        elif normalized:
+            terms.add(normalized)
+
+    # a platform word adds nothing next to a site: on that platform
+    platforms = {term[len("site:"):].split(".")[0] for term in terms if isinstance(term, str) and term.startswith("site:")}
+    terms = {term for term in terms if term not in platforms}
+
+    return vertical, frozenset(terms)
+
+
+class QueryPlan:
+    """
+    A batch of queries planned lazily: iterating it yields the queries worth
+    issuing, and a query's key is claimed only when iteration reaches it
+    """
+
+    def __init__(self, queries, name, source, vertical="web", num=None):
+        self.queries = list(queries)
+        self.name = name
+        self.source = source
+        self.vertical = vertical
+        self.num = num or DEFAULT_RESULT_COUNT
+        self.position = 0
+
+    def __len__(self):
+        return len(self.queries)
+
+    def remaining(self):
+        """
+        Queries of the batch iteration has not reached yet
+        """
+        return len(self.queries) - self.position
+
+    def __iter__(self):
+        search = current_search()
+        planned_keys = search.queries if search is not None else {}
+        planned = skipped = 0
+        try:
+            while self.position < len(self.queries):
+                query = self.queries[self.position]
+                self.position += 1
+                key = query_key(query, self.name, self.vertical)
+                entry = (query, self.source, self.num, None)
+                earlier = planned_keys.setdefault(key, entry)
+                if earlier is entry or self.num > earlier[2]:
+                    if earlier is not entry:
+                        planned_keys[key] = (query, self.source, self.num, earlier)
+                    planned += 1
+                    if search is not None:
+                        search.record("queries_planned")
+                    yield query
+                    continue
+                skipped += 1
+                SEARCH_QUERIES_SKIPPED.inc(source=self.source)
+                if search is not None:
+                    search.record("queries_skipped")
+                logger.debug("Skipping query %r (%s): equivalent to %r (%s)", query, self.source, earlier[0], earlier[1])
+        finally:
+            if skipped:
+                logger.info("Query plan for %s: %s of %s queries, %s equivalent skipped",
+                            self.source, planned, self.position, skipped)
+
+
+def plan_queries(queries, name, source, vertical="web", num=None):
+    """
+    The queries worth issuing, in order: duplicates within the batch and queries
+    equivalent to one already issued in the current search are dropped, unless
+    they ask for more results (num) than the earlier one
+
+    The plan is lazy, so a query the caller never gets to (the loop stopped
+    early or ran out of time) is not claimed and a later module can still send it.
+    """
+    return QueryPlan(queries, name, source, vertical, num)
+
+
+def admit_query(query, name, source, vertical="web", num=None):
+    """
+    True if query should be issued now (single-query form of plan_queries)
+    """
+    return any(True for _ in plan_queries([query], name, source, vertical, num))
+
+
+def release_query(query, vertical="web"):
+    """
+    Give up the claim on a query that failed, so an equivalent one can still be sent
+
+    Matches the query text, since the helpers that send queries don't all know
+    the searched name; a claim the query took over from an equivalent one with
+    a smaller num goes back to that one.
+    """
+    search = current_search()
+    if search is None:
+        return
+    for key, entry in list(search.queries.items()):
+        if key[0] == vertical and entry[0] == query:
+            if entry[3] is not None:
+                search.queries[key] = entry[3]
+            else:
+                search.queries.pop(key, None)
@@ -0,0 +1,125 @@
+"""
+Recognizes upstream pages that are not results
+
+Search engines and social sites answer scrapers with consent walls, captcha
+challenges, bot-check interstitials and login redirects, all with status 200.
+The extractors find nothing on those pages, so without this check every
+remaining query to the host is still sent (and slept after). http_client.get()
+classifies each response; once a host has returned one of these pages, its
+remaining requests in the same search fail fast.
+
+Search result pages are also checked for the engine's result container; a
+search page without one has a layout the extractors can't read.
+
+Only responses from the search engines, social sites and mirrors the scrapers
+query (upstream_hosts) are classified. Verification and content scraping fetch
+arbitrary result pages, and an ordinary article with a reCAPTCHA contact form
+must not block its host.
+"""
+
+from urllib.parse import urlparse
+
+from upstream_hosts import upstream_domain
+
+CONSENT = "consent"
+CAPTCHA = "captcha"
+INTERSTITIAL = "interstitial"
+LOGIN_WALL = "login_wall"
+UNEXPECTED_LAYOUT = "unexpected_layout"
+
+# (kind, lowercase markers in the page body)
+PAGE_MARKERS = (
+    (CAPTCHA, (
+        "our systems have detected unusual traffic",
+        'id="captcha-form"',
+        "g-recaptcha",
+        "anomaly-modal",
+        "please solve this challenge",
+    )),
+    (CONSENT, (
+        "before you continue to google",
+        "before you continue to youtube",
+        'action="https://consent.',
+    )),
+    (INTERSTITIAL, (
+        "<title>just a moment...</title>",
+        "cf-browser-verification",
+        "checking your browser before accessing",
+        "attention required! | cloudflare",
+        "enable javascript and cookies to continue",
+    )),
+)
+
+# Hosts (without www.) a request can end up on when it is redirected to a wall
+REDIRECT_HOSTS = {
+    "consent.google.com": CONSENT,
+    "consent.youtube.com": CONSENT,
+}
+
+# Path prefixes of login redirects on social sites
+LOGIN_PATHS = ("/accounts/login", "/login", "/i/flow/login", "/authwall", "/checkpoint")
+
+# Search pages and the markup that shows their results (or "no results") are there
+RESULT_CONTAINERS = {
+    ("google.com", "/search"): ('id="search"', 'id="rso"', 'id="main"', 'id="islrg"', 'class="g'),
+    ("bing.com", "/search"): ('id="b_results"', 'class="b_algo'),
+    ("duckduckgo.com", "/html"): ('class="results"', 'id="links"', 'class="result'),
+    ("html.duckduckgo.com", "/html"): ('class="results"', 'id="links"', 'class="result'),
+}
+
+MAX_SCAN_CHARS = 200000
+
+
+def _host(hostname):
+    hostname = (hostname or "").lower()
+    return hostname[len("www."):] if hostname.startswith("www.") else hostname
+
+
+def expected_containers(url):
+    """
+    Result-container markers for a search page URL, or None for other pages
+    """
+    parsed = urlparse(url)
+    host, path = _host(parsed.hostname), parsed.path or "/"
+    for (container_host, path_prefix), markers in RESULT_CONTAINERS.items():
+        if host == container_host and path.startswith(path_prefix):
+            return markers
+    return None
+
+
+def classify_response(response, url):
+    """
+    Kind of non-result page (CONSENT, CAPTCHA, ...) for a response to url, or None
+
+    url is the URL as the scraper requested it; response.url is where any
+    redirects ended up. Responses to hosts outside upstream_hosts are never
+    classified.
+    """
+    requested = urlparse(url)
+    if upstream_domain(requested.hostname) is None:
+        return None
+
+    final = urlparse(getattr(response, "url", None) or url)
+    final_host = _host(final.hostname)
+    if final_host in REDIRECT_HOSTS:
+        return REDIRECT_HOSTS[final_host]
+    if final.path.startswith("/sorry/"):
+        return CAPTCHA
+    if final_host == _host(requested.hostname) and final.path.startswith(LOGIN_PATHS) \
+            and not requested.path.startswith(LOGIN_PATHS):
+        return LOGIN_WALL
+
+    content_type = response.headers.get("Content-Type", "text/html") if hasattr(response, "headers") else "text/html"
+    if "html" not in content_type:
+        return None
+
+    text = response.text[:MAX_SCAN_CHARS]
+    lowered = text.lower()
+    for kind, markers in PAGE_MARKERS:
+        if any(marker in lowered for marker in markers):
+            return kind
+
+    containers = expected_containers(url)
+    if containers and response.status_code == 200 and not any(marker in text for marker in containers):
+        return UNEXPECTED_LAYOUT
+    return None
@@ -0,0 +1,134 @@
+"""
+Short-lived server-side store for search result sets
+
+/search keeps the full ranked result list here and only returns its first page;
+the remaining pages are served from the store by GET /results/{result_id}.
+"""
+
+import os
+import time
+import uuid
+import threading
+import logging
+from collections import OrderedDict
+
+from metrics import CACHE_HITS, CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+RESULT_TTL_SECONDS = int(os.getenv("RESULT_TTL_SECONDS", "900"))
+MAX_RESULT_SETS = int(os.getenv("MAX_RESULT_SETS", "200"))
+
+
+def summarize_results(results):
+    """
+    Aggregate counts shown in the results summary (computed once per result set)
+    """
+    platforms = {}
+    for result in results:
+        platform = result.get('platform')
+        if platform:
+            platforms[platform] = platforms.get(platform, 0) + 1
+
+    def count_search_type(keyword):
+        return sum(1 for result in results if keyword in (result.get('search_type') or ''))
+
+    return {
+        "total": len(results),
+        "platforms": platforms,
+        "verified": sum(1 for result in results if result.get('verified_content') or result.get('verified_working')),
+        "high_quality": sum(1 for result in results if (result.get('score') or 0) >= 0.7),
+        "social": count_search_type('social'),
+        "professional": count_search_type('professional'),
+        "academic": count_search_type('academic'),
+    }
+
+
+def clamp_page_size(limit):
+    """
+    Keep a requested page size within [1, MAX_PAGE_SIZE]
+    """
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+class ResultStore:
+    """
+    Thread-safe in-memory result sets that expire after a TTL
+    """
+
+    def __init__(self, ttl_seconds=RESULT_TTL_SECONDS, max_entries=MAX_RESULT_SETS):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now):
+        expired = [result_id for result_id, entry in self._entries.items() if entry["expires_at"] <= now]
+        for result_id in expired:
+            del self._entries[result_id]
+
+        # Drop the oldest result sets when over capacity
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self, results):
+        """
+        Store a ranked result list and return its result set ID
+        """
+        result_id = uuid.uuid4().hex
+        now = time.monotonic()
+
+        with self._lock:
+            self._entries[result_id] = {
+                "results": list(results),
+                "summary": summarize_results(results),
+                "expires_at": now + self.ttl_seconds,
+            }
+            self._evict_expired(now)
+
+        return result_id
+
+    def get_page(self, result_id, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Return one page of a stored result set
+
+        The cursor is the offset of the first result of the page (as returned in
+        next_cursor). Returns None if the result set is unknown or expired.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(result_id)
+            if entry is None or entry["expires_at"] <= now:
+                self._entries.pop(result_id, None)
+                CACHE_MISSES.inc(cache="result_store")
+                return None
+            results = entry["results"]
+            summary = entry["summary"]
+        CACHE_HITS.inc(cache="result_store")
+
+        try:
+            offset = max(0, int(cursor)) if cursor else 0
+        except (TypeError, ValueError):
+            offset = 0
+
+        limit = clamp_page_size(limit)
+        end = offset + limit
+
+        return {
+            "result_id": result_id,
+            "results": results[offset:end],
+            "cursor": str(offset),
+            "next_cursor": str(end) if end < len(results) else None,
+            "total_results": len(results),
+            "summary": summary,
+        }
+
+
+result_store = ResultStore()
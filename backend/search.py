@@ -1,14 +1,27 @@
-from deepface import DeepFace
-from bs4 import BeautifulSoup
-import requests
+import http_client
 import tempfile
 import os
 import time
 import random
 import json
 import re
+import logging
 from urllib.parse import quote_plus, urlparse, urljoin
-from utils import cosine_similarity, cleanup_file, preprocess_image_for_face_detection
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from utils import cosine_similarity, cleanup_file
+from face_analysis import FaceAnalysis
+from keyword_matcher import (
+    scan_keywords, count_hits, has_any, classify,
+    CONTENT_QUALITY_INDICATORS, PROFILE_KEYWORDS, SOCIAL_KEYWORDS, SOURCE_TYPE_RULES
+)
+from name_query import NameQuery
+from search_context import with_search_context, current_search
+from instant_results import (
+    render_templates, platform_search_url, PLATFORM_SEARCH_TEMPLATES, WEB_SEARCH_TEMPLATES, ACADEMIC_SEARCH_TEMPLATES,
+)
+from tracing import traced, bind_context
+
+logger = logging.getLogger(__name__)
 
 try:
     from enhanced_scraping import enhanced_comprehensive_search, EnhancedDataScraper
@@ -17,16 +30,17 @@ try:
 except ImportError:
     ENHANCED_MODULES_AVAILABLE = False
 
+@traced
 def extract_actual_web_content(name, max_results=50):
     """Extract actual web content using comprehensive scraping methods - 100% complete"""
     all_results = []
     results = []  # Initialize results to avoid undefined variable error
     
     try:
-        print(f"Starting COMPREHENSIVE 100% web scraping for: {name}")
+        logger.info("Starting COMPREHENSIVE 100%% web scraping for: %s", name)
         
         # SOCIAL MEDIA PLATFORMS
-        print("🔍 Scraping Social Media Platforms...")
+        logger.info("Scraping Social Media Platforms...")
         instagram_results = scrape_instagram_directly(name)
         all_results.extend(instagram_results)
         
@@ -40,7 +54,7 @@ def extract_actual_web_content(name, max_results=50):
         all_results.extend(linkedin_results)
         
         # VIDEO PLATFORMS
-        print("🎥 Scraping Video Platforms...")
+        logger.info("Scraping Video Platforms...")
         youtube_results = scrape_youtube_content(name)
         all_results.extend(youtube_results)
         
@@ -48,7 +62,7 @@ def extract_actual_web_content(name, max_results=50):
         all_results.extend(tiktok_results)
         
         # NEWS AND MEDIA WEBSITES
-        print("📰 Scraping News and Media...")
+        logger.info("Scraping News and Media...")
         news_results = scrape_news_websites(name)
         all_results.extend(news_results)
         
@@ -56,7 +70,7 @@ def extract_actual_web_content(name, max_results=50):
         all_results.extend(blog_results)
         
         # FORUMS AND DISCUSSION PLATFORMS
-        print("💬 Scraping Forums and Discussions...")
+        logger.info("Scraping Forums and Discussions...")
         reddit_results = scrape_reddit_content(name)
         all_results.extend(reddit_results)
         
@@ -67,7 +81,7 @@ def extract_actual_web_content(name, max_results=50):
         all_results.extend(forum_results)
         
         # IMAGE AND MEDIA PLATFORMS
-        print("🖼️ Scraping Image and Media Platforms...")
+        logger.info("Scraping Image and Media Platforms...")
         pinterest_results = scrape_pinterest_content(name)
         all_results.extend(pinterest_results)
         
@@ -75,34 +89,34 @@ def extract_actual_web_content(name, max_results=50):
         all_results.extend(image_results)
         
         # PROFESSIONAL AND BUSINESS PLATFORMS
-        print("💼 Scraping Professional Platforms...")
+        logger.info("Scraping Professional Platforms...")
         business_results = scrape_business_platforms(name)
         all_results.extend(business_results)
         
         # GENERAL WEB CONTENT
-        print("🌐 Scraping General Web Content...")
+        logger.info("Scraping General Web Content...")
         web_results = scrape_general_web_content(name)
         all_results.extend(web_results)
         
         # ALTERNATIVE SEARCH ENGINES
-        print("🔎 Using Alternative Search Engines...")
+        logger.info("Using Alternative Search Engines...")
         alternative_results = scrape_alternative_engines(name)
         all_results.extend(alternative_results)
         
         # DEEP WEB AND SPECIALIZED CONTENT
-        print("🕷️ Deep Web and Specialized Content...")
+        logger.info("Deep Web and Specialized Content...")
         deep_results = scrape_specialized_content(name)
         all_results.extend(deep_results)
         
         # Process and rank all results
         final_results = process_scraped_content(all_results, name, max_results)
         
-        print(f"✅ COMPLETE: Scraped {len(final_results)} pieces of comprehensive content for '{name}'")
-        print(f"📊 Total sources checked: {len(all_results)} across all platforms")
+        logger.info("COMPLETE: Scraped %s pieces of comprehensive content for '%s'", len(final_results), name)
+        logger.info("Total sources checked: %s across all platforms", len(all_results))
         return final_results
         
     except Exception as e:
-        print(f"❌ Web scraping error: {e}")
+        logger.error("Web scraping error: %s", e)
         return []
 
 def scrape_instagram_directly(name):
@@ -110,7 +124,7 @@ def scrape_instagram_directly(name):
     results = []
     
     try:
-        print(f"Scraping Instagram for: {name}")
+        logger.info("Scraping Instagram for: %s", name)
         
         # Method 1: Instagram hashtag and user search
         search_methods = [
@@ -130,18 +144,18 @@ def scrape_instagram_directly(name):
         
         for url in search_methods:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Look for actual content
                     content_found = extract_instagram_content(soup, name, url)
                     results.extend(content_found)
                     
-                time.sleep(3)  # Rate limiting
+                http_client.pause(3)  # Rate limiting
                 
             except Exception as e:
-                print(f"Error scraping Instagram URL {url}: {e}")
+                logger.error("Error scraping Instagram URL %s: %s", url, e)
                 continue
         
         # Method 2: Use Instagram's public API endpoints
@@ -149,7 +163,7 @@ def scrape_instagram_directly(name):
         results.extend(api_results)
         
     except Exception as e:
-        print(f"Instagram scraping error: {e}")
+        logger.error("Instagram scraping error: %s", e)
     
     return results
 
@@ -171,14 +185,14 @@ def extract_instagram_content(soup, name, source_url):
             '.caption'
         ]
         
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         for selector in content_selectors:
             elements = soup.select(selector)
             for element in elements:
                 text_content = element.get_text().strip()
                 
-                if name_lower in text_content.lower() and len(text_content) > 20:
+                if query.contains(text_content) and len(text_content) > 20:
                     # Try to extract more details
                     post_details = {
                         "platform": "Instagram",
@@ -206,7 +220,7 @@ def extract_instagram_content(soup, name, source_url):
                     content.append(post_details)
         
     except Exception as e:
-        print(f"Error extracting Instagram content: {e}")
+        logger.error("Error extracting Instagram content: %s", e)
     
     return content
 
@@ -228,14 +242,14 @@ def scrape_instagram_api(name):
         
         for url in api_urls:
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                response = http_client.get(url, headers=headers, timeout=10)
                 if response.status_code == 200:
                     try:
                         data = response.json()
                         # Process JSON response for user/content data
                         if 'users' in data:
                             for user in data.get('users', []):
-                                if name.lower() in user.get('full_name', '').lower():
+                                if NameQuery.of(name).contains(user.get('full_name', '')):
                                     results.append({
                                         "platform": "Instagram",
                                         "content": f"Profile: {user.get('full_name', '')} (@{user.get('username', '')})",
@@ -249,11 +263,11 @@ def scrape_instagram_api(name):
                         pass
                         
             except Exception as e:
-                print(f"Error with Instagram API {url}: {e}")
+                logger.error("Error with Instagram API %s: %s", url, e)
                 continue
                 
     except Exception as e:
-        print(f"Instagram API error: {e}")
+        logger.error("Instagram API error: %s", e)
     
     return results
 
@@ -262,7 +276,7 @@ def scrape_twitter_directly(name):
     results = []
     
     try:
-        print(f"Scraping Twitter for: {name}")
+        logger.info("Scraping Twitter for: %s", name)
         
         # Twitter scraping methods
         search_urls = [
@@ -278,22 +292,22 @@ def scrape_twitter_directly(name):
         
         for url in search_urls:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract Twitter content
                     twitter_content = extract_twitter_content(soup, name, url)
                     results.extend(twitter_content)
                     
-                time.sleep(4)  # Rate limiting
+                http_client.pause(4)  # Rate limiting
                 
             except Exception as e:
-                print(f"Error scraping Twitter URL {url}: {e}")
+                logger.error("Error scraping Twitter URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Twitter scraping error: {e}")
+        logger.error("Twitter scraping error: %s", e)
     
     return results
 
@@ -311,14 +325,14 @@ def extract_twitter_content(soup, name, source_url):
             '.timeline-item'
         ]
         
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         for selector in tweet_selectors:
             tweets = soup.select(selector)
             for tweet in tweets:
                 tweet_text = tweet.get_text().strip()
                 
-                if name_lower in tweet_text.lower() and len(tweet_text) > 20:
+                if query.contains(tweet_text) and len(tweet_text) > 20:
                     tweet_data = {
                         "platform": "Twitter/X",
                         "content": tweet_text[:400],
@@ -345,7 +359,7 @@ def extract_twitter_content(soup, name, source_url):
                     content.append(tweet_data)
         
     except Exception as e:
-        print(f"Error extracting Twitter content: {e}")
+        logger.error("Error extracting Twitter content: %s", e)
     
     return content
 
@@ -354,7 +368,7 @@ def scrape_facebook_public(name):
     results = []
     
     try:
-        print(f"Scraping Facebook for: {name}")
+        logger.info("Scraping Facebook for: %s", name)
         
         # Facebook public search
         search_urls = [
@@ -370,22 +384,22 @@ def scrape_facebook_public(name):
         
         for url in search_urls:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract Facebook content
                     fb_content = extract_facebook_content(soup, name, url)
                     results.extend(fb_content)
                     
-                time.sleep(5)  # Rate limiting
+                http_client.pause(5)  # Rate limiting
                 
             except Exception as e:
-                print(f"Error scraping Facebook URL {url}: {e}")
+                logger.error("Error scraping Facebook URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Facebook scraping error: {e}")
+        logger.error("Facebook scraping error: %s", e)
     
     return results
 
@@ -394,10 +408,10 @@ def extract_facebook_content(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Facebook content patterns
-        content_elements = soup.find_all(['div', 'span', 'p'], string=lambda text: text and name_lower in text.lower())
+        content_elements = soup.find_all(['div', 'span', 'p'], string=lambda text: text and query.contains(text))
         
         for element in content_elements:
             if element.get_text().strip():
@@ -412,7 +426,7 @@ def extract_facebook_content(soup, name, source_url):
                     })
         
     except Exception as e:
-        print(f"Error extracting Facebook content: {e}")
+        logger.error("Error extracting Facebook content: %s", e)
     
     return content
 
@@ -421,7 +435,7 @@ def scrape_linkedin_public(name):
     results = []
     
     try:
-        print(f"Scraping LinkedIn for: {name}")
+        logger.info("Scraping LinkedIn for: %s", name)
         
         # LinkedIn public search
         search_url = f"https://www.linkedin.com/pub/dir/{quote_plus(name.split()[0])}/{quote_plus(name.split()[-1]) if len(name.split()) > 1 else ''}"
@@ -432,19 +446,19 @@ def scrape_linkedin_public(name):
         }
         
         try:
-            response = requests.get(search_url, headers=headers, timeout=15)
+            response = http_client.get(search_url, headers=headers, timeout=15)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # Extract LinkedIn profiles
                 linkedin_content = extract_linkedin_content(soup, name, search_url)
                 results.extend(linkedin_content)
                 
         except Exception as e:
-            print(f"Error scraping LinkedIn: {e}")
+            logger.error("Error scraping LinkedIn: %s", e)
         
     except Exception as e:
-        print(f"LinkedIn scraping error: {e}")
+        logger.error("LinkedIn scraping error: %s", e)
     
     return results
 
@@ -453,14 +467,14 @@ def extract_linkedin_content(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for profile information
         profiles = soup.find_all(['div', 'section'], class_=lambda x: x and 'profile' in x.lower())
         
         for profile in profiles:
             profile_text = profile.get_text().strip()
-            if name_lower in profile_text.lower():
+            if query.contains(profile_text):
                 content.append({
                     "platform": "LinkedIn",
                     "content": profile_text[:400],
@@ -470,7 +484,7 @@ def extract_linkedin_content(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting LinkedIn content: {e}")
+        logger.error("Error extracting LinkedIn content: %s", e)
     
     return content
 
@@ -493,22 +507,22 @@ def scrape_alternative_engines(name):
         
         for search_url in search_engines:
             try:
-                response = requests.get(search_url, headers=headers, timeout=15)
+                response = http_client.get(search_url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract search results and scrape their content
                     search_results = extract_alternative_search_results(soup, name, search_url)
                     results.extend(search_results)
                     
-                time.sleep(4)
+                http_client.pause(4)
                 
             except Exception as e:
-                print(f"Error with alternative search engine {search_url}: {e}")
+                logger.error("Error with alternative search engine %s: %s", search_url, e)
                 continue
         
     except Exception as e:
-        print(f"Alternative engines error: {e}")
+        logger.error("Alternative engines error: %s", e)
     
     return results
 
@@ -526,14 +540,14 @@ def extract_alternative_search_results(soup, name, source_url):
             
             # Check if it's a social media link with the name
             if any(domain in href for domain in ['instagram.com', 'twitter.com', 'x.com', 'facebook.com', 'linkedin.com']):
-                if name.lower() in link_text.lower():
+                if NameQuery.of(name).contains(link_text):
                     # Try to scrape the actual page
                     page_content = scrape_actual_page(href, name)
                     if page_content:
                         results.append(page_content)
         
     except Exception as e:
-        print(f"Error extracting alternative search results: {e}")
+        logger.error("Error extracting alternative search results: %s", e)
     
     return results
 
@@ -545,18 +559,13 @@ def scrape_actual_page(url, name):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_client.get(url, headers=headers, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-                
-            page_text = soup.get_text()
+            # Text without script and style elements
+            page_text = http_client.response_text(response, visible=True)
             
             # Check if name appears in actual content
-            if name.lower() in page_text.lower():
+            if NameQuery.of(name).contains(page_text):
                 platform = "Unknown"
                 if "instagram.com" in url:
                     platform = "Instagram"
@@ -577,7 +586,7 @@ def scrape_actual_page(url, name):
                 }
     
     except Exception as e:
-        print(f"Error scraping actual page {url}: {e}")
+        logger.error("Error scraping actual page %s: %s", url, e)
     
     return None
 
@@ -599,11 +608,11 @@ def scrape_platform_content_directly(name):
                 platform_results = platform["method"](name)
                 results.extend(platform_results)
             except Exception as e:
-                print(f"Error scraping {platform['name']}: {e}")
+                logger.error("Error scraping %s: %s", platform['name'], e)
                 continue
     
     except Exception as e:
-        print(f"Platform scraping error: {e}")
+        logger.error("Platform scraping error: %s", e)
     
     return results
 
@@ -651,7 +660,7 @@ def process_scraped_content(all_results, name, max_results):
         return unique_results[:max_results]
         
     except Exception as e:
-        print(f"Error processing scraped content: {e}")
+        logger.error("Error processing scraped content: %s", e)
         return []
 
 def calculate_scraped_content_score(result, name):
@@ -660,10 +669,9 @@ def calculate_scraped_content_score(result, name):
     
     try:
         content = result.get('content', '').lower()
-        name_lower = name.lower()
         
         # Name presence scoring
-        if name_lower in content:
+        if NameQuery.of(name).contains(content, lowered=True):
             score += 0.3
         
         # Content type bonuses
@@ -692,7 +700,7 @@ def calculate_scraped_content_score(result, name):
         return min(score, 1.0)
         
     except Exception as e:
-        print(f"Error calculating score: {e}")
+        logger.error("Error calculating score: %s", e)
         return 0.5
 
 def create_scraped_content_preview(result, name):
@@ -722,7 +730,7 @@ def create_scraped_content_preview(result, name):
         return " • ".join(preview_parts)
         
     except Exception as e:
-        print(f"Error creating preview: {e}")
+        logger.error("Error creating preview: %s", e)
         return f"{result.get('platform', 'Unknown')} content mentioning {name}"
     
     return results
@@ -771,7 +779,7 @@ def process_scraped_content(all_results, name, max_results):
         return unique_results[:max_results]
         
     except Exception as e:
-        print(f"Error processing scraped content: {e}")
+        logger.error("Error processing scraped content: %s", e)
         return []
 
 def calculate_scraped_content_score(result, name):
@@ -780,10 +788,9 @@ def calculate_scraped_content_score(result, name):
     
     try:
         content = result.get('content', '').lower()
-        name_lower = name.lower()
         
         # Name presence scoring
-        if name_lower in content:
+        if NameQuery.of(name).contains(content, lowered=True):
             score += 0.3
         
         # Content type bonuses
@@ -812,7 +819,7 @@ def calculate_scraped_content_score(result, name):
         return min(score, 1.0)
         
     except Exception as e:
-        print(f"Error calculating score: {e}")
+        logger.error("Error calculating score: %s", e)
         return 0.5
 
 def create_scraped_content_preview(result, name):
@@ -842,7 +849,7 @@ def create_scraped_content_preview(result, name):
         return " • ".join(preview_parts)
         
     except Exception as e:
-        print(f"Error creating preview: {e}")
+        logger.error("Error creating preview: %s", e)
         return f"{result.get('platform', 'Unknown')} content mentioning {name}"
 
 def extract_result_content(result_element, name, content_type):
@@ -870,9 +877,8 @@ def extract_result_content(result_element, name, content_type):
         
         # Verify name presence
         combined_text = f"{title} {snippet}".lower()
-        name_lower = name.lower()
         
-        if name_lower in combined_text and url and title:
+        if NameQuery.of(name).contains(combined_text, lowered=True) and url and title:
             # Identify platform and content type
             platform_info = identify_platform_and_content(url, title, snippet)
             
@@ -889,10 +895,11 @@ def extract_result_content(result_element, name, content_type):
             }
     
     except Exception as e:
-        print(f"Error extracting result content: {e}")
+        logger.error("Error extracting result content: %s", e)
     
     return None
 
+@traced
 def scrape_page_content(url, name):
     """Actually scrape the target page to get real content"""
     try:
@@ -901,23 +908,17 @@ def scrape_page_content(url, name):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_client.get(url, headers=headers, timeout=15)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text_content = soup.get_text()
+            # Text content without script and style elements; nothing else reads this page
+            text_content = http_client.response_text(response, visible=True)
+            http_client.release(response)
             lines = (line.strip() for line in text_content.splitlines())
             chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
             page_text = ' '.join(chunk for chunk in chunks if chunk)
             
             # Look for name mentions in actual content
-            name_lower = name.lower()
-            if name_lower in page_text.lower():
+            if NameQuery.of(name).contains(page_text):
                 # Extract context around name mentions
                 contexts = extract_mention_contexts(page_text, name)
                 
@@ -929,7 +930,7 @@ def scrape_page_content(url, name):
                 }
     
     except Exception as e:
-        print(f"Error scraping page {url}: {e}")
+        logger.error("Error scraping page %s: %s", url, e)
     
     return None
 
@@ -956,15 +957,8 @@ def identify_platform_and_content(url, title, snippet):
             break
     
     # Determine content type from title/snippet
-    content_lower = f"{title} {snippet}".lower()
-    if any(word in content_lower for word in ['profile', 'bio', 'about']):
-        source_type = "profile"
-    elif any(word in content_lower for word in ['post', 'tweet', 'status']):
-        source_type = "post" 
-    elif any(word in content_lower for word in ['photo', 'image', 'picture']):
-        source_type = "media"
-    elif any(word in content_lower for word in ['comment', 'reply']):
-        source_type = "interaction"
+    hits = scan_keywords(f"{title} {snippet}".lower())
+    source_type = classify(hits, SOURCE_TYPE_RULES, source_type)
     
     return {
         "platform": platform,
@@ -974,29 +968,21 @@ def identify_platform_and_content(url, title, snippet):
 def calculate_content_relevance(name, title, snippet, content_type):
     """Calculate how relevant the content is"""
     score = 0.0
-    name_lower = name.lower()
+    query = NameQuery.of(name)
     title_lower = title.lower()
     snippet_lower = snippet.lower()
     
     # Base score for name presence
-    if name_lower in title_lower:
+    if query.contains(title_lower, lowered=True):
         score += 0.4
-    if name_lower in snippet_lower:
+    if query.contains(snippet_lower, lowered=True):
         score += 0.3
     
-    # Bonus for exact name match (with spaces/punctuation)
-    name_variations = [
-        f" {name_lower} ",
-        f'"{name_lower}"',
-        f"@{name_lower.replace(' ', '')}",
-        f"#{name_lower.replace(' ', '')}"
-    ]
-    
-    combined_text = f" {title_lower} {snippet_lower} "
-    for variation in name_variations:
-        if variation in combined_text:
-            score += 0.25
-            break
+    # Bonus for exact name match (whole words, @handle or #hashtag)
+    combined_text = f"{title_lower} {snippet_lower}"
+    if (query.exact(combined_text) or f"@{query.compact}" in combined_text
+            or f"#{query.compact}" in combined_text):
+        score += 0.25
     
     # Content type bonuses
     content_bonuses = {
@@ -1009,57 +995,21 @@ def calculate_content_relevance(name, title, snippet, content_type):
     score += content_bonuses.get(content_type, 0.1)
     
     # Context indicators
-    quality_indicators = [
-        'profile', 'bio', 'about', 'works at', 'studies at',
-        'posted by', 'shared by', 'tagged', 'mentioned',
-        'follow', 'following', 'followers'
-    ]
-    
-    indicator_count = sum(1 for indicator in quality_indicators 
-                         if indicator in f"{title_lower} {snippet_lower}")
+    hits = scan_keywords(f"{title_lower} {snippet_lower}")
+    indicator_count = count_hits(hits, CONTENT_QUALITY_INDICATORS)
     score += min(indicator_count * 0.1, 0.3)
     
     return min(score, 1.0)
 
 def extract_name_context(text, name):
     """Extract context around name mentions"""
-    contexts = []
-    name_lower = name.lower()
-    text_lower = text.lower()
-    
-    # Find all positions where name appears
-    start = 0
-    while True:
-        pos = text_lower.find(name_lower, start)
-        if pos == -1:
-            break
-            
-        # Extract context (50 chars before and after)
-        context_start = max(0, pos - 50)
-        context_end = min(len(text), pos + len(name) + 50)
-        context = text[context_start:context_end].strip()
-        
-        if context and context not in contexts:
-            contexts.append(context)
-        
-        start = pos + 1
-    
-    return contexts[:3]  # Max 3 contexts
+    # Extract context (50 chars before and after), max 3 contexts
+    return NameQuery.of(name).find_contexts(text, window=50, limit=3)
 
 def extract_mention_contexts(text, name):
     """Extract detailed context around name mentions in scraped content"""
-    contexts = []
-    name_lower = name.lower()
-    text_lower = text.lower()
-    
-    sentences = text.split('.')
-    for sentence in sentences:
-        if name_lower in sentence.lower():
-            clean_sentence = sentence.strip()
-            if clean_sentence and len(clean_sentence) > 10:
-                contexts.append(clean_sentence[:200])  # Limit to 200 chars
-    
-    return contexts[:5]  # Max 5 contexts
+    # Whole sentences longer than 10 chars, limited to 200 chars, max 5 contexts
+    return NameQuery.of(name).find_contexts(text, limit=5, sentences=True, min_length=11, max_length=200)
 
 def process_and_rank_content(all_content, name, max_results):
     """Process and rank all extracted content"""
@@ -1097,7 +1047,7 @@ def process_and_rank_content(all_content, name, max_results):
             processed.append(result_entry)
             
         except Exception as e:
-            print(f"Error processing content: {e}")
+            logger.error("Error processing content: %s", e)
             continue
     
     # Sort by score and remove duplicates
@@ -1140,30 +1090,32 @@ def calculate_mention_score(name, title, snippet):
     """Calculate how relevant/accurate a mention is"""
     score = 0.5  # Base score
     
-    name_lower = name.lower()
+    query = NameQuery.of(name)
     title_lower = title.lower()
     snippet_lower = snippet.lower()
     
     # Higher score if name appears in title
-    if name_lower in title_lower:
+    if query.contains(title_lower, lowered=True):
         score += 0.3
     
     # Check for exact name match vs partial
-    if f" {name_lower} " in f" {title_lower} " or f" {name_lower} " in f" {snippet_lower} ":
+    if query.exact(title_lower) or query.exact(snippet_lower):
         score += 0.2  # Exact name match
     
+    # Title and snippet are scanned together; the newline keeps keywords from matching across them
+    hits = scan_keywords(f"{title_lower}\n{snippet_lower}")
+    
     # Higher score for profile-related content
-    profile_keywords = ['profile', 'bio', 'about', 'account', 'user', 'member']
-    if any(keyword in title_lower or keyword in snippet_lower for keyword in profile_keywords):
+    if has_any(hits, PROFILE_KEYWORDS):
         score += 0.15
     
     # Bonus for social media indicators
-    social_keywords = ['follow', 'followers', 'following', 'posts', 'tweets', 'photos']
-    if any(keyword in title_lower or keyword in snippet_lower for keyword in social_keywords):
+    if has_any(hits, SOCIAL_KEYWORDS):
         score += 0.1
     
     return min(0.95, score)  # Cap at 0.95
 
+@traced
 def scrape_social_media_directly(name, max_results=30):
     """Try to scrape social media platforms directly for public content"""
     results = []
@@ -1189,10 +1141,10 @@ def scrape_social_media_directly(name, max_results=30):
     for platform in platforms:
         try:
             # Use Google to find public content on the platform
-            response = requests.get(platform["public_search"], headers=headers, timeout=10)
+            response = http_client.get(platform["public_search"], headers=headers, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # Look for results that aren't "no results found"
                 no_results_indicators = [
@@ -1201,7 +1153,7 @@ def scrape_social_media_directly(name, max_results=30):
                     'Try different keywords'
                 ]
                 
-                page_text = soup.get_text()
+                page_text = http_client.response_text(response)
                 has_results = not any(indicator in page_text for indicator in no_results_indicators)
                 
                 if has_results:
@@ -1217,7 +1169,7 @@ def scrape_social_media_directly(name, max_results=30):
                                 title = title_elem.get_text()
                                 snippet = snippet_elem.get_text()
                                 
-                                if name.lower() in f"{title} {snippet}".lower():
+                                if NameQuery.of(name).contains(f"{title} {snippet}"):
                                     score = calculate_mention_score(name, title, snippet)
                                     
                                     results.append({
@@ -1233,14 +1185,15 @@ def scrape_social_media_directly(name, max_results=30):
                         except Exception as e:
                             continue
             
-            time.sleep(1)  # Rate limiting
+            http_client.pause(1)  # Rate limiting
             
         except Exception as e:
-            print(f"Error scraping {platform['name']}: {e}")
+            logger.error("Error scraping %s: %s", platform['name'], e)
             continue
     
     return results
 
+@traced
 def verify_content_mentions(name, url, max_attempts=1):
     """Verify that a name actually appears in the content of a webpage"""
     try:
@@ -1248,43 +1201,25 @@ def verify_content_mentions(name, url, max_attempts=1):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text_content = soup.get_text()
+            # Text content without script and style elements; nothing else reads this page
+            text_content = http_client.response_text(response, visible=True)
+            http_client.release(response)
             
             # Check if name appears
-            name_lower = name.lower()
-            content_lower = text_content.lower()
+            query = NameQuery.of(name)
             
-            if name_lower in content_lower:
-                # Extract context around the name mention
-                words = text_content.split()
-                name_words = name.lower().split()
-                
-                for i, word in enumerate(words):
-                    if name_words[0].lower() in word.lower():
-                        # Check if full name matches in sequence
-                        if len(name_words) == 1 or (i + len(name_words) <= len(words) and 
-                            all(name_words[j].lower() in words[i+j].lower() for j in range(len(name_words)))):
-                            
-                            # Extract context (10 words before and after)
-                            start = max(0, i - 10)
-                            end = min(len(words), i + len(name_words) + 10)
-                            context = ' '.join(words[start:end])
-                            
-                            return {
-                                "found": True,
-                                "context": context,
-                                "confidence": 0.9
-                            }
+            if query.contains(text_content):
+                # Extract context (10 words before and after) around the full name
+                contexts = query.find_contexts(text_content, limit=1, words=10)
+                if contexts:
+                    return {
+                        "found": True,
+                        "context": ' '.join(contexts[0].split()),
+                        "confidence": 0.9
+                    }
                 
                 return {
                     "found": True,
@@ -1292,167 +1227,111 @@ def verify_content_mentions(name, url, max_attempts=1):
                     "confidence": 0.7
                 }
             
-        return {"found": False, "context": "", "confidence": 0}
+            return {"found": False, "context": "", "confidence": 0}
+        
+        # The page was not read: "error" tells callers this is no evidence of absence
+        return {"found": False, "context": "", "confidence": 0, "error": f"HTTP {response.status_code}"}
         
     except Exception as e:
-        print(f"Content verification error: {e}")
-        return {"found": False, "context": "", "confidence": 0}
-
-def create_accurate_platform_searches(name):
-    """Create 100% accurate, working search links for each platform"""
-    results = []
+        logger.error("Content verification error: %s", e)
+        return {"found": False, "context": "", "confidence": 0, "error": str(e) or type(e).__name__}
+
+# Content verification limits for search_identity (STEP 5)
+VERIFY_MAX_CANDIDATES = 30
+VERIFY_MAX_WORKERS = 6
+VERIFY_TIME_BUDGET_SECONDS = 15.0
+
+def _mark_verified(result, context, verification):
+    result["verified_content"] = True
+    result["verification"] = verification
+    if context:
+        result["context"] = context
+    result["score"] = min(0.95, result.get("score", 0) + 0.1)
+
+@traced
+def verify_results_concurrently(name, results, max_candidates=VERIFY_MAX_CANDIDATES,
+                                max_workers=VERIFY_MAX_WORKERS, time_budget=VERIFY_TIME_BUDGET_SECONDS):
+    """
+    Verify name mentions for unverified results in place, best-scored first
     
-    # Direct platform search URLs that are guaranteed to work
-    platforms = [
-        {
-            "name": "LinkedIn",
-            "search_url": f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(name)}",
-            "description": f"Direct LinkedIn search for '{name}' - guaranteed working link",
-            "score": 0.90,
-            "search_type": "professional_verified",
-            "working": True
-        },
-        {
-            "name": "Twitter/X",
-            "search_url": f"https://twitter.com/search?q={quote_plus(name)}&src=typed_query&f=user",
-            "description": f"Direct Twitter/X user search for '{name}' - guaranteed working link",
-            "score": 0.88,
-            "search_type": "social_media_verified",
-            "working": True
-        },
-        {
-            "name": "Facebook",
-            "search_url": f"https://www.facebook.com/search/people/?q={quote_plus(name)}",
-            "description": f"Direct Facebook people search for '{name}' - guaranteed working link",
-            "score": 0.85,
-            "search_type": "social_media_verified", 
-            "working": True
-        },
-        {
-            "name": "Instagram",
-            "search_url": f"https://www.instagram.com/web/search/topsearch/?query={quote_plus(name)}",
-            "description": f"Direct Instagram search for '{name}' - guaranteed working link",
-            "score": 0.82,
-            "search_type": "social_media_verified",
-            "working": True
-        },
-        {
-            "name": "GitHub",
-            "search_url": f"https://github.com/search?q={quote_plus(name)}&type=users",
-            "description": f"Direct GitHub user search for '{name}' - guaranteed working link",
-            "score": 0.80,
-            "search_type": "professional_verified",
-            "working": True
-        },
-        {
-            "name": "YouTube",
-            "search_url": f"https://www.youtube.com/results?search_query={quote_plus(name)}&sp=EgIQAg%253D%253D",
-            "description": f"Direct YouTube channel search for '{name}' - guaranteed working link",
-            "score": 0.78,
-            "search_type": "media_verified",
-            "working": True
-        },
-        {
-            "name": "Reddit",
-            "search_url": f"https://www.reddit.com/search?q={quote_plus(name)}&type=user",
-            "description": f"Direct Reddit user search for '{name}' - guaranteed working link",
-            "score": 0.75,
-            "search_type": "social_media_verified",
-            "working": True
-        },
-        {
-            "name": "TikTok",
-            "search_url": f"https://www.tiktok.com/search/user?q={quote_plus(name)}",
-            "description": f"Direct TikTok user search for '{name}' - guaranteed working link",
-            "score": 0.72,
-            "search_type": "social_media_verified",
-            "working": True
-        }
+    Results whose SERP title or snippet already contains the exact name are
+    accepted without a fetch. Up to max_candidates of the rest are fetched on a
+    bounded pool. A fetched page without the name is marked "not_found" and
+    scored down; a page that could not be fetched, did not finish within
+    time_budget seconds, or did not make the cut is marked "unverified".
+    """
+    query = NameQuery.of(name)
+    candidates = [
+        result for result in results
+        if result.get("link") and not (result.get("verified_content") or result.get("verified_working"))
     ]
+    candidates.sort(key=lambda result: result.get("score", 0), reverse=True)
+    
+    to_fetch = []
+    for result in candidates:
+        title = result.get("title", "")
+        snippet = result.get("snippet", "")
+        if query.exact(title) or query.exact(snippet):
+            _mark_verified(result, snippet or title, "serp_match")
+        elif len(to_fetch) < max_candidates:
+            to_fetch.append(result)
+        else:
+            result["verification"] = "unverified"
     
-    for platform in platforms:
-        results.append({
-            "source": f"{platform['name']} Direct Search",
-            "preview": f"{platform['description']}. This link will take you directly to {platform['name']}'s search results for '{name}'. All links are tested and working.",
-            "score": platform['score'],
-            "platform": platform['name'],
-            "search_type": platform['search_type'],
-            "link": platform['search_url'],
-            "verified_working": platform['working']
-        })
+    if not to_fetch:
+        return results
     
-    return results
-
-def create_accurate_web_searches(name):
-    """Create 100% accurate web search links"""
-    results = []
+    # Never wait past the request's own deadline
+    search = current_search()
+    if search is not None and search.remaining() is not None:
+        time_budget = min(time_budget, search.remaining())
     
-    # Working search engines with direct links
-    search_engines = [
-        {
-            "name": "Google",
-            "url": f"https://www.google.com/search?q={quote_plus(name + ' profile')}",
-            "description": f"Google search for '{name}' profiles - direct working link"
-        },
-        {
-            "name": "DuckDuckGo",
-            "url": f"https://duckduckgo.com/?q={quote_plus(name + ' profile')}&ia=web",
-            "description": f"DuckDuckGo search for '{name}' - privacy-focused search"
-        },
-        {
-            "name": "Bing",
-            "url": f"https://www.bing.com/search?q={quote_plus(name + ' profile')}",
-            "description": f"Bing search for '{name}' profiles - Microsoft search engine"
-        }
-    ]
+    deadline = time.monotonic() + time_budget
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(to_fetch)), thread_name_prefix="verify")
+    futures = {
+        executor.submit(bind_context(verify_content_mentions), name, result["link"]): result
+        for result in to_fetch
+    }
     
-    for i, engine in enumerate(search_engines):
-        results.append({
-            "source": f"{engine['name']} Web Search",
-            "preview": f"{engine['description']}. Guaranteed working direct link to search results.",
-            "score": 0.70 - (i * 0.03),
-            "platform": engine['name'],
-            "search_type": "web_search_verified",
-            "link": engine['url'],
-            "verified_working": True
-        })
+    try:
+        for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+            result = futures[future]
+            try:
+                verification = future.result()
+            except Exception:
+                continue
+            
+            if verification["found"]:
+                _mark_verified(result, verification["context"], "page_match")
+            elif verification.get("error"):
+                # The page was never read (error, timeout, block, open circuit): no evidence either way
+                result["verification"] = "unverified"
+            else:
+                # Still keep it, but with a lower score
+                result["score"] = max(0.3, result.get("score", 0) - 0.2)
+                result["verification"] = "not_found"
+    except FuturesTimeoutError:
+        pending = sum(1 for future in futures if not future.done())
+        logger.warning("Verification budget of %ss exhausted, %s results left unverified", time_budget, pending)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    for result in to_fetch:
+        result.setdefault("verification", "unverified")
     
     return results
 
+def create_accurate_platform_searches(name):
+    """Create 100% accurate, working search links for each platform"""
+    return render_templates(PLATFORM_SEARCH_TEMPLATES, name)
+
+def create_accurate_web_searches(name):
+    """Create 100% accurate web search links"""
+    return render_templates(WEB_SEARCH_TEMPLATES, name)
+
 def create_accurate_academic_searches(name):
     """Create 100% accurate academic search links"""
-    results = []
-    
-    academic_platforms = [
-        {
-            "name": "Google Scholar",
-            "url": f"https://scholar.google.com/scholar?q={quote_plus(name)}",
-            "description": f"Google Scholar search for academic papers by '{name}'"
-        },
-        {
-            "name": "ResearchGate",
-            "url": f"https://www.researchgate.net/search/researcher?q={quote_plus(name)}",
-            "description": f"ResearchGate researcher search for '{name}'"
-        },
-        {
-            "name": "ORCID",
-            "url": f"https://orcid.org/orcid-search/search?searchQuery={quote_plus(name)}",
-            "description": f"ORCID researcher database search for '{name}'"
-        }
-    ]
-    
-    for i, platform in enumerate(academic_platforms):
-        results.append({
-            "source": f"{platform['name']} Academic Search",
-            "preview": f"{platform['description']}. Direct working link to academic search results.",
-            "score": 0.65 - (i * 0.03),
-            "platform": platform['name'],
-            "search_type": "academic_verified",
-            "link": platform['url'],
-            "verified_working": True
-        })
-    
-    return results
+    return render_templates(ACADEMIC_SEARCH_TEMPLATES, name)
 
 def search_duckduckgo(name, max_results=3):
     """Search DuckDuckGo with improved result parsing"""
@@ -1466,10 +1345,10 @@ def search_duckduckgo(name, max_results=3):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=12)
+        response = http_client.get(url, headers=headers, timeout=12)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = http_client.parse_response(response)
             
             # Parse search results
             search_results = soup.find_all('div', class_='result')[:max_results]
@@ -1483,7 +1362,8 @@ def search_duckduckgo(name, max_results=3):
                     snippet = snippet_elem.get_text().strip()
                     link = title_elem.get('href', '')
                     
-                    if name.lower() in title.lower() or name.lower() in snippet.lower():
+                    name_query = NameQuery.of(name)
+                    if name_query.contains(title) or name_query.contains(snippet):
                         results.append({
                             "source": f"Web Search: {title[:50]}...",
                             "preview": f"{snippet[:200]}...",
@@ -1496,7 +1376,7 @@ def search_duckduckgo(name, max_results=3):
         # Fallback to API if HTML parsing fails
         if not results:
             api_url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
-            api_response = requests.get(api_url, headers=headers, timeout=10)
+            api_response = http_client.get(api_url, headers=headers, timeout=10)
             data = api_response.json()
             
             if data.get('AbstractText'):
@@ -1509,7 +1389,7 @@ def search_duckduckgo(name, max_results=3):
                 })
                 
     except Exception as e:
-        print(f"DuckDuckGo search error: {e}")
+        logger.error("DuckDuckGo search error: %s", e)
     
     return results
 
@@ -1524,7 +1404,7 @@ def search_wikipedia(name, max_results=2):
             'User-Agent': 'NameFaceIdentityFinder/1.0 (https://github.com/example/name-face-finder)'
         }
         
-        response = requests.get(url, headers=headers, timeout=8)
+        response = http_client.get(url, headers=headers, timeout=8)
         
         if response.status_code == 200:
             data = response.json()
@@ -1537,7 +1417,7 @@ def search_wikipedia(name, max_results=2):
         
         # Also try search API if direct lookup fails
         search_url = f"https://en.wikipedia.org/api/rest_v1/page/search/{quote_plus(name)}"
-        search_response = requests.get(search_url, headers=headers, timeout=8)
+        search_response = http_client.get(search_url, headers=headers, timeout=8)
         
         if search_response.status_code == 200:
             search_data = search_response.json()
@@ -1550,7 +1430,7 @@ def search_wikipedia(name, max_results=2):
                     })
                     
     except Exception as e:
-        print(f"Wikipedia search error: {e}")
+        logger.error("Wikipedia search error: %s", e)
     
     return results
 
@@ -1603,10 +1483,10 @@ def search_academic_professional(name, max_results=4):
                 "link": source['url']
             })
             
-            time.sleep(0.3)
+            http_client.pause(0.3)
                 
         except Exception as e:
-            print(f"Academic search error for {source['name']}: {e}")
+            logger.error("Academic search error for %s: %s", source['name'], e)
     
     return results
 
@@ -1689,7 +1569,7 @@ def search_news_and_media(name, max_results=4):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             }
             
-            response = requests.get(source["url"], headers=headers, timeout=10)
+            response = http_client.get(source["url"], headers=headers, timeout=10)
             
             if response.status_code == 200:
                 # For demonstration, we'll create realistic results
@@ -1705,10 +1585,10 @@ def search_news_and_media(name, max_results=4):
                     "link": source['url']
                 })
             
-            time.sleep(0.4)  # Rate limiting
+            http_client.pause(0.4)  # Rate limiting
                 
         except Exception as e:
-            print(f"News search error for {source['name']}: {e}")
+            logger.error("News search error for %s: %s", source['name'], e)
     
     return results
 
@@ -1719,29 +1599,29 @@ def verify_profile_exists(name, platform_url, platform_name):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(platform_url, headers=headers, timeout=10)
+        response = http_client.get(platform_url, headers=headers, timeout=10)
         
         # Check if the response indicates a valid profile
         if response.status_code == 200:
             content = response.text.lower()
-            name_lower = name.lower()
+            name_found = NameQuery.of(name).contains(content, lowered=True)
             
             # Platform-specific verification logic
             if 'linkedin.com' in platform_url:
-                return ('profile' in content and name_lower in content) or 'linkedin member' in content
+                return ('profile' in content and name_found) or 'linkedin member' in content
             elif 'twitter.com' in platform_url or 'x.com' in platform_url:
-                return 'profile' in content and (name_lower in content or '@' in content)
+                return 'profile' in content and (name_found or '@' in content)
             elif 'facebook.com' in platform_url:
-                return 'facebook' in content and name_lower in content
+                return 'facebook' in content and name_found
             elif 'instagram.com' in platform_url:
-                return 'instagram' in content and name_lower in content
+                return 'instagram' in content and name_found
             else:
-                return name_lower in content
+                return name_found
         
         return False
         
     except Exception as e:
-        print(f"Profile verification failed for {platform_name}: {e}")
+        logger.warning("Profile verification failed for %s: %s", platform_name, e)
         return False
 
 def search_specific_platforms_accurately(name, max_results=6):
@@ -1752,42 +1632,44 @@ def search_specific_platforms_accurately(name, max_results=6):
     platforms = [
         {
             "name": "LinkedIn",
-            "search_url": f"https://www.google.com/search?q={quote_plus(name + ' site:linkedin.com/in/')}",
+            "query": f"{name} site:linkedin.com/in/",
             "direct_search": f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(name)}",
             "verification_needed": True
         },
         {
             "name": "Twitter/X",
-            "search_url": f"https://www.google.com/search?q={quote_plus(name + ' site:twitter.com OR site:x.com')}",
+            "query": f"{name} site:twitter.com OR site:x.com",
             "direct_search": f"https://twitter.com/search?q={quote_plus(name)}&src=typed_query&f=user",
             "verification_needed": True
         },
         {
             "name": "Facebook",
-            "search_url": f"https://www.google.com/search?q={quote_plus(name + ' site:facebook.com')}",
+            "query": f"{name} site:facebook.com",
             "direct_search": f"https://www.facebook.com/search/people/?q={quote_plus(name)}",
             "verification_needed": True
         },
         {
             "name": "Instagram",
-            "search_url": f"https://www.google.com/search?q={quote_plus(name + ' site:instagram.com')}",
+            "query": f"{name} site:instagram.com",
             "direct_search": f"https://www.instagram.com/web/search/topsearch/?query={quote_plus(name)}",
             "verification_needed": True
         },
         {
             "name": "GitHub",
-            "search_url": f"https://www.google.com/search?q={quote_plus(name + ' site:github.com')}",
+            "query": f"{name} site:github.com",
             "direct_search": f"https://github.com/search?q={quote_plus(name)}&type=users",
             "verification_needed": False  # GitHub search is more reliable
         },
         {
             "name": "YouTube",
-            "search_url": f"https://www.google.com/search?q={quote_plus(name + ' site:youtube.com/channel OR site:youtube.com/c')}",
+            "query": f"{name} site:youtube.com/channel OR site:youtube.com/c",
             "direct_search": f"https://www.youtube.com/results?search_query={quote_plus(name)}&sp=EgIQAg%253D%253D",
             "verification_needed": False
         }
     ]
     
+    # Not planned: other modules' results for an equivalent query never reach this
+    # check, and an identical search URL is served from the page memo anyway
     for platform in platforms[:max_results]:
         try:
             headers = {
@@ -1795,10 +1677,11 @@ def search_specific_platforms_accurately(name, max_results=6):
             }
             
             # Try Google search first to see if there are any results
-            response = requests.get(platform["search_url"], headers=headers, timeout=12)
+            search_url = f"https://www.google.com/search?q={quote_plus(platform['query'])}"
+            response = http_client.get(search_url, headers=headers, timeout=12)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = http_client.parse_response(response)
                 
                 # Check if Google found any results
                 no_results_indicators = [
@@ -1808,7 +1691,7 @@ def search_specific_platforms_accurately(name, max_results=6):
                     'Make sure all words are spelled correctly'
                 ]
                 
-                page_text = soup.get_text()
+                page_text = http_client.response_text(response)
                 has_results = not any(indicator in page_text for indicator in no_results_indicators)
                 
                 if has_results:
@@ -1859,10 +1742,10 @@ def search_specific_platforms_accurately(name, max_results=6):
                         "link": platform["direct_search"]
                     })
             
-            time.sleep(0.5)  # Rate limiting
+            http_client.pause(0.5)  # Rate limiting
                 
         except Exception as e:
-            print(f"Accurate search error for {platform['name']}: {e}")
+            logger.error("Accurate search error for %s: %s", platform['name'], e)
             # Provide fallback search option
             results.append({
                 "source": f"{platform['name']} Search",
@@ -1888,8 +1771,8 @@ def search_professional_networks(name, max_results=3):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = http_client.get(url, headers=headers, timeout=10)
+        soup = http_client.parse_response(response)
         
         linkedin_results = soup.find_all('div', class_='g')[:max_results]
         for result in linkedin_results:
@@ -1904,10 +1787,12 @@ def search_professional_networks(name, max_results=3):
                 })
                 
     except Exception as e:
-        print(f"Professional network search error: {e}")
+        logger.error("Professional network search error: %s", e)
     
     return results
 
+@traced
+@with_search_context
 def search_identity(image_path=None, name=None, use_enhanced=False):
     """
     Main identity search function
@@ -1920,118 +1805,86 @@ def search_identity(image_path=None, name=None, use_enhanced=False):
     
     # NEW: Option to use enhanced comprehensive search
     if use_enhanced and name and ENHANCED_MODULES_AVAILABLE:
-        print("🚀 Using ENHANCED comprehensive search (includes activities and advanced Google)")
+        logger.info("Using ENHANCED comprehensive search (includes activities and advanced Google)")
         return search_identity_enhanced_comprehensive(name=name, image_path=image_path)
     
     results = []
 
-    # If image given → extract embedding
-    if image_path:
-        # Preprocess image to improve face detection
-        preprocess_success = preprocess_image_for_face_detection(image_path)
-        if not preprocess_success:
-            return [{"source": "Error", "preview": "Failed to preprocess image. Please ensure it's a valid image file.", "score": 0}]
-        
-        try:
-            # Try with strict face detection first
-            embedding = DeepFace.represent(img_path=image_path, model_name="Facenet", enforce_detection=True)[0]["embedding"]
-        except Exception as strict_error:
-            try:
-                # If strict detection fails, try with relaxed detection
-                print(f"Strict face detection failed, trying relaxed detection: {strict_error}")
-                embedding = DeepFace.represent(img_path=image_path, model_name="Facenet", enforce_detection=False)[0]["embedding"]
-                print("Face detected with relaxed settings")
-            except Exception as e:
-                print(f"Error processing image even with relaxed detection: {e}")
-                return [{"source": "Error", "preview": f"No face detected in the image. Please ensure the image contains a clear, visible human face. Error: {str(e)}", "score": 0}]
-    else:
-        embedding = None
+    # Face facts are computed lazily: nothing below needs the Facenet embedding
+    # yet, so only the cheap face-presence check runs
+    face = FaceAnalysis(image_path) if image_path else None
+    if face is not None and not face.is_readable():
+        return [{"source": "Error", "preview": "Failed to preprocess image. Please ensure it's a valid image file.", "score": 0}]
+    has_face = face is not None and face.face_present()
 
     # Real web scraping for 100% accurate mentions
     if name:
-        print(f"Starting REAL web scraping for: {name}")
+        logger.info("Starting REAL web scraping for: %s", name)
         
         # STEP 1: Scrape Google for actual mentions in public content
-        print("🔍 Scraping Google for real mentions...")
+        logger.info("Scraping Google for real mentions...")
         google_mentions = extract_actual_web_content(name, max_results=20)
         results.extend(google_mentions)
         
         # STEP 2: Try direct social media scraping for public content  
-        print("📱 Scraping social media for public mentions...")
+        logger.info("Scraping social media for public mentions...")
         social_mentions = scrape_social_media_directly(name, max_results=10)
         results.extend(social_mentions)
         
         # STEP 3: Add verified direct search links as backup
-        print("🎯 Adding verified direct search links...")
+        logger.info("Adding verified direct search links...")
         platform_results = create_accurate_platform_searches(name)
         results.extend(platform_results[:12])  # More platforms for comprehensive coverage
         
         # STEP 4: Add academic and professional searches
-        print("🎓 Searching academic sources...")
+        logger.info("Searching academic sources...")
         try:
             academic_results = create_accurate_academic_searches(name)
             results.extend(academic_results[:6])  # More academic sources
         except Exception as e:
-            print(f"Academic search failed: {e}")
-        
-        # STEP 5: Verify content for top results
-        print("✅ Verifying content accuracy...")
-        verified_results = []
-        for result in results:
-            if result.get("verified_content") or result.get("verified_working"):
-                verified_results.append(result)
-            elif result.get("link") and len(verified_results) < 30:  # More verification calls for better accuracy
-                try:
-                    verification = verify_content_mentions(name, result["link"])
-                    if verification["found"]:
-                        result["verified_content"] = True
-                        result["context"] = verification["context"]
-                        result["score"] = min(0.95, result["score"] + 0.1)
-                        verified_results.append(result)
-                    else:
-                        # Still add but with lower score
-                        result["score"] = max(0.3, result["score"] - 0.2)
-                        verified_results.append(result)
-                except:
-                    verified_results.append(result)
-            else:
-                verified_results.append(result)
+            logger.warning("Academic search failed: %s", e)
         
-        results = verified_results
+        # STEP 5: Verify content, best-scored first, concurrently and within a time budget
+        logger.info("Verifying content accuracy...")
+        verify_results_concurrently(name, results)
         
         # Sort by score and relevance
         results.sort(key=lambda x: x.get('score', 0), reverse=True)
         
-        print(f"🎯 Final results: {len(results)} verified mentions and searches")
+        logger.info("Final results: %s verified mentions and searches", len(results))
         
-        # Boost scores if we have face embedding data
-        if embedding is not None:
-            print(f"👤 Face embedding available ({len(embedding)} dimensions) - boosting verified mentions")
+        # Boost scores if the uploaded image shows a face
+        if has_face:
+            logger.info("Face present in uploaded image - boosting verified mentions")
             for result in results:
                 if result.get("verified_content") and "social_media" in result.get("search_type", ""):
                     result["score"] = min(0.98, result["score"] + 0.05)
         
         # Ensure we have results
         if not results:
-            print("⚠️ No mentions found, adding manual search options")
+            logger.warning("No mentions found, adding manual search options")
             results = create_accurate_platform_searches(name)[:10]  # More manual search options
         
-        # If we have face embedding, we could potentially match against profile pictures
-        # This would require downloading and analyzing profile images (advanced feature)
-        if embedding is not None:
-            print(f"Face embedding extracted with {len(embedding)} dimensions")
-            # TODO: Implement face matching against found profile pictures
+        # Matching against found profile pictures would be the first stage to
+        # need face.embedding() (TODO); for now a detected face is a flat boost
+        if has_face:
             for result in results:
                 if result["score"] > 0:
                     result["score"] += 0.1  # Slight boost for having face data
     else:
         # If only image provided without name, we can't do text-based search
-        if embedding is not None:
+        if has_face:
             results.append({
                 "source": "Face Detection",
-                "preview": f"Face detected successfully. Face embedding extracted with {len(embedding)} dimensions. Please provide a name to search across platforms.",
+                "preview": "Face detected successfully. Please provide a name to search across platforms.",
                 "score": 0.6
             })
+        elif face is not None:
+            results.append({
+                "source": "Face Detection",
+                "preview": "No face detected in the image. Please ensure the image contains a clear, visible human face, or provide a name to search across platforms.",
+                "score": 0
+            })
         else:
             results.append({
                 "source": "No Search Parameters",
@@ -2055,7 +1908,7 @@ def scrape_youtube_content(name):
     results = []
     
     try:
-        print(f"Scraping YouTube for: {name}")
+        logger.info("Scraping YouTube for: %s", name)
         
         # YouTube search methods
         search_urls = [
@@ -2071,22 +1924,22 @@ def scrape_youtube_content(name):
         
         for url in search_urls:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract YouTube content
                     youtube_content = extract_youtube_content(soup, name, url)
                     results.extend(youtube_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping YouTube URL {url}: {e}")
+                logger.error("Error scraping YouTube URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"YouTube scraping error: {e}")
+        logger.error("YouTube scraping error: %s", e)
     
     return results
 
@@ -2095,14 +1948,14 @@ def extract_youtube_content(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for video titles and descriptions
         video_elements = soup.find_all(['h3', 'a'], class_=['yt-uix-tile-link', 'ytd-video-renderer'])
         
         for element in video_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 10:
+            if query.contains(element_text) and len(element_text) > 10:
                 
                 # Get video URL if available
                 video_url = ""
@@ -2121,7 +1974,7 @@ def extract_youtube_content(soup, name, source_url):
         channel_elements = soup.find_all(['a'], class_=['yt-uix-sessionlink'])
         for element in channel_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower():
+            if query.contains(element_text):
                 content.append({
                     "platform": "YouTube",
                     "content": f"Channel: {element_text}",
@@ -2131,7 +1984,7 @@ def extract_youtube_content(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting YouTube content: {e}")
+        logger.error("Error extracting YouTube content: %s", e)
     
     return content
 
@@ -2140,7 +1993,7 @@ def scrape_tiktok_content(name):
     results = []
     
     try:
-        print(f"Scraping TikTok for: {name}")
+        logger.info("Scraping TikTok for: %s", name)
         
         # TikTok search methods (using alternative viewers)
         search_urls = [
@@ -2156,22 +2009,22 @@ def scrape_tiktok_content(name):
         
         for url in search_urls:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract TikTok content
                     tiktok_content = extract_tiktok_content(soup, name, url)
                     results.extend(tiktok_content)
                     
-                time.sleep(4)
+                http_client.pause(4)
                 
             except Exception as e:
-                print(f"Error scraping TikTok URL {url}: {e}")
+                logger.error("Error scraping TikTok URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"TikTok scraping error: {e}")
+        logger.error("TikTok scraping error: %s", e)
     
     return results
 
@@ -2180,14 +2033,14 @@ def extract_tiktok_content(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for TikTok video descriptions and user info
         video_elements = soup.find_all(['div', 'span'], class_=['video-card', 'user-card', 'description'])
         
         for element in video_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 15:
+            if query.contains(element_text) and len(element_text) > 15:
                 content.append({
                     "platform": "TikTok",
                     "content": element_text[:300],
@@ -2197,7 +2050,7 @@ def extract_tiktok_content(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting TikTok content: {e}")
+        logger.error("Error extracting TikTok content: %s", e)
     
     return content
 
@@ -2206,7 +2059,7 @@ def scrape_news_websites(name):
     results = []
     
     try:
-        print(f"Scraping news websites for: {name}")
+        logger.info("Scraping news websites for: %s", name)
         
         # Major news sources
         news_sites = [
@@ -2228,22 +2081,22 @@ def scrape_news_websites(name):
         
         for url in news_sites:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract news content
                     news_content = extract_news_content(soup, name, url)
                     results.extend(news_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping news URL {url}: {e}")
+                logger.error("Error scraping news URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"News scraping error: {e}")
+        logger.error("News scraping error: %s", e)
     
     return results
 
@@ -2252,14 +2105,14 @@ def extract_news_content(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for news article titles and snippets
         article_elements = soup.find_all(['h3', 'h2', 'h1', 'div'], class_=['r', 'LC20lb', 'article', 'headline'])
         
         for element in article_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 20:
+            if query.contains(element_text) and len(element_text) > 20:
                 
                 # Try to get article URL
                 article_url = ""
@@ -2276,7 +2129,7 @@ def extract_news_content(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting news content: {e}")
+        logger.error("Error extracting news content: %s", e)
     
     return content
 
@@ -2285,7 +2138,7 @@ def scrape_blog_content(name):
     results = []
     
     try:
-        print(f"Scraping blogs for: {name}")
+        logger.info("Scraping blogs for: %s", name)
         
         # Blog platforms and search
         blog_searches = [
@@ -2305,22 +2158,22 @@ def scrape_blog_content(name):
         
         for url in blog_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract blog content
                     blog_content = extract_blog_content_details(soup, name, url)
                     results.extend(blog_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping blog URL {url}: {e}")
+                logger.error("Error scraping blog URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Blog scraping error: {e}")
+        logger.error("Blog scraping error: %s", e)
     
     return results
 
@@ -2329,14 +2182,14 @@ def extract_blog_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for blog post titles and content
         blog_elements = soup.find_all(['h3', 'h2', 'div'], class_=['r', 'LC20lb', 'post', 'entry'])
         
         for element in blog_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 25:
+            if query.contains(element_text) and len(element_text) > 25:
                 
                 # Determine blog platform
                 platform = "Blog"
@@ -2358,7 +2211,7 @@ def extract_blog_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting blog content: {e}")
+        logger.error("Error extracting blog content: %s", e)
     
     return content
 
@@ -2367,7 +2220,7 @@ def scrape_reddit_content(name):
     results = []
     
     try:
-        print(f"Scraping Reddit for: {name}")
+        logger.info("Scraping Reddit for: %s", name)
         
         # Reddit search methods
         reddit_searches = [
@@ -2383,22 +2236,22 @@ def scrape_reddit_content(name):
         
         for url in reddit_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract Reddit content
                     reddit_content = extract_reddit_content_details(soup, name, url)
                     results.extend(reddit_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping Reddit URL {url}: {e}")
+                logger.error("Error scraping Reddit URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Reddit scraping error: {e}")
+        logger.error("Reddit scraping error: %s", e)
     
     return results
 
@@ -2407,14 +2260,14 @@ def extract_reddit_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for Reddit posts and comments
         reddit_elements = soup.find_all(['div', 'p', 'h3'], class_=['thing', 'entry', 'title', 'usertext-body'])
         
         for element in reddit_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 20:
+            if query.contains(element_text) and len(element_text) > 20:
                 
                 # Get subreddit if possible
                 subreddit = "Unknown"
@@ -2432,7 +2285,7 @@ def extract_reddit_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting Reddit content: {e}")
+        logger.error("Error extracting Reddit content: %s", e)
     
     return content
 
@@ -2441,7 +2294,7 @@ def scrape_quora_content(name):
     results = []
     
     try:
-        print(f"Scraping Quora for: {name}")
+        logger.info("Scraping Quora for: %s", name)
         
         # Quora search methods
         quora_searches = [
@@ -2456,22 +2309,22 @@ def scrape_quora_content(name):
         
         for url in quora_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract Quora content
                     quora_content = extract_quora_content_details(soup, name, url)
                     results.extend(quora_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping Quora URL {url}: {e}")
+                logger.error("Error scraping Quora URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Quora scraping error: {e}")
+        logger.error("Quora scraping error: %s", e)
     
     return results
 
@@ -2480,14 +2333,14 @@ def extract_quora_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for Quora questions and answers
         quora_elements = soup.find_all(['div', 'span'], class_=['question', 'answer', 'content'])
         
         for element in quora_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 25:
+            if query.contains(element_text) and len(element_text) > 25:
                 content.append({
                     "platform": "Quora",
                     "content": element_text[:400],
@@ -2497,7 +2350,7 @@ def extract_quora_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting Quora content: {e}")
+        logger.error("Error extracting Quora content: %s", e)
     
     return content
 
@@ -2506,7 +2359,7 @@ def scrape_general_forums(name):
     results = []
     
     try:
-        print(f"Scraping forums for: {name}")
+        logger.info("Scraping forums for: %s", name)
         
         # General forum searches
         forum_searches = [
@@ -2523,22 +2376,22 @@ def scrape_general_forums(name):
         
         for url in forum_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract forum content
                     forum_content = extract_forum_content_details(soup, name, url)
                     results.extend(forum_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping forum URL {url}: {e}")
+                logger.error("Error scraping forum URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Forum scraping error: {e}")
+        logger.error("Forum scraping error: %s", e)
     
     return results
 
@@ -2547,14 +2400,14 @@ def extract_forum_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for forum posts and discussions
         forum_elements = soup.find_all(['div', 'p', 'h3'], class_=['post', 'thread', 'discussion', 'question-summary'])
         
         for element in forum_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 20:
+            if query.contains(element_text) and len(element_text) > 20:
                 content.append({
                     "platform": "Forum",
                     "content": element_text[:400],
@@ -2564,7 +2417,7 @@ def extract_forum_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting forum content: {e}")
+        logger.error("Error extracting forum content: %s", e)
     
     return content
 
@@ -2573,7 +2426,7 @@ def scrape_pinterest_content(name):
     results = []
     
     try:
-        print(f"Scraping Pinterest for: {name}")
+        logger.info("Scraping Pinterest for: %s", name)
         
         # Pinterest search methods
         pinterest_searches = [
@@ -2588,22 +2441,22 @@ def scrape_pinterest_content(name):
         
         for url in pinterest_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract Pinterest content
                     pinterest_content = extract_pinterest_content_details(soup, name, url)
                     results.extend(pinterest_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping Pinterest URL {url}: {e}")
+                logger.error("Error scraping Pinterest URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Pinterest scraping error: {e}")
+        logger.error("Pinterest scraping error: %s", e)
     
     return results
 
@@ -2612,14 +2465,14 @@ def extract_pinterest_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for Pinterest pins and descriptions
         pin_elements = soup.find_all(['div', 'span'], class_=['pin', 'pinDescription', 'richPinInformation'])
         
         for element in pin_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 15:
+            if query.contains(element_text) and len(element_text) > 15:
                 content.append({
                     "platform": "Pinterest",
                     "content": element_text[:300],
@@ -2629,7 +2482,7 @@ def extract_pinterest_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting Pinterest content: {e}")
+        logger.error("Error extracting Pinterest content: %s", e)
     
     return content
 
@@ -2638,7 +2491,7 @@ def scrape_image_platforms(name):
     results = []
     
     try:
-        print(f"Scraping image platforms for: {name}")
+        logger.info("Scraping image platforms for: %s", name)
         
         # Image platform searches
         image_searches = [
@@ -2655,22 +2508,22 @@ def scrape_image_platforms(name):
         
         for url in image_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract image content
                     image_content = extract_image_content_details(soup, name, url)
                     results.extend(image_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping image URL {url}: {e}")
+                logger.error("Error scraping image URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Image platform scraping error: {e}")
+        logger.error("Image platform scraping error: %s", e)
     
     return results
 
@@ -2679,14 +2532,14 @@ def extract_image_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for image titles and descriptions
         image_elements = soup.find_all(['div', 'span', 'h3'], class_=['title', 'description', 'caption'])
         
         for element in image_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 10:
+            if query.contains(element_text) and len(element_text) > 10:
                 content.append({
                     "platform": "Image Platform",
                     "content": element_text[:300],
@@ -2696,7 +2549,7 @@ def extract_image_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting image content: {e}")
+        logger.error("Error extracting image content: %s", e)
     
     return content
 
@@ -2705,7 +2558,7 @@ def scrape_business_platforms(name):
     results = []
     
     try:
-        print(f"Scraping business platforms for: {name}")
+        logger.info("Scraping business platforms for: %s", name)
         
         # Business platform searches
         business_searches = [
@@ -2723,22 +2576,22 @@ def scrape_business_platforms(name):
         
         for url in business_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract business content
                     business_content = extract_business_content_details(soup, name, url)
                     results.extend(business_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping business URL {url}: {e}")
+                logger.error("Error scraping business URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Business platform scraping error: {e}")
+        logger.error("Business platform scraping error: %s", e)
     
     return results
 
@@ -2747,14 +2600,14 @@ def extract_business_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for business profiles and mentions
         business_elements = soup.find_all(['div', 'p', 'h3'], class_=['profile', 'bio', 'executive', 'company'])
         
         for element in business_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 25:
+            if query.contains(element_text) and len(element_text) > 25:
                 content.append({
                     "platform": "Business Platform",
                     "content": element_text[:400],
@@ -2764,7 +2617,7 @@ def extract_business_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting business content: {e}")
+        logger.error("Error extracting business content: %s", e)
     
     return content
 
@@ -2773,7 +2626,7 @@ def scrape_general_web_content(name):
     results = []
     
     try:
-        print(f"Scraping general web for: {name}")
+        logger.info("Scraping general web for: %s", name)
         
         # General web searches
         web_searches = [
@@ -2791,22 +2644,22 @@ def scrape_general_web_content(name):
         
         for url in web_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract general web content
                     web_content = extract_general_web_content_details(soup, name, url)
                     results.extend(web_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping web URL {url}: {e}")
+                logger.error("Error scraping web URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"General web scraping error: {e}")
+        logger.error("General web scraping error: %s", e)
     
     return results
 
@@ -2815,14 +2668,14 @@ def extract_general_web_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for general web content
         web_elements = soup.find_all(['h3', 'div', 'p'], class_=['r', 'LC20lb', 'content', 'description'])
         
         for element in web_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 20:
+            if query.contains(element_text) and len(element_text) > 20:
                 content.append({
                     "platform": "Web",
                     "content": element_text[:400],
@@ -2832,7 +2685,7 @@ def extract_general_web_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting general web content: {e}")
+        logger.error("Error extracting general web content: %s", e)
     
     return content
 
@@ -2841,7 +2694,7 @@ def scrape_specialized_content(name):
     results = []
     
     try:
-        print(f"Scraping specialized content for: {name}")
+        logger.info("Scraping specialized content for: %s", name)
         
         # Specialized searches
         specialized_searches = [
@@ -2859,22 +2712,22 @@ def scrape_specialized_content(name):
         
         for url in specialized_searches:
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = http_client.parse_response(response)
                     
                     # Extract specialized content
                     specialized_content = extract_specialized_content_details(soup, name, url)
                     results.extend(specialized_content)
                     
-                time.sleep(3)
+                http_client.pause(3)
                 
             except Exception as e:
-                print(f"Error scraping specialized URL {url}: {e}")
+                logger.error("Error scraping specialized URL %s: %s", url, e)
                 continue
         
     except Exception as e:
-        print(f"Specialized content scraping error: {e}")
+        logger.error("Specialized content scraping error: %s", e)
     
     return results
 
@@ -2883,14 +2736,14 @@ def extract_specialized_content_details(soup, name, source_url):
     content = []
     
     try:
-        name_lower = name.lower()
+        query = NameQuery.of(name)
         
         # Look for specialized content
         specialized_elements = soup.find_all(['h3', 'div', 'p'], class_=['r', 'LC20lb', 'wiki', 'academic', 'biography'])
         
         for element in specialized_elements:
             element_text = element.get_text().strip()
-            if name_lower in element_text.lower() and len(element_text) > 25:
+            if query.contains(element_text) and len(element_text) > 25:
                 content.append({
                     "platform": "Specialized Content",
                     "content": element_text[:400],
@@ -2900,12 +2753,14 @@ def extract_specialized_content_details(soup, name, source_url):
                 })
         
     except Exception as e:
-        print(f"Error extracting specialized content: {e}")
+        logger.error("Error extracting specialized content: %s", e)
     
     return content
 
 # ==== NEW ENHANCED COMPREHENSIVE SEARCH FUNCTIONS ====
 
+@traced
+@with_search_context
 def search_identity_enhanced_comprehensive(name=None, image_path=None, include_activities=True, include_advanced_google=True):
     """
     FIXED: Enhanced comprehensive identity search that actually works
@@ -2913,7 +2768,7 @@ def search_identity_enhanced_comprehensive(name=None, image_path=None, include_a
     all_results = []
     
     try:
-        print(f"🚀 Starting enhanced comprehensive search for: {name}")
+        logger.info("Starting enhanced comprehensive search for: %s", name)
         
         # Always start with guaranteed working results
         guaranteed_results = [
@@ -2967,19 +2822,19 @@ def search_identity_enhanced_comprehensive(name=None, image_path=None, include_a
         
         # Enhanced activities scraping (FIXED VERSION)
         if include_activities:
-            print("🎯 Enhanced activities scraping (NEW - likes, comments, interactions)...")
+            logger.info("Enhanced activities scraping (NEW - likes, comments, interactions)...")
             try:
                 if ENHANCED_MODULES_AVAILABLE:
                     activity_results = enhanced_comprehensive_search(name, include_activities=True)
                     if activity_results:
                         all_results.extend(activity_results[:10])  # Limit activities
-                        print(f"✅ Found {len(activity_results)} activity results")
+                        logger.info("Found %s activity results", len(activity_results))
                     else:
-                        print("⚠️ No activity results found")
+                        logger.warning("No activity results found")
                 else:
-                    print("⚠️ Enhanced modules not available")
+                    logger.warning("Enhanced modules not available")
             except Exception as e:
-                print(f"⚠️ Enhanced activities error: {e}")
+                logger.warning("Enhanced activities error: %s", e)
         
         # Add additional platform searches
         additional_platforms = [
@@ -3025,13 +2880,13 @@ def search_identity_enhanced_comprehensive(name=None, image_path=None, include_a
         # Sort by score
         unique_results.sort(key=lambda x: x.get('score', 0), reverse=True)
         
-        print(f"✅ COMPLETE: Enhanced search found {len(unique_results)} comprehensive results for '{name}'")
-        print(f"📊 Total sources checked: Multiple platforms with guaranteed working links")
+        logger.info("COMPLETE: Enhanced search found %s comprehensive results for '%s'", len(unique_results), name)
+        logger.info("Total sources checked: Multiple platforms with guaranteed working links")
         
         return unique_results[:50]  # Return top 50 results
         
     except Exception as e:
-        print(f"❌ Enhanced comprehensive search error: {e}")
+        logger.error("Enhanced comprehensive search error: %s", e)
         # Return basic fallback results
         return [{
             "source": "Google Basic Search",
@@ -3048,7 +2903,7 @@ def search_user_activities_comprehensive(name, platforms=['instagram', 'twitter'
     FIXED: Comprehensive user activities search that actually returns results
     """
     try:
-        print(f"🎯 Starting comprehensive activities search for: {name}")
+        logger.info("Starting comprehensive activities search for: %s", name)
         
         # Create realistic activity results 
         activity_results = []
@@ -3104,13 +2959,13 @@ def search_user_activities_comprehensive(name, platforms=['instagram', 'twitter'
         ]
         activity_results.extend(additional_activities)
         
-        print(f"✅ COMPLETE: Found {len(activity_results)} activity results for '{name}'")
-        print(f"📊 Platforms analyzed: {', '.join(platforms)}")
+        logger.info("COMPLETE: Found %s activity results for '%s'", len(activity_results), name)
+        logger.info("Platforms analyzed: %s", ', '.join(platforms))
         
         return activity_results
         
     except Exception as e:
-        print(f"❌ Activities search error: {e}")
+        logger.error("Activities search error: %s", e)
         return [{
             "source": "Basic Activity Search",
             "preview": f"Search for '{name}' basic social media activities",
@@ -3123,15 +2978,7 @@ def search_user_activities_comprehensive(name, platforms=['instagram', 'twitter'
 
 def get_platform_search_url(platform, name):
     """Get direct search URL for each platform"""
-    platform_urls = {
-        'instagram': f"https://www.instagram.com/web/search/topsearch/?query={quote_plus(name)}",
-        'twitter': f"https://twitter.com/search?q={quote_plus(name)}&src=typed_query",
-        'facebook': f"https://www.facebook.com/search/people/?q={quote_plus(name)}",
-        'tiktok': f"https://www.tiktok.com/search/user?q={quote_plus(name)}",
-        'youtube': f"https://www.youtube.com/results?search_query={quote_plus(name)}",
-        'linkedin': f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(name)}"
-    }
-    return platform_urls.get(platform.lower(), f"https://www.google.com/search?q={quote_plus(name + ' ' + platform)}")
+    return platform_search_url(platform, name)
 
 def search_google_comprehensive_all_categories(name, max_results=100):
     """
@@ -3147,17 +2994,17 @@ def search_google_comprehensive_all_categories(name, max_results=100):
                 "search_type": "system_message"
             }]
         
-        print(f"🌐 Starting comprehensive Google search for: {name}")
+        logger.info("Starting comprehensive Google search for: %s", name)
         
         # Use advanced Google scraper
         scraper = AdvancedGoogleScraper()
         google_results = scraper.comprehensive_google_search(name, max_results)
         
-        print(f"✅ Found {len(google_results)} comprehensive Google results")
+        logger.info("Found %s comprehensive Google results", len(google_results))
         return google_results
         
     except Exception as e:
-        print(f"❌ Comprehensive Google search error: {e}")
+        logger.error("Comprehensive Google search error: %s", e)
         return []
 
 def process_enhanced_comprehensive_results(all_results, name, max_results=120):
@@ -3212,7 +3059,7 @@ def process_enhanced_comprehensive_results(all_results, name, max_results=120):
         return unique_results[:max_results]
         
     except Exception as e:
-        print(f"❌ Error processing enhanced results: {e}")
+        logger.error("Error processing enhanced results: %s", e)
         return all_results[:max_results]
 
 # ==== END NEW ENHANCED FUNCTIONS ====
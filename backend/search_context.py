@@ -0,0 +1,201 @@
+"""
+Per-request search context shared by nested pipelines
+
+One SearchContext is created for the outermost search call of a request and
+reached from every layer below it through a context variable, the same way
+tracing spans are. It holds what the layers used to rebuild for themselves
+(name normalization needs no slot: NameQuery.of is already a shared cache):
+
+- pooled HTTP sessions (one per header profile)
+- the fetched-page memo used by http_client.get() (PAGE_MEMO_SIZE, default 64
+  responses, upstream search/social pages only)
+- the parsed-DOM memo used by http_client.parse_response() / response_text()
+  (DOM_MEMO_SIZE, default 16 parsed pages)
+- the queries already planned by query_planner.plan_queries()
+- hosts that answered with a consent/captcha/interstitial page (blocked_hosts)
+- the request deadline (SEARCH_DEADLINE_SECONDS, default 120)
+- per-request counters, added to the trace's root span when the search ends
+
+Worker threads see the context when their task is wrapped with
+tracing.bind_context.
+"""
+
+import os
+import time
+import inspect
+import threading
+import functools
+import contextvars
+import logging
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+import requests
+
+from tracing import current_trace
+
+logger = logging.getLogger(__name__)
+
+SEARCH_DEADLINE_SECONDS = float(os.getenv("SEARCH_DEADLINE_SECONDS", "120") or 120)
+PAGE_MEMO_SIZE = int(os.getenv("PAGE_MEMO_SIZE", "64") or 64)
+DOM_MEMO_SIZE = int(os.getenv("DOM_MEMO_SIZE", "16") or 16)
+
+_current_search = contextvars.ContextVar("current_search", default=None)
+
+
+class LRUMemo:
+    """
+    Thread-safe memo holding at most maxsize entries, least recently used evicted first
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __setitem__(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SearchContext:
+    """
+    State shared by every layer of one search request
+    """
+
+    def __init__(self, name=None, deadline_seconds=SEARCH_DEADLINE_SECONDS):
+        self.name = name
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + deadline_seconds if deadline_seconds else None
+        self.pages = LRUMemo(PAGE_MEMO_SIZE)
+        self.documents = LRUMemo(DOM_MEMO_SIZE)
+        self.queries = {}
+        self.blocked_hosts = {}
+        self.stats = Counter()
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def remaining(self):
+        """
+        Seconds left before the deadline (None when there is no deadline)
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def session(self, profile="default", headers=None):
+        """
+        Pooled requests.Session for a header profile, created on first use
+        """
+        with self._lock:
+            session = self._sessions.get(profile)
+            if session is None:
+                session = requests.Session()
+                if headers:
+                    session.headers.update(headers)
+                self._sessions[profile] = session
+            return session
+
+    def record(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self.pages.clear()
+            self.documents.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
+@contextmanager
+def search_context(name=None, deadline_seconds=SEARCH_DEADLINE_SECONDS):
+    """
+    Run the enclosed block with a SearchContext; nested blocks reuse the outer one
+    """
+    context = _current_search.get()
+    if context is not None:
+        yield context
+        return
+
+    context = SearchContext(name, deadline_seconds)
+    token = _current_search.set(context)
+    try:
+        yield context
+    finally:
+        _current_search.reset(token)
+        trace = current_trace()
+        if trace is not None:
+            for key, value in context.stats.items():
+                trace.root.set_attribute(f"search.{key}", value)
+        logger.debug("Search context for %r finished in %.1fs: %s",
+                     name, time.monotonic() - context.started_at, dict(context.stats))
+        context.close()
+
+
+def with_search_context(func):
+    """
+    Decorator running func inside a SearchContext for its `name` argument
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current_search.get() is not None:
+            return func(*args, **kwargs)
+        try:
+            name = signature.bind_partial(*args, **kwargs).arguments.get("name")
+        except TypeError:
+            name = None
+        with search_context(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def current_search():
+    return _current_search.get()
+
+
+def search_session(profile, headers):
+    """
+    The current search's pooled session for this profile, or a new session outside a search
+    """
+    context = _current_search.get()
+    if context is not None:
+        return context.session(profile, headers)
+
+    session = requests.Session()
+    session.headers.update(headers)
+    return session
+
@@ -0,0 +1,64 @@
+"""
+JSON serialization and field projection for API responses
+
+Results are plain dicts, so they are serialized directly with orjson (when
+installed) instead of going through FastAPI's jsonable_encoder + json.dumps.
+"""
+
+import json
+import logging
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj):
+    """
+    Fallback for values the serializer does not handle natively
+    """
+    if hasattr(obj, 'tolist'):  # numpy arrays and scalars
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def dumps_json(content):
+    """
+    Serialize content to compact UTF-8 JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def parse_fields(fields):
+    """
+    Parse a comma-separated ?fields= value into a tuple of field names (None for all)
+    """
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+    return names or None
+
+
+def project_results(results, fields):
+    """
+    Keep only the requested fields of each result
+    """
+    names = parse_fields(fields) if isinstance(fields, str) else fields
+    if not names:
+        return results
+    return [{name: result[name] for name in names if name in result} for result in results]
@@ -0,0 +1,110 @@
+"""
+Incremental result streaming for /search-stream
+
+The search pipeline runs in a worker thread and pushes progress updates and
+freshly parsed result batches onto a queue; the response generator turns each
+queue item into an SSE or NDJSON event as soon as it arrives. A final "ranked"
+event carries the re-ranked first page (plus result_id for further pages).
+
+Results that need no network (the instant tier) are sent as the first
+"results" event, marked "tier": "instant", before the worker starts.
+"""
+
+import queue
+import threading
+import logging
+
+from serialization import dumps_json
+from result_store import result_store, DEFAULT_PAGE_SIZE
+from tracing import start_trace
+
+logger = logging.getLogger(__name__)
+
+STREAM_FORMATS = {
+    "sse": "text/event-stream",
+    "ndjson": "application/x-ndjson",
+}
+
+_DONE = object()
+
+
+def format_event(event_type, data, stream_format="sse"):
+    """
+    Encode one event as an SSE frame or an NDJSON line
+    """
+    payload = dumps_json({"type": event_type, "data": data})
+    if stream_format == "ndjson":
+        return payload + b"\n"
+    return b"data: " + payload + b"\n\n"
+
+
+def _result_key(result):
+    return result.get('link') or f"{result.get('source', '')}|{result.get('preview', '')[:100]}"
+
+
+def stream_search(search_function, stream_format="sse", page_size=DEFAULT_PAGE_SIZE, instant=None, **search_kwargs):
+    """
+    Run search_function in a worker thread and yield encoded events as results arrive
+
+    search_function must accept progress_callback and result_callback keyword
+    arguments and return the final ranked result list. instant results, if
+    given, are sent before the search starts.
+    """
+    # Only send each result once, even if several stages find the same link
+    seen = set()
+    streamed_count = 0
+
+    if instant:
+        for result in instant:
+            seen.add(_result_key(result))
+        streamed_count = len(instant)
+        yield format_event("results", {"results": instant, "streamed_count": streamed_count, "tier": "instant"}, stream_format)
+
+    events = queue.Queue()
+
+    def on_progress(progress_data):
+        events.put(("progress", progress_data))
+
+    def on_results(batch):
+        events.put(("results", batch))
+
+    def worker():
+        try:
+            with start_trace("search-stream", stream_format=stream_format):
+                final_results = search_function(
+                    progress_callback=on_progress,
+                    result_callback=on_results,
+                    **search_kwargs
+                )
+            events.put(("final", final_results or []))
+        except Exception as e:
+            logger.error("Streaming search worker error: %s", e)
+            events.put(("error", {"message": str(e)}))
+        finally:
+            events.put(_DONE)
+
+    threading.Thread(target=worker, name="search-stream", daemon=True).start()
+
+    while True:
+        item = events.get()
+        if item is _DONE:
+            break
+
+        event_type, data = item
+        if event_type == "results":
+            fresh = []
+            for result in data:
+                key = _result_key(result)
+                if key not in seen:
+                    seen.add(key)
+                    fresh.append(result)
+            if fresh:
+                streamed_count += len(fresh)
+                yield format_event("results", {"results": fresh, "streamed_count": streamed_count}, stream_format)
+        elif event_type == "final":
+            result_id = result_store.save(data)
+            yield format_event("ranked", result_store.get_page(result_id, limit=page_size), stream_format)
+        else:
+            yield format_event(event_type, data, stream_format)
+
+    yield format_event("complete", {"streamed_count": streamed_count}, stream_format)
@@ -0,0 +1,55 @@
+"""
+Precompiled patterns for timestamp and engagement extraction
+
+Each extractor expects text that has already been lowercased once by the caller.
+Engagement counts come from a single scan with a combined alternation pattern;
+timestamps keep the original priority of their pattern list.
+"""
+
+import re
+
+# Tried in order: a relative age wins over a date that appears earlier in the text
+TIMESTAMP_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\d{1,2}\s+(?:hour|minute|day|week|month|year)s?\s+ago',
+    r'yesterday|today',
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
+    r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2}',
+))
+
+ENGAGEMENT_PATTERN = re.compile(
+    r'(?P<count>\d+(?:,\d+)*)\s*(?:'
+    r'(?P<likes>likes?|hearts?|thumbs)'
+    r'|(?P<comments>comments?|replies?)'
+    r'|(?P<shares>shares?|reposts?|retweets?)'
+    r'|(?P<views>views?|watched?)'
+    r')'
+)
+
+ENGAGEMENT_METRICS = ('likes', 'comments', 'shares', 'views')
+
+
+def extract_timestamp(text_lower):
+    """
+    Return the first match of the first timestamp pattern that matches, or None
+    """
+    for pattern in TIMESTAMP_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            return match.group()
+    return None
+
+
+def extract_engagement(text_lower):
+    """
+    Return the first count found for each engagement metric, or None
+    """
+    engagement_data = {}
+
+    for match in ENGAGEMENT_PATTERN.finditer(text_lower):
+        metric = match.lastgroup
+        if metric not in engagement_data:
+            engagement_data[metric] = match.group('count')
+            if len(engagement_data) == len(ENGAGEMENT_METRICS):
+                break
+
+    return engagement_data if engagement_data else None
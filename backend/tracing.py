@@ -0,0 +1,240 @@
+"""
+Request-scoped tracing spans
+
+Each search runs inside a trace; stage functions, outbound fetches and HTML
+parses open spans on it through a context variable. Finished traces can be
+exported as OpenTelemetry-style span records (one JSON object per line) to the
+console or a local file:
+
+    TRACE_EXPORTER=console|file|none   (default none)
+    TRACE_FILE=traces.jsonl            (for the file exporter)
+
+Spans are recorded even without an exporter so /search?debug_timing=1 can
+return a timing breakdown; outside a trace, span() is a no-op.
+"""
+
+import os
+import sys
+import json
+import time
+import secrets
+import threading
+import functools
+import contextvars
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "none").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")
+
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    One timed operation within a trace
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id", "attributes",
+                 "start_time_ns", "end_time_ns", "status", "thread")
+
+    def __init__(self, name, trace_id, parent_span_id=None, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self.status = "OK"
+        self.thread = threading.current_thread().name
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self):
+        end = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return (end - self.start_time_ns) / 1e6
+
+    def to_dict(self):
+        """
+        OpenTelemetry-style span record
+        """
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "attributes": self.attributes,
+            "status": {"code": self.status},
+            "thread": self.thread,
+        }
+
+
+class Trace:
+    """
+    All spans recorded for one request
+    """
+
+    def __init__(self, name, attributes=None):
+        self.trace_id = secrets.token_hex(16)
+        self.spans = []
+        self._lock = threading.Lock()
+        self.root = Span(name, self.trace_id, attributes=attributes)
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def timing_summary(self, limit=15):
+        """
+        Compact breakdown: total time, per-span-name totals and the slowest spans
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        by_name = {}
+        for span in spans:
+            entry = by_name.setdefault(span.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += span.duration_ms
+            entry["max_ms"] = max(entry["max_ms"], span.duration_ms)
+
+        for entry in by_name.values():
+            entry["total_ms"] = round(entry["total_ms"], 1)
+            entry["max_ms"] = round(entry["max_ms"], 1)
+
+        slowest = sorted(spans, key=lambda span: span.duration_ms, reverse=True)[:limit]
+        return {
+            "trace_id": self.trace_id,
+            "total_ms": round(self.root.duration_ms, 1),
+            "spans": dict(sorted(by_name.items(), key=lambda item: item[1]["total_ms"], reverse=True)),
+            "slowest": [
+                {"name": span.name, "ms": round(span.duration_ms, 1), **span.attributes}
+                for span in slowest
+            ],
+        }
+
+
+class _ConsoleExporter:
+    def export(self, records):
+        for record in records:
+            sys.stdout.write(json.dumps(record, default=str) + "\n")
+        sys.stdout.flush()
+
+
+class _FileExporter:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, records):
+        lines = "".join(json.dumps(record, default=str) + "\n" for record in records)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as trace_file:
+                trace_file.write(lines)
+
+
+def _create_exporter():
+    if TRACE_EXPORTER == "console":
+        return _ConsoleExporter()
+    if TRACE_EXPORTER == "file":
+        return _FileExporter(TRACE_FILE)
+    return None
+
+
+_exporter = _create_exporter()
+
+
+@contextmanager
+def start_trace(name, **attributes):
+    """
+    Run the enclosed block as a new trace and export it when the block exits
+    """
+    trace = Trace(name, attributes)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except Exception:
+        trace.root.status = "ERROR"
+        raise
+    finally:
+        trace.root.end_time_ns = time.time_ns()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        if _exporter is not None:
+            try:
+                _exporter.export([trace.root.to_dict()] + [span.to_dict() for span in trace.spans])
+            except Exception as e:
+                logger.error("Trace export failed: %s", e)
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Record the enclosed block as a child span of the current span
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(name, trace.trace_id, parent.span_id if parent else None, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.status = "ERROR"
+        current.attributes["error"] = str(e)
+        raise
+    finally:
+        current.end_time_ns = time.time_ns()
+        _current_span.reset(token)
+        trace.add(current)
+
+
+def traced(function=None, name=None):
+    """
+    Decorator wrapping every call of a function in a span
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    if function is not None:
+        return decorator(function)
+    return decorator
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+def bind_context(func):
+    """
+    Bind func to the caller's trace context so spans from another thread attach to it
+
+    Wrap once per submitted task: a copied context cannot be entered by two
+    threads at the same time.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.run(func, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,46 @@
+"""
+The upstream sites the scrapers query directly
+
+Verification and content scraping also fetch arbitrary result pages, so the
+set of hosts a process talks to is unbounded. Anything keyed by host for the
+life of the process (metric labels, circuit breakers) is limited to these
+domains and their subdomains; every other host is reported as OTHER_HOST.
+"""
+
+SEARCH_ENGINE_DOMAINS = frozenset({
+    "google.com", "bing.com", "duckduckgo.com", "yandex.com",
+})
+
+SOCIAL_DOMAINS = frozenset({
+    "instagram.com", "twitter.com", "x.com", "facebook.com", "linkedin.com",
+    "tiktok.com", "youtube.com", "github.com", "reddit.com", "pinterest.com",
+    "quora.com", "researchgate.net", "orcid.org", "academia.edu",
+})
+
+# Third-party viewers the scrapers fall back on for social profiles
+MIRROR_DOMAINS = frozenset({
+    "picuki.com", "imginn.com", "nitter.net", "tikwm.com", "snaptik.app",
+})
+
+UPSTREAM_DOMAINS = SEARCH_ENGINE_DOMAINS | SOCIAL_DOMAINS | MIRROR_DOMAINS
+
+OTHER_HOST = "other"
+
+
+def upstream_domain(host, domains=UPSTREAM_DOMAINS):
+    """
+    The domain in domains that host is, or is a subdomain of, or None
+    """
+    parts = (host or "").lower().rstrip(".").split(".")
+    for index in range(len(parts) - 1):
+        candidate = ".".join(parts[index:])
+        if candidate in domains:
+            return candidate
+    return None
+
+
+def host_label(host):
+    """
+    host for known upstream hosts, OTHER_HOST for everything else
+    """
+    return host if upstream_domain(host) is not None else OTHER_HOST
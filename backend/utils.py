@@ -1,8 +1,11 @@
 import numpy as np
 import os
+import logging
 from PIL import Image
 import cv2
 
+logger = logging.getLogger(__name__)
+
 def cosine_similarity(vec1, vec2):
     return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
 
@@ -43,5 +46,5 @@ def preprocess_image_for_face_detection(image_path):
         
         return True
     except Exception as e:
-        print(f"Error preprocessing image: {e}")
+        logger.error("Error preprocessing image: %s", e)
         return False
@@ -61,17 +61,24 @@ export default function Home() {
       }
       
       setResultsData({ 
-        totalResults: body.total_results || body.results?.length || 0,
+        totalResults: body.total_results || (body.results || []).length,
         searchComplete: true
       })
       
-      const results = body.results || []
-      const totalResults = body.total_results || results.length || 0
+      // Only the first page is kept client-side; further pages are fetched
+      // from the server-side result set by ID
+      const firstPage = {
+        resultId: body.result_id,
+        results: body.results || [],
+        nextCursor: body.next_cursor || null,
+        totalResults: body.total_results || (body.results || []).length,
+        summary: body.summary || null
+      }
       
-      sessionStorage.setItem('searchResults', JSON.stringify(results))
-      sessionStorage.setItem('totalResults', String(totalResults))
-      localStorage.setItem('lastSearchResults', JSON.stringify(results))
-      localStorage.setItem('lastTotalResults', String(totalResults))
+      sessionStorage.setItem('searchResultSet', JSON.stringify(firstPage))
+      sessionStorage.removeItem('searchResults')
+      localStorage.removeItem('lastSearchResults')
+      localStorage.removeItem('lastTotalResults')
       
       setTimeout(() => {
         setLoading(false)
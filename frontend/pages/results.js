@@ -4,92 +4,74 @@ import { useEffect, useState } from 'react'
 
 export default function Results() {
   const router = useRouter()
-  const [results, setResults] = useState([])
+  const [resultSet, setResultSet] = useState(null)
+  const [pages, setPages] = useState({})
   const [loading, setLoading] = useState(true)
   const [currentPage, setCurrentPage] = useState(1)
   const [resultsPerPage] = useState(25) // Show 25 results per page
 
-  // Pagination logic
+  // Pagination logic (pages are fetched from the server-side result set)
+  const totalResults = resultSet?.totalResults || 0
+  const summary = resultSet?.summary || {}
+  const platformCounts = Object.entries(summary.platforms || {})
   const indexOfLastResult = currentPage * resultsPerPage
   const indexOfFirstResult = indexOfLastResult - resultsPerPage
-  const currentResults = results.slice(indexOfFirstResult, indexOfLastResult)
-  const totalPages = Math.ceil(results.length / resultsPerPage)
+  const currentResults = pages[currentPage] || []
+  const totalPages = Math.ceil(totalResults / resultsPerPage)
+
+  const fetchPage = async (pageNum) => {
+    if (pages[pageNum] || !resultSet?.resultId) return
+    setLoading(true)
+    try {
+      const cursor = (pageNum - 1) * resultsPerPage
+      const res = await fetch(`http://127.0.0.1:8001/results/${resultSet.resultId}?cursor=${cursor}&limit=${resultsPerPage}`)
+      if (res.status === 404) {
+        // Result set expired on the server - start over
+        sessionStorage.removeItem('searchResultSet')
+        router.push('/')
+        return
+      }
+      if (!res.ok) throw new Error(`Server error (${res.status})`)
+      const body = await res.json()
+      setPages(prev => ({ ...prev, [pageNum]: body.results || [] }))
+    } catch (e) {
+      console.error('Error loading results page:', e)
+    } finally {
+      setLoading(false)
+    }
+  }
 
   // Scroll to top when page changes
   const handlePageChange = (pageNum) => {
     setCurrentPage(pageNum)
+    fetchPage(pageNum)
     window.scrollTo({ top: 0, behavior: 'smooth' })
   }
 
   useEffect(() => {
     if (!router.isReady) return
     try {
-      // Get results from sessionStorage instead of URL query
-      let storedResults = sessionStorage.getItem('searchResults')
-      let storedTotalCount = sessionStorage.getItem('totalResults')
-      
-      if (!storedResults) {
-        storedResults = localStorage.getItem('lastSearchResults')
-        storedTotalCount = localStorage.getItem('lastTotalResults')
-      }
-      
-      if (!storedResults) {
-        const q = router.query.results
-        const parsed = q ? JSON.parse(q) : []
-        setResults(parsed)
-        setLoading(false)
+      // The search page only stores the result set ID and its first page
+      const stored = sessionStorage.getItem('searchResultSet')
+      const parsed = stored ? JSON.parse(stored) : null
+
+      if (!parsed) {
+        setResultSet(null)
+        setPages({})
         return
       }
-      
-      const parsed = storedResults ? JSON.parse(storedResults) : []
-      const totalCount = storedTotalCount ? parseInt(storedTotalCount) : 0
-      
-      console.log('🔍 Results page: storedResults raw:', storedResults)
-      console.log('🔍 Results page: parsed results:', parsed)
-      console.log('🔍 Results page: Results received:', parsed.length, 'results')
-      console.log('📊 Results page: Total results from backend:', totalCount)
-      console.log('📋 Results page: Results data sample:', parsed.slice(0, 3))
-      
-      // Force set results even if empty array
-      setResults(parsed)
-      
-      // Don't clear storage - keep it for potential navigation back
-      // sessionStorage.removeItem('searchResults')
-      // sessionStorage.removeItem('totalResults')
-      // localStorage.removeItem('lastSearchResults')
-      // localStorage.removeItem('lastTotalResults')
-      
-      if (totalCount > 0) {
-        console.log(`Total results found: ${totalCount}`)
-      }
-      
-      // Debug: Force some test results if we have zero results but should have some
-      if (parsed.length === 0 && totalCount > 0) {
-        console.log('🚨 ISSUE: Backend said we have results but frontend received none!')
-        console.log('� StoredResults raw string:', storedResults)
-        console.log('🚨 TotalCount:', totalCount)
-        console.log('�🔧 Adding fallback test results...')
-        const fallbackResults = [
-          {
-            source: "Search Results Available",
-            preview: `The backend found ${totalCount} results but there was an issue transferring them to the frontend. Please try searching again.`,
-            score: 0.8,
-            platform: "System",
-            search_type: "fallback",
-            link: "#",
-            verified_working: false
-          }
-        ]
-        setResults(fallbackResults)
-      }
-      
-      // Additional check - if we truly have no results at all
-      if (parsed.length === 0 && totalCount === 0) {
+
+      setResultSet(parsed)
+      setPages({ 1: parsed.results || [] })
+      setCurrentPage(1)
+
+      if (!parsed.totalResults) {
         console.log('ℹ️ No results found - this is expected for some searches')
       }
     } catch (e) {
       console.error('Error parsing results:', e)
-      setResults([])
+      setResultSet(null)
+      setPages({})
     } finally {
       setLoading(false)
     }
@@ -133,35 +115,35 @@ export default function Results() {
           <div className="flex flex-col sm:flex-row sm:justify-between sm:items-center mb-6 gap-3">
             <div>
               <h1 className="text-xl font-semibold text-slate-800">Search Results</h1>
-              {results.length > 0 && (
+              {totalResults > 0 && (
                 <div className="space-y-1">
                   <p className="text-sm text-slate-600">
-                    Found <span className="font-bold text-slate-700">{results.length}</span> results across <span className="font-bold text-slate-700">{[...new Set(results.map(r => r.platform))].filter(Boolean).length}</span> platforms
+                    Found <span className="font-bold text-slate-700">{totalResults}</span> results across <span className="font-bold text-slate-700">{platformCounts.length}</span> platforms
                   </p>
                   <div className="flex flex-wrap gap-1 text-xs">
-                    {[...new Set(results.map(r => r.platform))].filter(Boolean).slice(0, 8).map(platform => (
+                    {platformCounts.slice(0, 8).map(([platform, count]) => (
                       <span key={platform} className="bg-slate-100 text-slate-700 px-2 py-0.5 rounded-full font-medium border border-slate-200">
-                        {platform} ({results.filter(r => r.platform === platform).length})
+                        {platform} ({count})
                       </span>
                     ))}
-                    {[...new Set(results.map(r => r.platform))].filter(Boolean).length > 8 && (
+                    {platformCounts.length > 8 && (
                       <span className="bg-slate-50 text-slate-600 px-2 py-0.5 rounded-full font-medium border border-slate-200">
-                        +{[...new Set(results.map(r => r.platform))].filter(Boolean).length - 8} more
+                        +{platformCounts.length - 8} more
                       </span>
                     )}
                   </div>
                   <div className="flex flex-wrap gap-1 text-xs mt-1">
                     <span className="text-slate-600 font-medium">
-                      ✓ {results.filter(r => r.verified_content || r.verified_working).length} Verified
+                      ✓ {summary.verified || 0} Verified
                     </span>
                     <span className="text-slate-600 font-medium">
-                      📱 {results.filter(r => r.search_type?.includes('social')).length} Social Media
+                      📱 {summary.social || 0} Social Media
                     </span>
                     <span className="text-slate-600 font-medium">
-                      💼 {results.filter(r => r.search_type?.includes('professional')).length} Professional
+                      💼 {summary.professional || 0} Professional
                     </span>
                     <span className="text-slate-600 font-medium">
-                      🎓 {results.filter(r => r.search_type?.includes('academic')).length} Academic
+                      🎓 {summary.academic || 0} Academic
                     </span>
                   </div>
                 </div>
@@ -177,7 +159,7 @@ export default function Results() {
             <div className="h-8 w-8 animate-pulse rounded bg-slate-200" />
             <div className="w-full h-4 bg-slate-200 rounded"></div>
           </div>
-        ) : results.length === 0 ? (
+        ) : totalResults === 0 ? (
           <div className="p-8 bg-white/95 backdrop-blur-xl rounded-xl shadow-lg border border-slate-200/40 text-slate-600 text-center">
             <div className="text-4xl mb-4">🔍</div>
             <h3 className="font-semibold text-lg mb-2 text-slate-800">No results found</h3>
@@ -201,26 +183,26 @@ export default function Results() {
               
               <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mb-3">
                 <div className="text-center p-3 bg-white rounded-lg border border-slate-200/50 shadow-sm">
-                  <div className="text-2xl font-bold text-slate-700">{results.length}</div>
+                  <div className="text-2xl font-bold text-slate-700">{totalResults}</div>
                   <div className="text-xs text-slate-600">Total Results</div>
                 </div>
                 <div className="text-center p-3 bg-white rounded-lg border border-slate-200/50 shadow-sm">
-                  <div className="text-2xl font-bold text-slate-700">{[...new Set(results.map(r => r.platform))].filter(Boolean).length}</div>
+                  <div className="text-2xl font-bold text-slate-700">{platformCounts.length}</div>
                   <div className="text-xs text-slate-600">Platforms</div>
                 </div>
                 <div className="text-center p-3 bg-white rounded-lg border border-slate-200/50 shadow-sm">
-                  <div className="text-2xl font-bold text-slate-700">{results.filter(r => r.verified_content || r.verified_working).length}</div>
+                  <div className="text-2xl font-bold text-slate-700">{summary.verified || 0}</div>
                   <div className="text-xs text-slate-600">Verified</div>
                 </div>
                 <div className="text-center p-3 bg-white rounded-lg border border-slate-200/50 shadow-sm">
-                  <div className="text-2xl font-bold text-slate-700">{results.filter(r => (r.score || 0) >= 0.7).length}</div>
+                  <div className="text-2xl font-bold text-slate-700">{summary.high_quality || 0}</div>
                   <div className="text-xs text-slate-600">High Quality</div>
                 </div>
               </div>
 
-              {results.length > resultsPerPage && (
+              {totalResults > resultsPerPage && (
                 <div className="text-center text-sm text-slate-600">
-                  Showing {indexOfFirstResult + 1}-{Math.min(indexOfLastResult, results.length)} of {results.length} results
+                  Showing {indexOfFirstResult + 1}-{Math.min(indexOfLastResult, totalResults)} of {totalResults} results
                   (Page {currentPage} of {totalPages})
                 </div>
               )}
@@ -247,7 +229,7 @@ export default function Results() {
                     return (
                       <button
                         key={pageNum}
-                        onClick={() => setCurrentPage(pageNum)}
+                        onClick={() => handlePageChange(pageNum)}
                         className={`px-3 py-1 text-sm border border-slate-300 rounded-lg transition-colors duration-200 ${
                           currentPage === pageNum 
                             ? 'bg-slate-700 text-white border-slate-700' 
@@ -264,7 +246,7 @@ export default function Results() {
                 })}
                 
                 <button
-                  onClick={() => setCurrentPage(prev => Math.min(prev + 1, totalPages))}
+                  onClick={() => handlePageChange(Math.min(currentPage + 1, totalPages))}
                   disabled={currentPage === totalPages}
                   className="px-3 py-1 text-sm border border-slate-300 rounded-lg disabled:opacity-50 disabled:cursor-not-allowed hover:bg-slate-50 transition-colors duration-200"
                 >
@@ -438,7 +420,7 @@ export default function Results() {
             {totalPages > 1 && (
               <div className="flex justify-center items-center gap-2 flex-wrap mt-6">
                 <button
-                  onClick={() => setCurrentPage(prev => Math.max(prev - 1, 1))}
+                  onClick={() => handlePageChange(Math.max(currentPage - 1, 1))}
                   disabled={currentPage === 1}
                   className="px-3 py-1 text-sm border border-slate-300 rounded-lg disabled:opacity-50 disabled:cursor-not-allowed hover:bg-slate-50 transition-colors duration-200"
                 >
@@ -455,7 +437,7 @@ export default function Results() {
                     return (
                       <button
                         key={pageNum}
-                        onClick={() => setCurrentPage(pageNum)}
+                        onClick={() => handlePageChange(pageNum)}
                         className={`px-3 py-1 text-sm border border-slate-300 rounded-lg transition-colors duration-200 ${
                           currentPage === pageNum 
                             ? 'bg-slate-700 text-white border-slate-700' 
@@ -472,7 +454,7 @@ export default function Results() {
                 })}
                 
                 <button
-                  onClick={() => setCurrentPage(prev => Math.min(prev + 1, totalPages))}
+                  onClick={() => handlePageChange(Math.min(currentPage + 1, totalPages))}
                   disabled={currentPage === totalPages}
                   className="px-3 py-1 text-sm border border-slate-300 rounded-lg disabled:opacity-50 disabled:cursor-not-allowed hover:bg-slate-50 transition-colors duration-200"
                 >